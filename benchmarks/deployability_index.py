@@ -0,0 +1,87 @@
+"""Measures how long it takes to create a deployability index for a large DAG of snapshots.
+
+Each snapshot depends on up to a few randomly chosen snapshots created before it. A fraction of
+snapshots is categorized as forward-only, so that the non-deployable state propagates downstream.
+
+Usage:
+    python benchmarks/deployability_index.py --snapshots 10000 --iterations 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+import typing as t
+
+from sqlglot import parse_one
+
+from sqlmesh.core.model import SqlModel
+from sqlmesh.core.snapshot import DeployabilityIndex, Snapshot, SnapshotChangeCategory
+
+
+def make_snapshots(count: int, max_parents: int, forward_only_ratio: float) -> t.List[Snapshot]:
+    rng = random.Random(0)
+
+    def base_snapshot(change_category: SnapshotChangeCategory) -> Snapshot:
+        snapshot = Snapshot.from_node(
+            SqlModel(name="db.base", query=parse_one("SELECT 1 AS a")), nodes={}, ttl="in 1 week"
+        )
+        snapshot.categorize_as(change_category)
+        return snapshot
+
+    breaking = base_snapshot(SnapshotChangeCategory.BREAKING)
+    forward_only = base_snapshot(SnapshotChangeCategory.FORWARD_ONLY)
+
+    snapshots: t.List[Snapshot] = []
+    for i in range(count):
+        parents = rng.sample(snapshots, min(len(snapshots), rng.randint(0, max_parents)))
+        base = forward_only if rng.random() < forward_only_ratio else breaking
+        snapshots.append(
+            base.copy(
+                update={
+                    "name": f'"db"."model_{i}"',
+                    "parents": tuple(parent.snapshot_id for parent in parents),
+                }
+            )
+        )
+    return snapshots
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--snapshots", type=int, default=10000, help="The number of snapshots.")
+    parser.add_argument("--iterations", type=int, default=5, help="The number of iterations.")
+    parser.add_argument(
+        "--max-parents", type=int, default=3, help="The maximum number of parents of a snapshot."
+    )
+    parser.add_argument(
+        "--forward-only-ratio",
+        type=float,
+        default=0.001,
+        help="The fraction of snapshots that are forward-only.",
+    )
+    args = parser.parse_args()
+
+    snapshots = make_snapshots(args.snapshots, args.max_parents, args.forward_only_ratio)
+
+    durations = []
+    for _ in range(args.iterations):
+        start = time.perf_counter()
+        deployability_index = DeployabilityIndex.create(snapshots)
+        durations.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for snapshot in snapshots:
+        deployability_index.with_deployable(snapshot)
+        deployability_index.with_non_deployable(snapshot)
+    update_duration = time.perf_counter() - start
+
+    deployable = sum(deployability_index.is_deployable(s) for s in snapshots)
+    print(f"Created an index for {len(snapshots)} snapshots, {deployable} of them deployable.")
+    print(f"Mean creation: {sum(durations) / len(durations) * 1000:.1f}ms")
+    print(f"Marking every snapshot deployable and non-deployable: {update_duration * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
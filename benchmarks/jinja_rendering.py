@@ -0,0 +1,47 @@
+"""Measures how long it takes to render the queries of all models in the sushi dbt example.
+
+Each iteration renders every model for a different interval, so that cached renders can't be reused
+and the Jinja environment has to be rebuilt for every model.
+
+Usage:
+    python benchmarks/jinja_rendering.py --iterations 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import timedelta
+from pathlib import Path
+
+from sqlmesh import Context
+from sqlmesh.utils.date import to_datetime
+
+SUSHI_DBT_PATH = Path(__file__).parent.parent / "examples" / "sushi_dbt"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--iterations", type=int, default=10, help="The number of iterations.")
+    args = parser.parse_args()
+
+    context = Context(paths=SUSHI_DBT_PATH)
+    models = [model for model in context.models.values() if model.is_sql]
+
+    durations = []
+    for iteration in range(args.iterations):
+        start = to_datetime("2023-01-01") + timedelta(days=iteration)
+        iteration_start = time.perf_counter()
+        for model in models:
+            model.render_query(start=start, end=start)
+        durations.append(time.perf_counter() - iteration_start)
+
+    renders = len(models) * args.iterations
+    print(f"Rendered {len(models)} models {args.iterations} times.")
+    print(f"First iteration: {durations[0]:.3f}s")
+    print(f"Mean iteration: {sum(durations) / len(durations):.3f}s")
+    print(f"Mean render: {sum(durations) / renders * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
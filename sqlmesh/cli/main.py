@@ -31,6 +31,14 @@ def _sqlmesh_version() -> str:
         return "0.0.0"
 
 
+def _parse_num_workers(
+    ctx: click.Context, param: click.Parameter, value: str
+) -> t.Union[int, t.Literal["auto"]]:
+    if value == "auto":
+        return "auto"
+    return click.INT.convert(value, param, ctx)
+
+
 @click.group(no_args_is_help=True)
 @click.version_option(version=_sqlmesh_version(), message="%(version)s")
 @opt.paths
@@ -408,6 +416,11 @@ def plan(
     is_flag=True,
     help="Run for all missing intervals, ignoring individual cron schedules.",
 )
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Display the time, rows and bytes spent on each model after the run and record them in the local run history.",
+)
 @click.pass_context
 @error_handler
 @cli_analytics
@@ -538,6 +551,13 @@ def create_test(
     default=False,
     help="Preserve the fixture tables in the testing database, useful for debugging.",
 )
+@click.option(
+    "-n",
+    "--num-workers",
+    default="1",
+    callback=_parse_num_workers,
+    help="The number of tests to run concurrently, or 'auto' to use one worker per CPU.",
+)
 @click.argument("tests", nargs=-1)
 @click.pass_obj
 @error_handler
@@ -547,6 +567,7 @@ def test(
     k: t.List[str],
     verbose: bool,
     preserve_fixtures: bool,
+    num_workers: t.Union[int, t.Literal["auto"]],
     tests: t.List[str],
 ) -> None:
     """Run model unit tests."""
@@ -555,6 +576,7 @@ def test(
         tests=tests,
         verbose=verbose,
         preserve_fixtures=preserve_fixtures,
+        num_workers=num_workers,
     )
     if not result.wasSuccessful():
         exit(1)
@@ -717,6 +739,16 @@ def create_external_models(obj: Context) -> None:
     default=3,
     help="The number of decimal places to keep when comparing floating point columns. Default: 3",
 )
+@click.option(
+    "--sample-rate",
+    type=float,
+    help="The fraction of rows to compare, sampled deterministically by their join keys.",
+)
+@click.option(
+    "--segmented",
+    is_flag=True,
+    help="Compare checksums of key segments first and only join the rows of the segments that differ.",
+)
 @click.pass_obj
 @error_handler
 @cli_analytics
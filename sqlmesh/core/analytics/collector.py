@@ -260,6 +260,23 @@ class AnalyticsCollector:
             },
         )
 
+    def on_snapshot_evaluation_retry(self, *, engine_type: str, attempt: int, error: t.Any) -> None:
+        """Called before a snapshot evaluation that failed due to a transient error is retried.
+
+        Args:
+            engine_type: The type of the target engine.
+            attempt: The number of the retry attempt, starting from 1.
+            error: The error that caused the evaluation to fail.
+        """
+        self._add_event(
+            "SNAPSHOT_EVALUATION_RETRY",
+            {
+                "engine_type": engine_type.lower(),
+                "attempt": attempt,
+                "error": type(error).__name__,
+            },
+        )
+
     def on_migration_end(
         self,
         *,
@@ -45,6 +45,30 @@ class ConnectionConfig(abc.ABC, BaseConfig):
     concurrent_tasks: int
     register_comments: bool
     pre_ping: bool
+    connection_pool_size: t.Optional[int] = None
+    connection_pool_idle_timeout: t.Optional[float] = None
+    connection_pool_checkout_timeout: t.Optional[float] = 300.0
+    evaluation_retries: int = 1
+    retryable_errors: t.List[str] = []
+
+    @field_validator("evaluation_retries", mode="after")
+    @classmethod
+    def _validate_evaluation_retries(cls, v: int) -> int:
+        if v < 0:
+            raise ConfigError(f"The number of evaluation retries can't be negative, got {v}")
+        return v
+
+    @model_validator(mode="after")
+    @model_validator_v1_args
+    def _validate_connection_pool(cls, values: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
+        pool_size = values.get("connection_pool_size")
+        concurrent_tasks = values.get("concurrent_tasks")
+        if pool_size is not None and concurrent_tasks is not None and pool_size <= concurrent_tasks:
+            raise ConfigError(
+                f"The connection pool size must be greater than the number of concurrent tasks ({concurrent_tasks}) "
+                f"to leave room for the coordinating thread. '{pool_size}' was provided"
+            )
+        return values
 
     @property
     @abc.abstractmethod
@@ -107,6 +131,10 @@ class ConnectionConfig(abc.ABC, BaseConfig):
             cursor_init=self._cursor_init,
             register_comments=register_comments_override or self.register_comments,
             pre_ping=self.pre_ping,
+            connection_pool_size=self.connection_pool_size,
+            connection_pool_idle_timeout=self.connection_pool_idle_timeout,
+            connection_pool_checkout_timeout=self.connection_pool_checkout_timeout,
+            retryable_errors=self.retryable_errors,
             **self._extra_engine_config,
         )
 
@@ -9,6 +9,7 @@ import uuid
 from hyperscript import h
 from rich.console import Console as RichConsole
 from rich.live import Live
+from rich.markup import escape
 from rich.progress import (
     BarColumn,
     Progress,
@@ -40,6 +41,7 @@ if t.TYPE_CHECKING:
 
     from sqlmesh.core.context_diff import ContextDiff
     from sqlmesh.core.plan import Plan, PlanBuilder
+    from sqlmesh.core.run_history import SnapshotExecutionStats
     from sqlmesh.core.table_diff import RowDiff, SchemaDiff
 
     LayoutWidget = t.TypeVar("LayoutWidget", bound=t.Union[widgets.VBox, widgets.HBox])
@@ -86,6 +88,12 @@ class Console(abc.ABC):
     ) -> None:
         """Updates the snapshot evaluation progress."""
 
+    @abc.abstractmethod
+    def log_snapshot_evaluation_retry(
+        self, snapshot: Snapshot, batch_idx: int, attempt: int, error: Exception
+    ) -> None:
+        """Indicates that a snapshot batch failed due to a transient error and is being retried."""
+
     @abc.abstractmethod
     def stop_evaluation_progress(self, success: bool = True) -> None:
         """Stops the snapshot evaluation progress."""
@@ -218,6 +226,10 @@ class Console(abc.ABC):
     def show_row_diff(self, row_diff: RowDiff, show_sample: bool = True) -> None:
         """Show table summary diff."""
 
+    @abc.abstractmethod
+    def show_run_profile(self, stats: t.List[SnapshotExecutionStats]) -> None:
+        """Show the time, rows and bytes spent on each snapshot evaluated during a run."""
+
 
 class TerminalConsole(Console):
     """A rich based implementation of the console."""
@@ -340,6 +352,16 @@ class TerminalConsole(Console):
             if self.evaluation_model_progress._tasks[model_task_id].completed >= total_batches:
                 self.evaluation_model_progress.remove_task(model_task_id)
 
+    def log_snapshot_evaluation_retry(
+        self, snapshot: Snapshot, batch_idx: int, attempt: int, error: Exception
+    ) -> None:
+        """Log a retry of a snapshot batch that failed due to a transient error."""
+        if self.evaluation_progress_live:
+            total_batches = self.evaluation_model_batches[snapshot]
+            self.evaluation_progress_live.console.print(
+                f"[{batch_idx + 1}/{total_batches}] {snapshot.display_name(self.environment_naming_info, self.default_catalog)} [yellow]failed[/yellow] with a transient error, retrying (attempt {attempt}): {escape(str(error))}"
+            )
+
     def stop_evaluation_progress(self, success: bool = True) -> None:
         """Stop the snapshot evaluation progress."""
         if self.evaluation_progress_live:
@@ -1005,6 +1027,37 @@ class TerminalConsole(Console):
                 self.console.print(f"\n[b][green]{target_name} ONLY[/green] sample rows:[/b]")
                 self.console.print(row_diff.t_sample.to_string(index=False), end="\n\n")
 
+    def show_run_profile(self, stats: t.List[SnapshotExecutionStats]) -> None:
+        if not stats:
+            return
+
+        stats_per_snapshot: t.Dict[str, t.List[SnapshotExecutionStats]] = {}
+        for batch_stats in stats:
+            stats_per_snapshot.setdefault(batch_stats.snapshot_id.name, []).append(batch_stats)
+
+        def _total(values: t.Iterable[t.Optional[int]]) -> str:
+            known = [v for v in values if v is not None]
+            return f"{sum(known):,}" if known else "-"
+
+        table = Table(title="Run Profile", show_lines=False)
+        table.add_column("Model")
+        for column in ("Batches", "Queries", "Duration (s)", "Rows Affected", "Bytes Processed"):
+            table.add_column(column, justify="right")
+
+        for name, snapshot_stats in sorted(
+            stats_per_snapshot.items(), key=lambda item: -sum(s.duration_ms for s in item[1])
+        ):
+            table.add_row(
+                name,
+                str(len(snapshot_stats)),
+                str(sum(len(s.queries) for s in snapshot_stats)),
+                f"{sum(s.duration_ms for s in snapshot_stats) / 1000.0:.2f}",
+                _total(s.rows_affected for s in snapshot_stats),
+                _total(s.bytes_processed for s in snapshot_stats),
+            )
+
+        self.console.print(table)
+
     def _get_snapshot_change_category(
         self,
         snapshot: Snapshot,
@@ -1653,6 +1706,12 @@ class DatabricksMagicConsole(CaptureTerminalConsole):
             total = len(self.evaluation_batch_progress)
             print(f"Completed Loading {total_finished_loading}/{total} Models")
 
+    def log_snapshot_evaluation_retry(
+        self, snapshot: Snapshot, batch_idx: int, attempt: int, error: Exception
+    ) -> None:
+        view_name, _ = self.evaluation_batch_progress[snapshot.snapshot_id]
+        print(f"Retrying '{view_name}' after a transient error (attempt {attempt}): {error}")
+
     def stop_evaluation_progress(self, success: bool = True) -> None:
         self.evaluation_batch_progress = {}
         super().stop_evaluation_progress(success)
@@ -1754,6 +1813,13 @@ class DebuggerTerminalConsole(TerminalConsole):
     ) -> None:
         self._write(f"Evaluating {snapshot.name} | batch={batch_idx} | duration={duration_ms}ms")
 
+    def log_snapshot_evaluation_retry(
+        self, snapshot: Snapshot, batch_idx: int, attempt: int, error: Exception
+    ) -> None:
+        self._write(
+            f"Retrying {snapshot.name} | batch={batch_idx} | attempt={attempt} | error={error}"
+        )
+
     def stop_evaluation_progress(self, success: bool = True) -> None:
         self._write(f"Stopping evaluation with success={success}")
 
@@ -1843,6 +1909,10 @@ class DebuggerTerminalConsole(TerminalConsole):
     def show_row_diff(self, row_diff: RowDiff, show_sample: bool = True) -> None:
         self._write(row_diff)
 
+    def show_run_profile(self, stats: t.List[SnapshotExecutionStats]) -> None:
+        for batch_stats in stats:
+            self._write(batch_stats)
+
 
 def get_console(**kwargs: t.Any) -> TerminalConsole | DatabricksMagicConsole | NotebookMagicConsole:
     """
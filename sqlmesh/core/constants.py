@@ -47,6 +47,7 @@ EXTERNAL_MODELS = "external_models"
 SEEDS = "seeds"
 TESTS = "tests"
 CACHE = ".cache"
+RUN_HISTORY = "run_history.duckdb"
 SCHEMA_YAML = "schema.yaml"
 
 
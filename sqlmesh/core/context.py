@@ -37,6 +37,8 @@ import abc
 import collections
 import gc
 import logging
+import os
+import threading
 import time
 import traceback
 import typing as t
@@ -55,7 +57,7 @@ from sqlglot.lineage import GraphHTML
 from sqlmesh.core import analytics
 from sqlmesh.core import constants as c
 from sqlmesh.core.analytics import python_api_analytics
-from sqlmesh.core.audit import Audit, StandaloneAudit
+from sqlmesh.core.audit import Audit, AuditResult, StandaloneAudit
 from sqlmesh.core.config import CategorizerConfig, Config, load_configs
 from sqlmesh.core.config.loader import C
 from sqlmesh.core.console import Console, get_console
@@ -72,7 +74,7 @@ from sqlmesh.core.environment import Environment, EnvironmentNamingInfo
 from sqlmesh.core.loader import Loader, update_model_schemas
 from sqlmesh.core.macros import ExecutableOrMacro, macro
 from sqlmesh.core.metric import Metric, rewrite
-from sqlmesh.core.model import Model
+from sqlmesh.core.model import Model, ModelHashCache
 from sqlmesh.core.notification_target import (
     NotificationEvent,
     NotificationTarget,
@@ -80,6 +82,7 @@ from sqlmesh.core.notification_target import (
 )
 from sqlmesh.core.plan import Plan, PlanBuilder
 from sqlmesh.core.reference import ReferenceGraph
+from sqlmesh.core.run_history import RunHistory
 from sqlmesh.core.scheduler import Scheduler
 from sqlmesh.core.schema_loader import create_schema_file
 from sqlmesh.core.selector import Selector
@@ -88,6 +91,7 @@ from sqlmesh.core.snapshot import (
     Snapshot,
     SnapshotEvaluator,
     SnapshotFingerprint,
+    fingerprint_from_node,
     to_table_mapping,
 )
 from sqlmesh.core.state_sync import (
@@ -106,6 +110,7 @@ from sqlmesh.core.test import (
 )
 from sqlmesh.core.user import User
 from sqlmesh.utils import UniqueKeyDict, sys_path
+from sqlmesh.utils.concurrency import concurrent_apply_to_values
 from sqlmesh.utils.dag import DAG
 from sqlmesh.utils.date import TimeLike, now_ds, to_date
 from sqlmesh.utils.errors import (
@@ -305,6 +310,8 @@ class GenericContext(BaseContext, t.Generic[C]):
         )
         self.dag: DAG[str] = DAG()
         self._models: UniqueKeyDict[str, Model] = UniqueKeyDict("models")
+        # Models upserted in memory can't be reconciled with an incremental reload of the project files.
+        self._models_upserted = False
         self._audits: UniqueKeyDict[str, Audit] = UniqueKeyDict("audits")
         self._standalone_audits: UniqueKeyDict[str, StandaloneAudit] = UniqueKeyDict(
             "standaloneaudits"
@@ -337,6 +344,7 @@ class GenericContext(BaseContext, t.Generic[C]):
 
         self._provided_state_sync: t.Optional[StateSync] = state_sync
         self._state_sync: t.Optional[StateSync] = None
+        self._run_history: t.Optional[RunHistory] = None
 
         self._loader = (loader or self.config.loader)(**self.config.loader_kwargs)
 
@@ -372,6 +380,7 @@ class GenericContext(BaseContext, t.Generic[C]):
             self._snapshot_evaluator = SnapshotEvaluator(
                 self.engine_adapter.with_log_level(logging.INFO),
                 ddl_concurrent_tasks=self.concurrent_tasks,
+                retries=self._connection_config.evaluation_retries,
             )
         return self._snapshot_evaluator
 
@@ -408,6 +417,7 @@ class GenericContext(BaseContext, t.Generic[C]):
         model._path = path
 
         self._models.update({model.fqn: model})
+        self._models_upserted = True
         self.dag.add(model.fqn, model.depends_on)
         update_model_schemas(
             self.dag,
@@ -449,8 +459,16 @@ class GenericContext(BaseContext, t.Generic[C]):
             max_workers=self.concurrent_tasks,
             console=self.console,
             notification_target_manager=self.notification_target_manager,
+            run_history=self.run_history,
         )
 
+    @property
+    def run_history(self) -> RunHistory:
+        """Returns the local history of execution metrics collected during profiled runs."""
+        if not self._run_history:
+            self._run_history = RunHistory(self.path / c.CACHE / c.RUN_HISTORY)
+        return self._run_history
+
     @property
     def state_sync(self) -> StateSync:
         if not self._state_sync:
@@ -469,17 +487,29 @@ class GenericContext(BaseContext, t.Generic[C]):
     def refresh(self) -> None:
         """Refresh all models that have been updated."""
         if self._loader.reload_needed():
-            self.load()
+            self.load(incremental=not self._models_upserted)
 
-    def load(self, update_schemas: bool = True) -> GenericContext[C]:
-        """Load all files in the context's path."""
+    def load(self, update_schemas: bool = True, incremental: bool = False) -> GenericContext[C]:
+        """Load all files in the context's path.
+
+        Args:
+            update_schemas: Convert star projections to explicit columns.
+            incremental: Only reload the models whose files have changed since the last load, if
+                no other project files have changed.
+        """
         load_start_ts = time.perf_counter()
         with sys_path(*self.configs):
             gc.disable()
-            project = self._loader.load(self, update_schemas)
+            if incremental:
+                project = self._loader.reload(self, update_schemas)
+            else:
+                project = self._loader.load(self, update_schemas)
             self._macros = project.macros
             self._jinja_macros = project.jinja_macros
-            self._models = project.models
+            # The loader reuses its models on the next incremental reload, so they are copied to keep
+            # changes made through the context out of them.
+            self._models = UniqueKeyDict("models", project.models)
+            self._models_upserted = False
             self._metrics = project.metrics
             self._standalone_audits.clear()
             self._audits.clear()
@@ -523,6 +553,7 @@ class GenericContext(BaseContext, t.Generic[C]):
         execution_time: t.Optional[TimeLike] = None,
         skip_janitor: bool = False,
         ignore_cron: bool = False,
+        profile: bool = False,
     ) -> bool:
         """Run the entire dag through the scheduler.
 
@@ -533,6 +564,8 @@ class GenericContext(BaseContext, t.Generic[C]):
             execution_time: The date/time time reference to use for execution time. Defaults to now.
             skip_janitor: Whether to skip the janitor task.
             ignore_cron: Whether to ignore the model's cron schedule and run all available missing intervals.
+            profile: Whether to display the time, rows and bytes spent on each model after the run and store them
+                in the run history.
 
         Returns:
             True if the run was successful, False otherwise.
@@ -551,6 +584,7 @@ class GenericContext(BaseContext, t.Generic[C]):
                 execution_time=execution_time,
                 skip_janitor=skip_janitor,
                 ignore_cron=ignore_cron,
+                profile=profile,
             )
         except Exception as e:
             self.notification_target_manager.notify(
@@ -1221,6 +1255,8 @@ class GenericContext(BaseContext, t.Generic[C]):
         show: bool = True,
         show_sample: bool = True,
         decimals: int = 3,
+        sample_rate: t.Optional[float] = None,
+        segmented: bool = False,
     ) -> TableDiff:
         """Show a diff between two tables.
 
@@ -1235,6 +1271,9 @@ class GenericContext(BaseContext, t.Generic[C]):
             show: Show the table diff output in the console.
             show_sample: Show the sample dataframe in the console. Requires show=True.
             decimals: The number of decimal places to keep when comparing floating point columns.
+            sample_rate: The fraction of rows to compare, sampled deterministically by their join keys.
+            segmented: Compare checksums of key segments first and only join the rows of the
+                segments that differ.
 
         Returns:
             The TableDiff object containing schema and summary differences.
@@ -1242,13 +1281,7 @@ class GenericContext(BaseContext, t.Generic[C]):
         source_alias, target_alias = source, target
         if model_or_snapshot:
             model = self.get_model(model_or_snapshot, raise_if_missing=True)
-            source_env = self.state_reader.get_environment(source)
-            target_env = self.state_reader.get_environment(target)
-
-            if not source_env:
-                raise SQLMeshError(f"Could not find environment '{source}'")
-            if not target_env:
-                raise SQLMeshError(f"Could not find environment '{target}')")
+            source_env, target_env = self._table_diff_environments(source, target)
 
             source = next(
                 snapshot for snapshot in source_env.snapshots if snapshot.name == model.fqn
@@ -1260,9 +1293,7 @@ class GenericContext(BaseContext, t.Generic[C]):
             target_alias = target_env.name
 
             if not on:
-                for ref in model.all_references:
-                    if ref.unique:
-                        on = ref.columns
+                on = self._model_grain(model)
 
         if not on:
             raise SQLMeshError(
@@ -1280,12 +1311,130 @@ class GenericContext(BaseContext, t.Generic[C]):
             model_name=model.name if model_or_snapshot else None,
             limit=limit,
             decimals=decimals,
+            sample_rate=sample_rate,
+            segmented=segmented,
         )
         if show:
             self.console.show_schema_diff(table_diff.schema_diff())
             self.console.show_row_diff(table_diff.row_diff(), show_sample=show_sample)
         return table_diff
 
+    @python_api_analytics
+    def table_diff_models(
+        self,
+        source: str,
+        target: str,
+        models: t.Optional[t.Collection[str]] = None,
+        where: t.Optional[str | exp.Condition] = None,
+        limit: int = 20,
+        show: bool = True,
+        show_sample: bool = True,
+        decimals: int = 3,
+        sample_rate: t.Optional[float] = None,
+        segmented: bool = False,
+    ) -> t.Dict[str, TableDiff]:
+        """Show diffs between the tables of multiple models in two environments.
+
+        Tables are diffed concurrently, bounded by the number of concurrent tasks of the connection,
+        and each diff is shown as soon as it completes. Models without a grain are skipped.
+
+        Args:
+            source: The source environment.
+            target: The target environment.
+            models: The models to diff. If omitted, every model whose table differs between the
+                two environments is diffed.
+            where: An optional where statement to filter results.
+            limit: The limit of the sample dataframe.
+            show: Show the table diff output in the console.
+            show_sample: Show the sample dataframe in the console. Requires show=True.
+            decimals: The number of decimal places to keep when comparing floating point columns.
+            sample_rate: The fraction of rows to compare, sampled deterministically by their join keys.
+            segmented: Compare checksums of key segments first and only join the rows of the
+                segments that differ.
+
+        Returns:
+            A mapping from model names to the TableDiff objects of the models that were diffed.
+        """
+        source_env, target_env = self._table_diff_environments(source, target)
+        source_snapshots = {snapshot.name: snapshot for snapshot in source_env.snapshots}
+        target_snapshots = {snapshot.name: snapshot for snapshot in target_env.snapshots}
+
+        if models is None:
+            fqns = [
+                name
+                for name, snapshot in target_snapshots.items()
+                if name in source_snapshots
+                and source_snapshots[name].table_name() != snapshot.table_name()
+            ]
+        else:
+            fqns = [self.get_model(model, raise_if_missing=True).fqn for model in models]
+
+        table_diffs = {}
+        for fqn in fqns:
+            model = self.get_model(fqn)
+            if not model or fqn not in source_snapshots or fqn not in target_snapshots:
+                continue
+            on = self._model_grain(model)
+            if not on:
+                self.console.log_status_update(
+                    f"Skipping the table diff of model '{model.name}' because it has no grain."
+                )
+                continue
+            table_diffs[model.name] = TableDiff(
+                adapter=self._engine_adapter,
+                source=source_snapshots[fqn].table_name(),
+                target=target_snapshots[fqn].table_name(),
+                on=on,
+                where=where,
+                source_alias=source_env.name,
+                target_alias=target_env.name,
+                model_name=model.name,
+                limit=limit,
+                decimals=decimals,
+                sample_rate=sample_rate,
+                segmented=segmented,
+            )
+
+        console_lock = threading.Lock()
+
+        def _diff(name: str) -> bool:
+            table_diff = table_diffs[name]
+            try:
+                schema_diff = table_diff.schema_diff()
+                row_diff = table_diff.row_diff()
+            except Exception as ex:
+                self.console.log_error(f"Failed to diff the tables of model '{name}': {ex}")
+                return False
+            if show:
+                with console_lock:
+                    self.console.show_schema_diff(schema_diff)
+                    self.console.show_row_diff(row_diff, show_sample=show_sample)
+            return True
+
+        names = list(table_diffs)
+        succeeded = concurrent_apply_to_values(names, _diff, self.concurrent_tasks)
+        return {name: table_diffs[name] for name, ok in zip(names, succeeded) if ok}
+
+    def _table_diff_environments(
+        self, source: str, target: str
+    ) -> t.Tuple[Environment, Environment]:
+        source_env = self.state_reader.get_environment(source)
+        target_env = self.state_reader.get_environment(target)
+
+        if not source_env:
+            raise SQLMeshError(f"Could not find environment '{source}'")
+        if not target_env:
+            raise SQLMeshError(f"Could not find environment '{target}')")
+        return source_env, target_env
+
+    @staticmethod
+    def _model_grain(model: Model) -> t.Optional[t.List[str]]:
+        on = None
+        for ref in model.all_references:
+            if ref.unique:
+                on = ref.columns
+        return on
+
     @python_api_analytics
     def get_dag(
         self, select_models: t.Optional[t.Collection[str]] = None, **options: t.Any
@@ -1415,6 +1564,7 @@ class GenericContext(BaseContext, t.Generic[C]):
         verbose: bool = False,
         preserve_fixtures: bool = False,
         stream: t.Optional[t.TextIO] = None,
+        num_workers: t.Union[int, Literal["auto"]] = 1,
     ) -> ModelTextTestResult:
         """Discover and run model tests"""
         if verbose:
@@ -1423,6 +1573,9 @@ class GenericContext(BaseContext, t.Generic[C]):
         else:
             verbosity = 1
 
+        if num_workers == "auto":
+            num_workers = os.cpu_count() or 1
+
         if tests:
             result = run_model_tests(
                 tests=tests,
@@ -1436,6 +1589,7 @@ class GenericContext(BaseContext, t.Generic[C]):
                 stream=stream,
                 default_catalog=self.default_catalog,
                 default_catalog_dialect=self.engine_adapter.DIALECT,
+                num_workers=num_workers,
             )
         else:
             test_meta = []
@@ -1460,6 +1614,7 @@ class GenericContext(BaseContext, t.Generic[C]):
                 stream=stream,
                 default_catalog=self.default_catalog,
                 default_catalog_dialect=self.engine_adapter.DIALECT,
+                num_workers=num_workers,
             )
 
         return result
@@ -1490,16 +1645,28 @@ class GenericContext(BaseContext, t.Generic[C]):
 
         num_audits = sum(len(snapshot.audits_with_args) for snapshot in snapshots)
         self.console.log_status_update(f"Found {num_audits} audit(s).")
+
+        def _audit(snapshot: Snapshot) -> t.List[AuditResult]:
+            try:
+                return self.snapshot_evaluator.audit(
+                    snapshot=snapshot,
+                    start=start,
+                    end=end,
+                    snapshots=self.snapshots,
+                    raise_exception=False,
+                )
+            finally:
+                self.snapshot_evaluator.adapter.release()
+
+        with self.snapshot_evaluator.concurrent_context():
+            audit_results = concurrent_apply_to_values(
+                list(snapshots), _audit, self.concurrent_tasks
+            )
+
         errors = []
         skipped_count = 0
-        for snapshot in snapshots:
-            for audit_result in self.snapshot_evaluator.audit(
-                snapshot=snapshot,
-                start=start,
-                end=end,
-                snapshots=self.snapshots,
-                raise_exception=False,
-            ):
+        for snapshot_audit_results in audit_results:
+            for audit_result in snapshot_audit_results:
                 audit_id = f"{audit_result.audit.name}"
                 if audit_result.model:
                     audit_id += f" on model {audit_result.model.name}"
@@ -1631,6 +1798,7 @@ class GenericContext(BaseContext, t.Generic[C]):
         execution_time: t.Optional[TimeLike],
         skip_janitor: bool,
         ignore_cron: bool,
+        profile: bool,
     ) -> bool:
         if not skip_janitor and environment.lower() == c.PROD:
             self._run_janitor()
@@ -1683,6 +1851,7 @@ class GenericContext(BaseContext, t.Generic[C]):
                     execution_time=execution_time,
                     ignore_cron=ignore_cron,
                     circuit_breaker=_has_environment_changed,
+                    profile=profile,
                 )
                 done = True
             except CircuitBreakerError:
@@ -1766,17 +1935,21 @@ class GenericContext(BaseContext, t.Generic[C]):
     def _snapshots(
         self, models_override: t.Optional[UniqueKeyDict[str, Model]] = None
     ) -> t.Dict[str, Snapshot]:
+        local_nodes = {**(models_override or self._models), **self._standalone_audits}
+
         prod = self.state_reader.get_environment(c.PROD)
+        # Only nodes that are missing locally are taken from prod, so there's no need to fetch the rest.
         remote_snapshots = (
             {
                 snapshot.name: snapshot
-                for snapshot in self.state_reader.get_snapshots(prod.snapshots).values()
+                for snapshot in self.state_reader.get_snapshots(
+                    [s for s in prod.snapshots if s.name not in local_nodes]
+                ).values()
             }
             if prod
             else {}
         )
 
-        local_nodes = {**(models_override or self._models), **self._standalone_audits}
         nodes = local_nodes.copy()
         audits = self._audits.copy()
         projects = {config.project for config in self.configs.values()}
@@ -1789,10 +1962,33 @@ class GenericContext(BaseContext, t.Generic[C]):
                         if name not in audits:
                             audits[name] = audit
 
+        hash_cache = ModelHashCache(self.path / c.CACHE)
+
+        def _hash_nodes(nodes: t.Collection[Node]) -> t.Dict[str, t.Tuple[str, str]]:
+            return {
+                node.fqn: (
+                    hash_cache.get_or_compute(node, audits)
+                    if node.is_model
+                    else (node.data_hash, node.metadata_hash(audits))
+                )
+                for node in nodes
+            }
+
+        node_hashes = _hash_nodes(nodes.values())
+
         def _nodes_to_snapshots(nodes: t.Dict[str, Node]) -> t.Dict[str, Snapshot]:
             snapshots: t.Dict[str, Snapshot] = {}
             fingerprint_cache: t.Dict[str, SnapshotFingerprint] = {}
 
+            for node in nodes.values():
+                fingerprint_from_node(
+                    node,
+                    nodes=nodes,
+                    audits=audits,
+                    cache=fingerprint_cache,
+                    node_hashes=node_hashes,
+                )
+
             for node in nodes.values():
                 if node.fqn not in local_nodes and node.fqn in remote_snapshots:
                     ttl = remote_snapshots[node.fqn].ttl
@@ -1827,6 +2023,7 @@ class GenericContext(BaseContext, t.Generic[C]):
                 nodes[snapshot.name] = node.copy(
                     update={"stamp": f"revert to {snapshot.identifier}"}
                 )
+            node_hashes.update(_hash_nodes([nodes[s.name] for s in unrestorable_snapshots]))
             snapshots = _nodes_to_snapshots(nodes)
             stored_snapshots = self.state_reader.get_snapshots(snapshots.values())
 
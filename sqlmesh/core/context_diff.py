@@ -119,28 +119,34 @@ class ContextDiff(PydanticModel):
             if snapshot.snapshot_id not in added
             and snapshot.fingerprint != remote_snapshot_name_to_info[snapshot.name].fingerprint
         }
-        modified_local_seed_snapshot_ids = {
-            s.snapshot_id
-            for s in snapshots.values()
-            if s.is_seed and s.name in modified_snapshot_name_to_snapshot_info
-        }
-        modified_remote_snapshot_ids = {
+
+        # Only snapshots whose fingerprints differ from the environment need to be fetched. Local
+        # snapshots that match the environment have usually been loaded from the state already.
+        stored: t.Dict[SnapshotId, Snapshot] = {}
+        local_snapshot_ids_to_fetch = []
+        modified_snapshot_ids_to_hydrate = {
             s.snapshot_id for s in modified_snapshot_name_to_snapshot_info.values()
         }
+        for snapshot in snapshots.values():
+            remote_snapshot_info = remote_snapshot_name_to_info.get(snapshot.name)
+            if snapshot.name in modified_snapshot_name_to_snapshot_info:
+                if snapshot.is_seed:
+                    modified_snapshot_ids_to_hydrate.add(snapshot.snapshot_id)
+                else:
+                    local_snapshot_ids_to_fetch.append(snapshot.snapshot_id)
+            elif (
+                remote_snapshot_info
+                and snapshot.version == remote_snapshot_info.version
+                and snapshot.change_category == remote_snapshot_info.change_category
+            ):
+                stored[snapshot.snapshot_id] = snapshot
+            else:
+                local_snapshot_ids_to_fetch.append(snapshot.snapshot_id)
 
-        stored = {
-            **state_reader.get_snapshots(
-                [
-                    snapshot.snapshot_id
-                    for snapshot in snapshots.values()
-                    if snapshot.snapshot_id not in modified_local_seed_snapshot_ids
-                ]
-            ),
-            **state_reader.get_snapshots(
-                modified_remote_snapshot_ids | modified_local_seed_snapshot_ids,
-                hydrate_seeds=True,
-            ),
-        }
+        stored.update(state_reader.get_snapshots(local_snapshot_ids_to_fetch))
+        stored.update(
+            state_reader.get_snapshots(modified_snapshot_ids_to_hydrate, hydrate_seeds=True)
+        )
 
         merged_snapshots = {}
         modified_snapshots = {}
@@ -336,9 +342,16 @@ class ContextDiff(PydanticModel):
         if name not in self.modified_snapshots:
             return ""
 
-        new, old = self.modified_snapshots[name]
-        try:
-            return old.node.text_diff(new.node)
-        except SQLMeshError as e:
-            logger.warning("Failed to diff model '%s': %s", name, str(e))
-            return ""
+        if name not in self._text_diffs:
+            new, old = self.modified_snapshots[name]
+            try:
+                self._text_diffs[name] = old.node.text_diff(new.node)
+            except SQLMeshError as e:
+                logger.warning("Failed to diff model '%s': %s", name, str(e))
+                self._text_diffs[name] = ""
+        return self._text_diffs[name]
+
+    @cached_property
+    def _text_diffs(self) -> t.Dict[str, str]:
+        # Rendering both versions of a node is expensive, so text diffs are only computed on demand.
+        return {}
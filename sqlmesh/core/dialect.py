@@ -1045,10 +1045,76 @@ def normalize_mapping_schema(schema: t.Dict, dialect: DialectType) -> MappingSch
 def _unquote_schema(schema: t.Dict) -> t.Dict:
     """SQLGlot schema expects unquoted normalized keys."""
     return {
-        k.strip('"'): _unquote_schema(v) if isinstance(v, dict) else v for k, v in schema.items()
+        sys.intern(k.strip('"')): _unquote_schema(v) if isinstance(v, dict) else v
+        for k, v in schema.items()
     }
 
 
+def intern_schema(schema: t.Dict) -> t.Dict:
+    """Interns the table names, column names and type strings of a nested mapping schema.
+
+    The same column names and types appear in the schemas of many models, so interning them reduces memory
+    and lets pickle store each distinct string once.
+    """
+    return {
+        sys.intern(k): intern_schema(v) if isinstance(v, dict) else _intern_str(v)
+        for k, v in schema.items()
+    }
+
+
+def intern_data_type(
+    data_type: str | exp.DataType, dialect: t.Optional[str] = None, udt: bool = False
+) -> exp.DataType:
+    """Builds a data type and returns an instance that is shared by all equal data types of a dialect.
+
+    Projects usually use a few dozen distinct types across all of their columns, so sharing instances
+    reduces the memory used by model schemas and the size of the model cache. String types are only parsed
+    once. The returned instance must not be mutated or attached to another expression, so it has to be
+    copied before it's used to build one.
+
+    Args:
+        data_type: The data type or its string representation.
+        dialect: The dialect of the data type, which is also stored in the instance's meta.
+        udt: Whether a string type that can't be parsed should be treated as a user-defined type.
+
+    Returns:
+        The shared data type instance.
+    """
+    if isinstance(data_type, str):
+        return _parse_interned_data_type(data_type, dialect, udt)
+    if id(data_type) in _interned_data_type_ids:
+        return data_type
+    if data_type.comments or data_type.meta.keys() - {"dialect", "sql"}:
+        return data_type
+
+    # Expression equality ignores the case of identifiers, so types are keyed on their generated SQL
+    # instead. The original SQL text is used when the type is serialized, so it's a part of the key too
+    # unless it's the same as the generated one.
+    sql = data_type.sql(dialect=dialect)
+    original_sql = data_type.meta.get("sql")
+    key = (dialect, sql, None if original_sql == sql else original_sql)
+    interned = _interned_data_types.get(key)
+    if interned is None:
+        interned = data_type.copy()
+        interned.meta["dialect"] = dialect
+        interned = _interned_data_types.setdefault(key, interned)
+        _interned_data_type_ids.add(id(interned))
+    return interned
+
+
+_interned_data_types: t.Dict[t.Tuple[t.Optional[str], str, t.Optional[str]], exp.DataType] = {}
+_interned_data_type_ids: t.Set[int] = set()
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_interned_data_type(data_type: str, dialect: t.Optional[str], udt: bool) -> exp.DataType:
+    return intern_data_type(exp.DataType.build(data_type, dialect=dialect, udt=udt), dialect)
+
+
+def _intern_str(value: t.Any) -> t.Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 def _dict_to_struct(values: t.Dict) -> exp.Struct:
     expressions = []
     for key, value in values.items():
@@ -9,12 +9,16 @@ the SnapshotEvaluator delegate them to engine adapters so these components can b
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import itertools
 import logging
 import sys
+import time
 import typing as t
+from contextvars import ContextVar
 from functools import partial
+from threading import local
 
 import pandas as pd
 from sqlglot import Dialect, exp
@@ -33,6 +37,7 @@ from sqlmesh.core.engine_adapter.shared import (
     CommentCreationTable,
     CommentCreationView,
     DataObject,
+    ExecutionStats,
     InsertOverwriteStrategy,
     SourceQuery,
     set_catalog,
@@ -40,7 +45,12 @@ from sqlmesh.core.engine_adapter.shared import (
 from sqlmesh.core.model.kind import TimeColumn
 from sqlmesh.core.schema_diff import SchemaDiffer
 from sqlmesh.utils import columns_to_types_all_known, random_id
-from sqlmesh.utils.connection_pool import create_connection_pool
+from sqlmesh.utils.connection_pool import (
+    BoundedConnectionPool,
+    ConnectionPool,
+    SingletonConnectionPool,
+    create_connection_pool,
+)
 from sqlmesh.utils.date import TimeLike, make_inclusive, to_time_column
 from sqlmesh.utils.errors import SQLMeshError, UnsupportedCatalogOperationError
 from sqlmesh.utils.pandas import columns_to_types_from_df
@@ -60,6 +70,15 @@ logger = logging.getLogger(__name__)
 
 MERGE_TARGET_ALIAS = "__MERGE_TARGET__"
 MERGE_SOURCE_ALIAS = "__MERGE_SOURCE__"
+ROW_HASH_DELIMITER = "__SQLMESH_DELIM__"
+ROW_HASH_NULL = "__SQLMESH_NULL__"
+SCD_TYPE_2_LATEST_MARKER = "_sqlmesh_latest"
+
+# Stats of the statements executed in the scope of `EngineAdapter.track_execution_stats`. A context variable is
+# used instead of a thread local so that coroutines awaiting asynchronous queries are tracked separately.
+_tracked_execution_stats: ContextVar[t.Optional[t.List[ExecutionStats]]] = ContextVar(
+    "tracked_execution_stats", default=None
+)
 
 
 @set_catalog()
@@ -74,6 +93,13 @@ class EngineAdapter:
             connection on every call.
         dialect: The dialect with which this adapter is associated.
         multithreaded: Indicates whether this adapter will be used by more than one thread.
+        connection_pool_size: The maximum number of connections shared between threads. If set, a bounded
+            connection pool is used instead of opening one connection per thread. Only applies if
+            `multithreaded` is set to True.
+        connection_pool_idle_timeout: The number of seconds after which an idle connection in the bounded
+            connection pool is closed.
+        connection_pool_checkout_timeout: The maximum number of seconds to wait for a connection to become
+            available in the bounded connection pool. Waits indefinitely if not set.
     """
 
     DIALECT = ""
@@ -97,6 +123,13 @@ class EngineAdapter:
     SUPPORTS_REPLACE_TABLE = True
     DEFAULT_CATALOG_TYPE = DIALECT
     QUOTE_IDENTIFIERS_IN_VIEWS = True
+    # Fragments of error messages raised when concurrent writes to the same table conflict with each other.
+    WRITE_CONFLICT_ERROR_MESSAGES: t.Tuple[str, ...] = ()
+    # Fragments of error messages raised on transient failures, like dropped connections or engine restarts.
+    TRANSIENT_ERROR_MESSAGES: t.Tuple[str, ...] = ()
+    # Whether statements can be submitted to the engine and polled for completion by `execute_async`.
+    SUPPORTS_ASYNC_QUERIES = False
+    ASYNC_POLL_INTERVAL_SEC = 1.0
 
     def __init__(
         self,
@@ -110,18 +143,33 @@ class EngineAdapter:
         execute_log_level: int = logging.DEBUG,
         register_comments: bool = True,
         pre_ping: bool = False,
+        connection_pool_size: t.Optional[int] = None,
+        connection_pool_idle_timeout: t.Optional[float] = None,
+        connection_pool_checkout_timeout: t.Optional[float] = None,
+        retryable_errors: t.Optional[t.Collection[str]] = None,
         **kwargs: t.Any,
     ):
         self.dialect = dialect.lower() or self.DIALECT
+        self._deferred = local()
+        self._connection_factory = connection_factory
         self._connection_pool = create_connection_pool(
-            connection_factory, multithreaded, cursor_kwargs=cursor_kwargs, cursor_init=cursor_init
+            connection_factory,
+            multithreaded,
+            cursor_kwargs=cursor_kwargs,
+            cursor_init=cursor_init,
+            max_size=connection_pool_size,
+            idle_timeout=connection_pool_idle_timeout,
+            checkout_timeout=connection_pool_checkout_timeout,
+            health_check=self._ping if pre_ping else None,
         )
         self._sql_gen_kwargs = sql_gen_kwargs or {}
         self._default_catalog = default_catalog
         self._execute_log_level = execute_log_level
         self._extra_config = kwargs
         self._register_comments = register_comments
-        self._pre_ping = pre_ping
+        self._retryable_errors = set(retryable_errors or [])
+        # The bounded connection pool pings connections itself whenever they are reused.
+        self._pre_ping = pre_ping and not isinstance(self._connection_pool, BoundedConnectionPool)
 
     def with_log_level(self, level: int) -> EngineAdapter:
         adapter = self.__class__(
@@ -131,13 +179,27 @@ class EngineAdapter:
             default_catalog=self._default_catalog,
             execute_log_level=level,
             register_comments=self._register_comments,
+            retryable_errors=self._retryable_errors,
             **self._extra_config,
         )
 
         adapter._connection_pool = self._connection_pool
+        adapter._connection_factory = self._connection_factory
 
         return adapter
 
+    @property
+    def _connection_pool(self) -> ConnectionPool:
+        # Statements deferred by `deferred_statements` are executed before the connection is used for anything
+        # else, so that queries observe their effects.
+        if getattr(self._deferred, "statements", None):
+            self._execute_deferred_statements()
+        return self.__connection_pool
+
+    @_connection_pool.setter
+    def _connection_pool(self, connection_pool: ConnectionPool) -> None:
+        self.__connection_pool = connection_pool
+
     @property
     def cursor(self) -> t.Any:
         return self._connection_pool.get_cursor()
@@ -150,6 +212,25 @@ class EngineAdapter:
     def comments_enabled(self) -> bool:
         return self._register_comments and self.COMMENT_CREATION_TABLE.is_supported
 
+    @property
+    def connection_pool_size(self) -> t.Optional[int]:
+        """The maximum number of connections shared between threads, or None if it's not bounded."""
+        if isinstance(self._connection_pool, BoundedConnectionPool):
+            return self._connection_pool.max_size
+        return None
+
+    @property
+    def supports_concurrent_queries(self) -> bool:
+        """Whether queries can currently be issued from multiple threads.
+
+        This requires a multithreaded connection pool and no active transaction, since queries
+        issued from other threads run on separate connections outside of that transaction.
+        """
+        return (
+            not isinstance(self._connection_pool, SingletonConnectionPool)
+            and not self._connection_pool.is_transaction_active
+        )
+
     @classmethod
     def is_pandas_df(cls, value: t.Any) -> bool:
         return isinstance(value, pd.DataFrame)
@@ -257,6 +338,18 @@ class EngineAdapter:
         """Closes all open connections and releases all allocated resources."""
         self._connection_pool.close_all()
 
+    def reset_connection(self) -> None:
+        """Closes the connection used by the calling thread so that the next statement opens a new one.
+
+        This is used to recover from errors that may have left the connection broken.
+        """
+        self._connection_pool.close()
+
+    def release(self) -> None:
+        """Returns the connection used by the calling thread back to the connection pool so that
+        it can be reused by other threads. Has no effect while a transaction is active."""
+        self._connection_pool.release()
+
     def get_current_catalog(self) -> t.Optional[str]:
         """Returns the catalog name of the current connection."""
         raise NotImplementedError()
@@ -563,7 +656,8 @@ class EngineAdapter:
             expressions=[
                 exp.ColumnDef(
                     this=exp.to_identifier(column),
-                    kind=None if is_view else kind,  # don't include column data type for views
+                    # don't include column data type for views
+                    kind=None if is_view else kind.copy(),
                     constraints=(
                         self._build_col_comment_exp(column, column_descriptions)
                         if column_descriptions
@@ -1171,6 +1265,7 @@ class EngineAdapter:
         table_description: t.Optional[str] = None,
         column_descriptions: t.Optional[t.Dict[str, str]] = None,
         truncate: bool = False,
+        incremental_updates: bool = False,
         **kwargs: t.Any,
     ) -> None:
         self._scd_type_2(
@@ -1187,6 +1282,7 @@ class EngineAdapter:
             table_description=table_description,
             column_descriptions=column_descriptions,
             truncate=truncate,
+            incremental_updates=incremental_updates,
         )
 
     def scd_type_2_by_column(
@@ -1204,6 +1300,7 @@ class EngineAdapter:
         table_description: t.Optional[str] = None,
         column_descriptions: t.Optional[t.Dict[str, str]] = None,
         truncate: bool = False,
+        incremental_updates: bool = False,
         **kwargs: t.Any,
     ) -> None:
         self._scd_type_2(
@@ -1220,6 +1317,7 @@ class EngineAdapter:
             table_description=table_description,
             column_descriptions=column_descriptions,
             truncate=truncate,
+            incremental_updates=incremental_updates,
         )
 
     def _scd_type_2(
@@ -1239,7 +1337,14 @@ class EngineAdapter:
         table_description: t.Optional[str] = None,
         column_descriptions: t.Optional[t.Dict[str, str]] = None,
         truncate: bool = False,
+        incremental_updates: bool = False,
     ) -> None:
+        """Applies the source to an SCD Type 2 target table.
+
+        By default the whole target table is rewritten. With `incremental_updates`, only the current
+        rows of the target table (the ones where `valid_to` is NULL) are compared against the source,
+        the new row versions are appended and the rows which are no longer current are closed in place.
+        """
         source_queries, columns_to_types = self._get_source_queries_and_columns_to_types(
             source_table, columns_to_types, target_table=target_table, batch_size=0
         )
@@ -1393,6 +1498,34 @@ class EngineAdapter:
         existing_rows_query = exp.select(*table_columns).from_(target_table)
         if truncate:
             existing_rows_query = existing_rows_query.limit(0)
+        incremental_updates = incremental_updates and not truncate
+        latest_rows_query = existing_rows_query.where(valid_to_col.is_(exp.Null()))
+        deleted_rows_query = (
+            exp.select(*[exp.column(col, "static") for col in columns_to_types])
+            .from_("static")
+            .join(
+                "latest",
+                on=exp.and_(
+                    *[add_table(key, "static").eq(add_table(key, "latest")) for key in unique_key]
+                ),
+                join_type="left",
+            )
+            .where(exp.column(valid_to_col.this, "latest").is_(exp.Null()))
+        )
+        # Marks the joined rows that originate from the current rows of the target table
+        latest_marker: t.List[exp.Expression] = []
+        joined_marker: t.List[exp.Expression] = []
+        if incremental_updates:
+            latest_rows_query = latest_rows_query.select(exp.true().as_(SCD_TYPE_2_LATEST_MARKER))
+            # Only the history of keys which are present in the source is relevant
+            deleted_rows_query = deleted_rows_query.join(
+                "source",
+                on=exp.and_(
+                    *[add_table(key, "static").eq(add_table(key, "source")) for key in unique_key]
+                ),
+            )
+            latest_marker.append(exp.column(SCD_TYPE_2_LATEST_MARKER, table="latest"))
+            joined_marker.append(exp.column(SCD_TYPE_2_LATEST_MARKER, table="joined"))
 
         with source_queries[0] as source_query:
             prefixed_columns_to_types = []
@@ -1405,7 +1538,7 @@ class EngineAdapter:
                 prefixed_col = exp.column(column).copy()
                 prefixed_col.this.set("this", f"t_{prefixed_col.name}")
                 prefixed_unmanaged_columns.append(prefixed_col)
-            query = (
+            ctes = (
                 exp.Select()  # type: ignore
                 .with_(
                     "source",
@@ -1419,27 +1552,9 @@ class EngineAdapter:
                     existing_rows_query.where(valid_to_col.is_(exp.Null()).not_()),
                 )
                 # Latest Records that can be updated
-                .with_(
-                    "latest",
-                    existing_rows_query.where(valid_to_col.is_(exp.Null())),
-                )
+                .with_("latest", latest_rows_query)
                 # Deleted records which can be used to determine `valid_from` for undeleted source records
-                .with_(
-                    "deleted",
-                    exp.select(*[exp.column(col, "static") for col in columns_to_types])
-                    .from_("static")
-                    .join(
-                        "latest",
-                        on=exp.and_(
-                            *[
-                                add_table(key, "static").eq(add_table(key, "latest"))
-                                for key in unique_key
-                            ]
-                        ),
-                        join_type="left",
-                    )
-                    .where(exp.column(valid_to_col.this, "latest").is_(exp.Null())),
-                )
+                .with_("deleted", deleted_rows_query)
                 # Get the latest `valid_to` deleted record for each unique key
                 .with_(
                     "latest_deleted",
@@ -1462,6 +1577,7 @@ class EngineAdapter:
                             for i, col in enumerate(columns_to_types)
                         ),
                         *(exp.column(col, table="source").as_(col) for col in unmanaged_columns),
+                        *latest_marker,
                     )
                     .from_("latest")
                     .join(
@@ -1487,6 +1603,7 @@ class EngineAdapter:
                                 exp.column(col, table="source").as_(col)
                                 for col in unmanaged_columns
                             ),
+                            *latest_marker,
                         )
                         .from_("latest")
                         .join(
@@ -1515,6 +1632,7 @@ class EngineAdapter:
                         ),
                         valid_from_case_stmt,
                         valid_to_case_stmt,
+                        *joined_marker,
                     )
                     .from_("joined")
                     .join(
@@ -1541,7 +1659,39 @@ class EngineAdapter:
                     .from_("joined")
                     .where(updated_row_filter),
                 )
-                .select(*table_columns)
+            )
+
+            if incremental_updates:
+                latest_marker_col = exp.column(SCD_TYPE_2_LATEST_MARKER)
+                # Current rows which have been closed, followed by new rows and new versions of existing rows
+                changed_rows_query = (
+                    ctes.select(*table_columns, latest_marker_col)
+                    .from_("updated_rows")
+                    .where(
+                        exp.or_(
+                            latest_marker_col.is_(exp.Null()),
+                            valid_to_col.is_(exp.Null()).not_(),
+                        )
+                    )
+                    .union(
+                        exp.select(
+                            *table_columns,
+                            exp.cast(exp.null(), "boolean").as_(SCD_TYPE_2_LATEST_MARKER),
+                        ).from_("inserted_rows"),
+                        distinct=False,
+                    )
+                )
+                self._scd_type_2_apply_changes(
+                    target_table,
+                    changed_rows_query,
+                    unique_key=unique_key,
+                    valid_to_col=valid_to_col,
+                    columns_to_types=columns_to_types,
+                )
+                return
+
+            query = (
+                ctes.select(*table_columns)
                 .from_("static")
                 .union(
                     exp.select(*table_columns).from_("updated_rows"),
@@ -1561,6 +1711,77 @@ class EngineAdapter:
                 column_descriptions=column_descriptions,
             )
 
+    def _scd_type_2_apply_changes(
+        self,
+        target_table: TableName,
+        changed_rows_query: Query,
+        unique_key: t.Sequence[exp.Expression],
+        valid_to_col: exp.Column,
+        columns_to_types: t.Dict[str, exp.DataType],
+    ) -> None:
+        """Appends the new rows of an SCD Type 2 table and closes the rows which are no longer current.
+
+        The changed rows are staged in a temporary table in which the closed rows are marked, so that
+        only the current rows of the target table with the same key need to be touched.
+        """
+        temp_table = self._get_temp_table(target_table)
+        closed_rows_query = (
+            exp.select(*columns_to_types)
+            .from_(temp_table)
+            .where(exp.column(SCD_TYPE_2_LATEST_MARKER).is_(exp.Null()).not_())
+        )
+        new_rows_query = (
+            exp.select(*columns_to_types)
+            .from_(temp_table)
+            .where(exp.column(SCD_TYPE_2_LATEST_MARKER).is_(exp.Null()))
+        )
+        with self.transaction():
+            self.ctas(
+                temp_table,
+                changed_rows_query,
+                columns_to_types={
+                    **columns_to_types,
+                    SCD_TYPE_2_LATEST_MARKER: exp.DataType.build("boolean"),
+                },
+                exists=False,
+            )
+            self._scd_type_2_close_rows(target_table, closed_rows_query, unique_key, valid_to_col)
+            self._insert_append_query(target_table, new_rows_query, columns_to_types)
+            self.drop_table(temp_table)
+
+    def _scd_type_2_close_rows(
+        self,
+        target_table: TableName,
+        closed_rows_query: exp.Select,
+        unique_key: t.Sequence[exp.Expression],
+        valid_to_col: exp.Column,
+    ) -> None:
+        """Sets `valid_to` of the current target rows which match the keys of the closed rows."""
+        self._merge(
+            target_table=target_table,
+            query=closed_rows_query,
+            on=exp.and_(
+                *(
+                    add_table(part, MERGE_TARGET_ALIAS).eq(add_table(part, MERGE_SOURCE_ALIAS))
+                    for part in unique_key
+                ),
+                exp.column(valid_to_col.this, MERGE_TARGET_ALIAS).is_(exp.Null()),
+            ),
+            match_expressions=[
+                exp.When(
+                    matched=True,
+                    source=False,
+                    then=exp.Update(
+                        expressions=[
+                            exp.column(valid_to_col.this, MERGE_TARGET_ALIAS).eq(
+                                exp.column(valid_to_col.this, MERGE_SOURCE_ALIAS)
+                            )
+                        ],
+                    ),
+                )
+            ],
+        )
+
     def merge(
         self,
         target_table: TableName,
@@ -1568,7 +1789,20 @@ class EngineAdapter:
         columns_to_types: t.Optional[t.Dict[str, exp.DataType]],
         unique_key: t.Sequence[exp.Expression],
         when_matched: t.Optional[exp.When] = None,
+        change_detection: bool = False,
     ) -> None:
+        """Merges the source into the target table on the given unique key.
+
+        Args:
+            target_table: The name of the target table.
+            source_table: The source query or dataframe.
+            columns_to_types: A mapping between the column name and its data type.
+            unique_key: The expressions which uniquely identify a row.
+            when_matched: The action to take on rows that match the unique key. Defaults to updating
+                all columns.
+            change_detection: Whether to only write the source rows which are new or differ from the
+                target rows with the same key, as determined by comparing row hashes.
+        """
         source_queries, columns_to_types = self._get_source_queries_and_columns_to_types(
             source_table, columns_to_types, target_table=target_table
         )
@@ -1590,6 +1824,17 @@ class EngineAdapter:
                     ],
                 ),
             )
+        if change_detection:
+            when_matched = when_matched.copy()
+            when_matched.set(
+                "condition",
+                exp.and_(
+                    when_matched.args.get("condition"),
+                    self._row_hash(columns_to_types, MERGE_TARGET_ALIAS).neq(
+                        self._row_hash(columns_to_types, MERGE_SOURCE_ALIAS)
+                    ),
+                ),
+            )
         when_not_matched = exp.When(
             matched=False,
             source=False,
@@ -1609,6 +1854,22 @@ class EngineAdapter:
                     match_expressions=[when_matched, when_not_matched],
                 )
 
+    @classmethod
+    def _row_hash(cls, columns: t.Iterable[str], table: t.Optional[str] = None) -> exp.Expression:
+        """Builds a null-safe hash of the given columns which is computed by the engine."""
+        values: t.List[exp.Expression] = []
+        for column in columns:
+            if values:
+                values.append(exp.Literal.string(ROW_HASH_DELIMITER))
+            values.append(
+                exp.func(
+                    "COALESCE",
+                    exp.cast(exp.column(column, table), "text"),
+                    exp.Literal.string(ROW_HASH_NULL),
+                )
+            )
+        return exp.MD5(this=exp.Concat(expressions=values))
+
     def rename_table(
         self,
         old_table_name: TableName,
@@ -1746,7 +2007,8 @@ class EngineAdapter:
     ) -> t.Iterator[None]:
         """A transaction context manager."""
         if (
-            self._connection_pool.is_transaction_active
+            self._is_deferring_statements()
+            or self._connection_pool.is_transaction_active
             or not self.SUPPORTS_TRANSACTIONS
             or (condition is not None and not condition)
         ):
@@ -1801,22 +2063,184 @@ class EngineAdapter:
         **kwargs: t.Any,
     ) -> None:
         """Execute a sql query."""
-        to_sql_kwargs = (
-            {"unsupported_level": ErrorLevel.IGNORE} if ignore_unsupported_errors else {}
-        )
+        deferred_statements = getattr(self._deferred, "statements", None)
+        if deferred_statements is not None:
+            deferred_statements.extend(
+                self._expressions_to_sql(expressions, ignore_unsupported_errors, quote_identifiers)
+            )
+            return
 
         with self.transaction():
-            for e in ensure_list(expressions):
-                sql = t.cast(
-                    str,
-                    (
-                        self._to_sql(e, quote=quote_identifiers, **to_sql_kwargs)
-                        if isinstance(e, exp.Expression)
-                        else e
-                    ),
-                )
+            for sql in self._expressions_to_sql(
+                expressions, ignore_unsupported_errors, quote_identifiers
+            ):
                 self._log_sql(sql)
+                tracked_stats = _tracked_execution_stats.get()
+                if tracked_stats is None:
+                    self._execute(sql, **kwargs)
+                    continue
+                start = time.perf_counter()
                 self._execute(sql, **kwargs)
+                duration_ms = int((time.perf_counter() - start) * 1000)
+                tracked_stats.append(self._execution_stats(sql, duration_ms))
+
+    @contextlib.contextmanager
+    def track_execution_stats(self) -> t.Iterator[t.List[ExecutionStats]]:
+        """A context manager that collects stats of all statements executed by the current thread or asyncio
+        task in its scope.
+
+        Yields:
+            The list to which stats of executed statements are appended.
+        """
+        stats: t.List[ExecutionStats] = []
+        token = _tracked_execution_stats.set(stats)
+        try:
+            yield stats
+        finally:
+            _tracked_execution_stats.reset(token)
+
+    @contextlib.contextmanager
+    def deferred_statements(self) -> t.Iterator[t.List[str]]:
+        """A context manager that defers the execution of statements issued by the current thread in its scope.
+
+        Instead of being executed, statements passed to `execute` are collected, so that they can be executed
+        later with `execute_async`. Transactions are not started in the meantime. Whenever the connection is
+        used for anything else, like fetching the results of a query, the statements collected so far are
+        executed first.
+
+        Yields:
+            The list of statements whose execution is still pending when the scope exits.
+        """
+        if self._is_deferring_statements():
+            raise SQLMeshError("Statements are already being deferred.")
+        statements: t.List[str] = []
+        self._deferred.statements = statements
+        try:
+            yield statements
+        finally:
+            self._deferred.statements = None
+
+    async def execute_async(
+        self,
+        expressions: t.Union[str, exp.Expression, t.Sequence[exp.Expression]],
+        ignore_unsupported_errors: bool = False,
+        quote_identifiers: bool = True,
+    ) -> None:
+        """Execute sql statements without blocking the running event loop.
+
+        If the engine supports asynchronous queries, the statements are submitted to the engine as a single
+        script, which is executed in its own transaction, and the running event loop polls its completion.
+        Only short calls that submit and poll the script are made from threads of the event loop's default
+        executor. Otherwise the statements are executed with `execute` in the default executor.
+        """
+        loop = asyncio.get_running_loop()
+        if not self.SUPPORTS_ASYNC_QUERIES:
+            await loop.run_in_executor(
+                None,
+                partial(
+                    self.execute,
+                    expressions,
+                    ignore_unsupported_errors=ignore_unsupported_errors,
+                    quote_identifiers=quote_identifiers,
+                ),
+            )
+            return
+
+        sqls = list(
+            self._expressions_to_sql(expressions, ignore_unsupported_errors, quote_identifiers)
+        )
+        if not sqls:
+            return
+        for sql in sqls:
+            self._log_sql(sql)
+
+        start = time.perf_counter()
+        query = await loop.run_in_executor(None, self._submit_query, sqls)
+        succeeded = False
+        try:
+            while not await loop.run_in_executor(None, self._is_query_done, query):
+                await asyncio.sleep(self.ASYNC_POLL_INTERVAL_SEC)
+            succeeded = True
+        finally:
+            await loop.run_in_executor(None, self._end_query, query, succeeded)
+
+        tracked_stats = _tracked_execution_stats.get()
+        if tracked_stats is not None:
+            duration_ms = int((time.perf_counter() - start) * 1000)
+            tracked_stats.append(self._async_execution_stats(query, sqls, duration_ms))
+
+    def _submit_query(self, sqls: t.List[str]) -> t.Any:
+        """Submits statements to the engine as a single script without waiting for it to complete.
+
+        Args:
+            sqls: The SQL statements to submit.
+
+        Returns:
+            An engine-specific handle of the submitted script.
+        """
+        raise NotImplementedError(f"Engine does not support asynchronous queries: {type(self)}")
+
+    def _is_query_done(self, query: t.Any) -> bool:
+        """Checks whether a submitted script has completed without waiting for it.
+
+        Args:
+            query: The handle returned by `_submit_query`.
+
+        Raises:
+            An engine-specific exception if the script failed.
+
+        Returns:
+            True if the script has completed successfully and False if it's still running.
+        """
+        raise NotImplementedError(f"Engine does not support asynchronous queries: {type(self)}")
+
+    def _end_query(self, query: t.Any, succeeded: bool) -> None:
+        """Releases the resources of a submitted script once it's no longer polled.
+
+        Args:
+            query: The handle returned by `_submit_query`.
+            succeeded: Whether the script has completed successfully.
+        """
+
+    def _async_execution_stats(
+        self, query: t.Any, sqls: t.List[str], duration_ms: int
+    ) -> ExecutionStats:
+        """Returns the stats of a script that was executed by `execute_async`."""
+        return ExecutionStats(
+            statement_kind=_statement_kind(sqls[0]) if len(sqls) == 1 else "SCRIPT",
+            duration_ms=duration_ms,
+        )
+
+    def _is_deferring_statements(self) -> bool:
+        return getattr(self._deferred, "statements", None) is not None
+
+    def _execute_deferred_statements(self) -> None:
+        statements = self._deferred.statements
+        self._deferred.statements = None
+        try:
+            self.execute(statements, quote_identifiers=False)
+        finally:
+            statements.clear()
+            self._deferred.statements = statements
+
+    def _expressions_to_sql(
+        self,
+        expressions: t.Union[str, exp.Expression, t.Sequence[exp.Expression]],
+        ignore_unsupported_errors: bool,
+        quote_identifiers: bool,
+    ) -> t.Iterator[str]:
+        to_sql_kwargs = (
+            {"unsupported_level": ErrorLevel.IGNORE} if ignore_unsupported_errors else {}
+        )
+        for e in ensure_list(expressions):
+            yield t.cast(
+                str,
+                (
+                    self._to_sql(e, quote=quote_identifiers, **to_sql_kwargs)
+                    if isinstance(e, exp.Expression)
+                    else e
+                ),
+            )
 
     def _log_sql(self, sql: str) -> None:
         logger.log(self._execute_log_level, "Executing SQL: %s", sql)
@@ -1824,6 +2248,16 @@ class EngineAdapter:
     def _execute(self, sql: str, **kwargs: t.Any) -> None:
         self.cursor.execute(sql, **kwargs)
 
+    def _execution_stats(self, sql: str, duration_ms: int) -> ExecutionStats:
+        """Returns the stats of the statement that has just been executed."""
+        rowcount = getattr(self.cursor, "rowcount", None)
+        return ExecutionStats(
+            statement_kind=_statement_kind(sql),
+            duration_ms=duration_ms,
+            # DB-API cursors report -1 when the number of affected rows can't be determined.
+            rows_affected=rowcount if isinstance(rowcount, int) and rowcount >= 0 else None,
+        )
+
     @contextlib.contextmanager
     def temp_table(
         self,
@@ -2058,6 +2492,31 @@ class EngineAdapter:
     ) -> None:
         self.execute(exp.rename_table(old_table_name, new_table_name))
 
+    def is_write_conflict(self, error: BaseException) -> bool:
+        """Returns True if the given error was caused by a conflict between concurrent writes to the same table.
+
+        Statements that failed due to such conflicts can be safely retried as long as they are idempotent.
+        """
+        message = str(error).lower()
+        return any(fragment.lower() in message for fragment in self.WRITE_CONFLICT_ERROR_MESSAGES)
+
+    def is_retryable_error(self, error: BaseException) -> bool:
+        """Returns True if the given error is transient and the failed operation may succeed if retried.
+
+        Besides write conflicts and the engine-specific transient errors, this includes errors whose class
+        (either its name or its fully qualified name) was configured as retryable for this connection.
+        """
+        if self.is_write_conflict(error):
+            return True
+        if self._retryable_errors and any(
+            klass.__name__ in self._retryable_errors
+            or f"{klass.__module__}.{klass.__qualname__}" in self._retryable_errors
+            for klass in type(error).__mro__
+        ):
+            return True
+        message = str(error).lower()
+        return any(fragment.lower() in message for fragment in self.TRANSIENT_ERROR_MESSAGES)
+
     def _ping(self) -> None:
         try:
             self._execute(exp.select("1").sql(dialect=self.dialect))
@@ -2077,3 +2536,8 @@ def _decoded_str(value: t.Union[str, bytes]) -> str:
     if isinstance(value, bytes):
         return value.decode("utf-8")
     return value
+
+
+def _statement_kind(sql: str) -> str:
+    words = sql.split(None, 1)
+    return words[0].upper() if words else ""
@@ -25,6 +25,17 @@ class BasePostgresEngineAdapter(EngineAdapter):
     CATALOG_SUPPORT = CatalogSupport.SINGLE_CATALOG_ONLY
     COMMENT_CREATION_TABLE = CommentCreationTable.COMMENT_COMMAND_ONLY
     COMMENT_CREATION_VIEW = CommentCreationView.COMMENT_COMMAND_ONLY
+    WRITE_CONFLICT_ERROR_MESSAGES = (
+        "could not serialize access",
+        "deadlock detected",
+        "Serializable isolation violation",
+    )
+    TRANSIENT_ERROR_MESSAGES = (
+        "server closed the connection unexpectedly",
+        "terminating connection due to administrator command",
+        "could not connect to server",
+        "SSL SYSCALL error",
+    )
 
     def _columns_query(self, table: exp.Table) -> exp.Select:
         sql = (
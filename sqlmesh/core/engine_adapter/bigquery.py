@@ -13,6 +13,7 @@ from sqlmesh.core.engine_adapter.shared import (
     CatalogSupport,
     DataObject,
     DataObjectType,
+    ExecutionStats,
     SourceQuery,
     set_catalog,
 )
@@ -24,7 +25,7 @@ from sqlmesh.utils.errors import SQLMeshError
 if t.TYPE_CHECKING:
     from google.api_core.retry import Retry
     from google.cloud import bigquery
-    from google.cloud.bigquery import StandardSqlDataType
+    from google.cloud.bigquery import QueryJob, StandardSqlDataType
     from google.cloud.bigquery.client import Client as BigQueryClient
     from google.cloud.bigquery.client import Connection as BigQueryConnection
     from google.cloud.bigquery.job.base import _AsyncJob as BigQueryQueryResult
@@ -51,6 +52,11 @@ class BigQueryEngineAdapter(InsertOverwriteWithMergeMixin):
     CATALOG_SUPPORT = CatalogSupport.FULL_SUPPORT
     MAX_TABLE_COMMENT_LENGTH = 1024
     MAX_COLUMN_COMMENT_LENGTH = 1024
+    SUPPORTS_ASYNC_QUERIES = True
+    WRITE_CONFLICT_ERROR_MESSAGES = (
+        "Could not serialize access to table",
+        "Transaction is aborted due to concurrent update",
+    )
 
     # SQL is not supported for adding columns to structs: https://cloud.google.com/bigquery/docs/managing-table-schemas#api_1
     # Can explore doing this with the API in the future
@@ -606,6 +612,9 @@ class BigQueryEngineAdapter(InsertOverwriteWithMergeMixin):
             columns_to_types,
         )
 
+    def is_retryable_error(self, error: BaseException) -> bool:
+        return super().is_retryable_error(error) or _ErrorCounter(num_retries=0).is_retryable(error)
+
     def _db_call(self, func: t.Callable[..., t.Any], *args: t.Any, **kwargs: t.Any) -> t.Any:
         return func(
             retry=self.__retry,
@@ -619,12 +628,52 @@ class BigQueryEngineAdapter(InsertOverwriteWithMergeMixin):
         **kwargs: t.Any,
     ) -> None:
         """Execute a sql query."""
-        from google.cloud.bigquery import QueryJobConfig
-        from google.cloud.bigquery.query import ConnectionProperty
-
         # BigQuery's Python DB API implementation does not support retries, so we have to implement them ourselves.
         # So we update the cursor's query job and query data with the results of the new query job. This makes sure
         # that other cursor based operations execute correctly.
+        self._query_job = self._create_query_job(sql)
+
+        results = self._db_call(
+            self._query_job.result,
+            timeout=self._extra_config.get("job_execution_timeout_seconds"),  # type: ignore
+        )
+        self._query_data = iter(results) if results.total_rows else iter([])
+        query_results = self._query_job._query_results
+        self.cursor._set_rowcount(query_results)
+        self.cursor._set_description(query_results.schema)
+
+    def _submit_query(self, sqls: t.List[str]) -> QueryJob:
+        # Multiple statements are submitted as a single multi-statement query, which BigQuery runs as a script.
+        return self._create_query_job(";\n".join(sqls))
+
+    def _is_query_done(self, query: QueryJob) -> bool:
+        # Unlike `result`, `done` reloads the job's state once without waiting for the job to complete.
+        if not self._db_call(query.done):
+            return False
+        error = query.exception()
+        if error:
+            raise error
+        return True
+
+    def _async_execution_stats(
+        self, query: QueryJob, sqls: t.List[str], duration_ms: int
+    ) -> ExecutionStats:
+        return (
+            super()
+            ._async_execution_stats(query, sqls, duration_ms)
+            .copy(
+                update={
+                    "rows_affected": query.num_dml_affected_rows,
+                    "bytes_processed": query.total_bytes_processed,
+                    "query_id": query.job_id,
+                }
+            )
+        )
+
+    def _create_query_job(self, sql: str) -> QueryJob:
+        from google.cloud.bigquery import QueryJobConfig
+        from google.cloud.bigquery.query import ConnectionProperty
+
         session_id = self._session_id
         connection_properties = (
             [
@@ -635,7 +684,7 @@ class BigQueryEngineAdapter(InsertOverwriteWithMergeMixin):
         )
 
         job_config = QueryJobConfig(**self._job_params, connection_properties=connection_properties)
-        self._query_job = self._db_call(
+        query_job = self._db_call(
             self.client.query,
             query=sql,
             job_config=job_config,
@@ -644,19 +693,24 @@ class BigQueryEngineAdapter(InsertOverwriteWithMergeMixin):
 
         logger.debug(
             "BigQuery job created: https://console.cloud.google.com/bigquery?project=%s&j=bq:%s:%s",
-            self._query_job.project,
-            self._query_job.location,
-            self._query_job.job_id,
+            query_job.project,
+            query_job.location,
+            query_job.job_id,
         )
-
-        results = self._db_call(
-            self._query_job.result,
-            timeout=self._extra_config.get("job_execution_timeout_seconds"),  # type: ignore
+        return query_job
+
+    def _execution_stats(self, sql: str, duration_ms: int) -> ExecutionStats:
+        query_job = self._query_job
+        return (
+            super()
+            ._execution_stats(sql, duration_ms)
+            .copy(
+                update={
+                    "bytes_processed": query_job.total_bytes_processed,
+                    "query_id": query_job.job_id,
+                }
+            )
         )
-        self._query_data = iter(results) if results.total_rows else iter([])
-        query_results = self._query_job._query_results
-        self.cursor._set_rowcount(query_results)
-        self.cursor._set_description(query_results.schema)
 
     def _get_data_objects(
         self, schema_name: SchemaName, object_names: t.Optional[t.Set[str]] = None
@@ -744,7 +798,8 @@ class _ErrorCounter:
 
     Reference implementation: https://github.com/dbt-labs/dbt-bigquery/blob/8339a034929b12e027f0a143abf46582f3f6ffbc/dbt/adapters/bigquery/connections.py#L672
 
-    TODO: Implement a retry configuration that works across all engines
+    This only applies to individual API calls. Failed snapshot evaluations are retried by the `SnapshotEvaluator`,
+    which consults `BigQueryEngineAdapter.is_retryable_error`.
     """
 
     def __init__(self, num_retries: int) -> None:
@@ -761,7 +816,7 @@ class _ErrorCounter:
 
         return (ServerError, ConnectionError)
 
-    def _is_retryable(self, error: BaseException) -> bool:
+    def is_retryable(self, error: BaseException) -> bool:
         from google.api_core.exceptions import Forbidden
 
         if isinstance(error, self.retryable_errors):
@@ -776,7 +831,7 @@ class _ErrorCounter:
         if self.num_retries == 0:
             return False
         self.error_count += 1
-        if self._is_retryable(error) and self.error_count <= self.num_retries:
+        if self.is_retryable(error) and self.error_count <= self.num_retries:
             logger.info(f"Retry Num {self.error_count} of {self.num_retries}. Error: {repr(error)}")
             return True
         return False
@@ -41,6 +41,10 @@ class DuckDBEngineAdapter(LogicalMergeMixin, GetCurrentCatalogFromFunctionMixin)
         """Sets the catalog name of the current connection."""
         self.execute(exp.Use(this=exp.to_identifier(catalog)))
 
+    def reset_connection(self) -> None:
+        # The connection is local to the process and closing it would discard in-memory databases.
+        pass
+
     def _df_to_source_queries(
         self,
         df: DF,
@@ -5,7 +5,12 @@ import typing as t
 
 from sqlglot import exp
 
-from sqlmesh.core.engine_adapter.base import EngineAdapter
+from sqlmesh.core.dialect import add_table
+from sqlmesh.core.engine_adapter.base import (
+    MERGE_SOURCE_ALIAS,
+    MERGE_TARGET_ALIAS,
+    EngineAdapter,
+)
 from sqlmesh.core.engine_adapter.shared import InsertOverwriteStrategy, SourceQuery
 from sqlmesh.core.node import IntervalUnit
 from sqlmesh.utils.errors import SQLMeshError
@@ -26,6 +31,7 @@ class LogicalMergeMixin(EngineAdapter):
         columns_to_types: t.Optional[t.Dict[str, exp.DataType]],
         unique_key: t.Sequence[exp.Expression],
         when_matched: t.Optional[exp.When] = None,
+        change_detection: bool = False,
     ) -> None:
         """
         Merge implementation for engine adapters that do not support merge natively.
@@ -36,6 +42,10 @@ class LogicalMergeMixin(EngineAdapter):
         3. Insert the temporary table contents into the target table. Any duplicate, non-unique rows
            within the temporary table are ommitted.
         4. Drop the temporary table.
+
+        With change detection, the rows of the temporary table whose hash matches the hash of the
+        target row with the same key are dropped first, so only new and changed rows are deleted
+        and inserted.
         """
         if when_matched:
             raise SQLMeshError(
@@ -50,6 +60,18 @@ class LogicalMergeMixin(EngineAdapter):
 
         with self.transaction():
             self.ctas(temp_table, source_table, columns_to_types=columns_to_types, exists=False)
+            if change_detection:
+                changes_table = self._get_temp_table(target_table)
+                self.ctas(
+                    changes_table,
+                    self._changed_rows_query(
+                        target_table, temp_table, columns_to_types, unique_key
+                    ),
+                    columns_to_types=columns_to_types,
+                    exists=False,
+                )
+                self.drop_table(temp_table)
+                temp_table = changes_table
             self.execute(
                 exp.delete(target_table).where(
                     unique_exp.isin(query=exp.select(unique_exp).from_(temp_table))
@@ -67,6 +89,60 @@ class LogicalMergeMixin(EngineAdapter):
             )
             self.drop_table(temp_table)
 
+    def _scd_type_2_close_rows(
+        self,
+        target_table: TableName,
+        closed_rows_query: exp.Select,
+        unique_key: t.Sequence[exp.Expression],
+        valid_to_col: exp.Column,
+    ) -> None:
+        """Replaces the current target rows which match the keys of the closed rows with the latter."""
+        unique_exp = exp.func("CONCAT_WS", "'__SQLMESH_DELIM__'", *unique_key)
+        self.execute(
+            exp.delete(target_table).where(
+                exp.and_(
+                    valid_to_col.is_(exp.Null()),
+                    unique_exp.isin(query=closed_rows_query.select(unique_exp, append=False)),
+                )
+            )
+        )
+        self.execute(
+            exp.insert(closed_rows_query, target_table, columns=closed_rows_query.named_selects)
+        )
+
+    def _changed_rows_query(
+        self,
+        target_table: TableName,
+        source_table: TableName,
+        columns_to_types: t.Dict[str, exp.DataType],
+        unique_key: t.Sequence[exp.Expression],
+    ) -> exp.Select:
+        """Selects the source rows which have no identical row with the same key in the target."""
+        source = (
+            self._select_columns(columns_to_types)
+            .distinct(*unique_key)
+            .from_(source_table)
+            .subquery(MERGE_SOURCE_ALIAS)
+        )
+        identical_rows = (
+            exp.select("1")
+            .from_(exp.alias_(exp.to_table(target_table), MERGE_TARGET_ALIAS, table=True))
+            .where(
+                *(
+                    add_table(part, MERGE_TARGET_ALIAS).eq(add_table(part, MERGE_SOURCE_ALIAS))
+                    for part in unique_key
+                ),
+                self._row_hash(columns_to_types, MERGE_TARGET_ALIAS).eq(
+                    self._row_hash(columns_to_types, MERGE_SOURCE_ALIAS)
+                ),
+            )
+        )
+        return (
+            exp.select(*(exp.column(col, MERGE_SOURCE_ALIAS) for col in columns_to_types))
+            .from_(source)
+            .where(exp.Exists(this=identical_rows).not_())
+        )
+
 
 class PandasNativeFetchDFSupportMixin(EngineAdapter):
     def _fetch_native_df(
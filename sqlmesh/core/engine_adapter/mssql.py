@@ -46,6 +46,11 @@ class MSSQLEngineAdapter(
     COMMENT_CREATION_TABLE = CommentCreationTable.UNSUPPORTED
     COMMENT_CREATION_VIEW = CommentCreationView.UNSUPPORTED
     SUPPORTS_REPLACE_TABLE = False
+    WRITE_CONFLICT_ERROR_MESSAGES = ("was deadlocked on lock resources",)
+    TRANSIENT_ERROR_MESSAGES = (
+        "A transport-level error has occurred",
+        "Communication link failure",
+    )
 
     def columns(
         self,
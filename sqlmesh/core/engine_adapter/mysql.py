@@ -39,6 +39,8 @@ class MySQLEngineAdapter(
     MAX_TABLE_COMMENT_LENGTH = 2048
     MAX_COLUMN_COMMENT_LENGTH = 1024
     SUPPORTS_REPLACE_TABLE = False
+    WRITE_CONFLICT_ERROR_MESSAGES = ("Deadlock found when trying to get lock",)
+    TRANSIENT_ERROR_MESSAGES = ("Lost connection to MySQL server", "MySQL server has gone away")
 
     def get_current_catalog(self) -> t.Optional[str]:
         """Returns the catalog name of the current connection."""
@@ -158,6 +158,16 @@ class DataObject(PydanticModel):
     type: DataObjectType
 
 
+class ExecutionStats(PydanticModel):
+    """Metrics of a single SQL statement executed by an engine adapter."""
+
+    statement_kind: str
+    duration_ms: int
+    rows_affected: t.Optional[int] = None
+    bytes_processed: t.Optional[int] = None
+    query_id: t.Optional[str] = None
+
+
 class CatalogSupport(Enum):
     UNSUPPORTED = 1
     SINGLE_CATALOG_ONLY = 2
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import contextlib
 import typing as t
+from threading import Lock
 
 import pandas as pd
 from pandas.api.types import is_datetime64_any_dtype  # type: ignore
@@ -15,6 +16,7 @@ from sqlmesh.core.engine_adapter.shared import (
     CatalogSupport,
     DataObject,
     DataObjectType,
+    ExecutionStats,
     SourceQuery,
     set_catalog,
 )
@@ -39,6 +41,16 @@ class SnowflakeEngineAdapter(GetCurrentCatalogFromFunctionMixin):
     SUPPORTS_CLONING = True
     CATALOG_SUPPORT = CatalogSupport.FULL_SUPPORT
     CURRENT_CATALOG_EXPRESSION = exp.func("current_database")
+    SUPPORTS_ASYNC_QUERIES = True
+    WRITE_CONFLICT_ERROR_MESSAGES = (
+        "was aborted because the number of waiters for this lock exceeds",
+        "deadlock detected",
+    )
+    TRANSIENT_ERROR_MESSAGES = (
+        "Could not connect to Snowflake backend",
+        "Snowflake Internal Error",
+        "Connection reset by peer",
+    )
 
     @contextlib.contextmanager
     def session(self, properties: SessionProperties) -> t.Iterator[None]:
@@ -72,6 +84,67 @@ class SnowflakeEngineAdapter(GetCurrentCatalogFromFunctionMixin):
         yield
         self.execute(f"USE WAREHOUSE {current_warehouse_sql}")
 
+    def __init__(self, *args: t.Any, **kwargs: t.Any):
+        super().__init__(*args, **kwargs)
+        # Connections that are used to run asynchronous queries. Each query gets its own session, since queries
+        # that run concurrently on the same session would share its transaction.
+        self._async_connections: t.List[t.Any] = []
+        self._async_connections_lock = Lock()
+
+    def close(self) -> t.Any:
+        with self._async_connections_lock:
+            async_connections, self._async_connections = self._async_connections, []
+        for connection in async_connections:
+            connection.close()
+        return super().close()
+
+    def _submit_query(self, sqls: t.List[str]) -> t.Tuple[t.Any, str]:
+        with self._async_connections_lock:
+            connection = self._async_connections.pop() if self._async_connections else None
+        if connection is None:
+            connection = self._connection_factory()
+        try:
+            cursor = connection.cursor()
+            cursor.execute_async(";\n".join(sqls), num_statements=len(sqls))
+        except Exception:
+            connection.close()
+            raise
+        return connection, cursor.sfqid
+
+    def _is_query_done(self, query: t.Tuple[t.Any, str]) -> bool:
+        connection, query_id = query
+        status = connection.get_query_status_throw_if_error(query_id)
+        return not connection.is_still_running(status)
+
+    def _end_query(self, query: t.Tuple[t.Any, str], succeeded: bool) -> None:
+        connection, _ = query
+        if not succeeded:
+            # Closing the session rolls back its transaction.
+            connection.close()
+            return
+        try:
+            connection.commit()
+        except Exception:
+            connection.close()
+            raise
+        with self._async_connections_lock:
+            self._async_connections.append(connection)
+
+    def _async_execution_stats(
+        self, query: t.Tuple[t.Any, str], sqls: t.List[str], duration_ms: int
+    ) -> ExecutionStats:
+        return (
+            super()
+            ._async_execution_stats(query, sqls, duration_ms)
+            .copy(update={"query_id": query[1]})
+        )
+
+    def _execution_stats(self, sql: str, duration_ms: int) -> ExecutionStats:
+        # Credits and bytes scanned are only available in QUERY_HISTORY, which can be joined on the query ID.
+        return (
+            super()._execution_stats(sql, duration_ms).copy(update={"query_id": self.cursor.sfqid})
+        )
+
     def _df_to_source_queries(
         self,
         df: DF,
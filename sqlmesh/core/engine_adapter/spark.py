@@ -55,6 +55,17 @@ class SparkEngineAdapter(GetCurrentCatalogFromFunctionMixin, HiveMetastoreTableP
     # currently check for storage formats we say we don't support REPLACE TABLE
     SUPPORTS_REPLACE_TABLE = False
     QUOTE_IDENTIFIERS_IN_VIEWS = False
+    WRITE_CONFLICT_ERROR_MESSAGES = (
+        "ConcurrentAppendException",
+        "ConcurrentDeleteReadException",
+        "ConcurrentDeleteDeleteException",
+        "CommitFailedException",
+    )
+    TRANSIENT_ERROR_MESSAGES = (
+        "TEMPORARILY_UNAVAILABLE",
+        "Connection reset by peer",
+        "Broken pipe",
+    )
 
     WAP_PREFIX = "wap_"
     BRANCH_PREFIX = "branch_"
@@ -197,7 +208,7 @@ class SparkEngineAdapter(GetCurrentCatalogFromFunctionMixin, HiveMetastoreTableP
                 exp.DataType(
                     this=exp.DataType.Type.STRUCT,
                     expressions=[
-                        exp.ColumnDef(this=exp.to_identifier(column), kind=data_type)
+                        exp.ColumnDef(this=exp.to_identifier(column), kind=data_type.copy())
                         for column, data_type in input.items()
                     ],
                 )
@@ -53,6 +53,13 @@ class TrinoEngineAdapter(
     SUPPORTS_REPLACE_TABLE = False
     DEFAULT_CATALOG_TYPE = "hive"
     QUOTE_IDENTIFIERS_IN_VIEWS = False
+    WRITE_CONFLICT_ERROR_MESSAGES = ("CommitFailedException", "Failed to commit")
+    TRANSIENT_ERROR_MESSAGES = (
+        "NO_NODES_AVAILABLE",
+        "SERVER_STARTING_UP",
+        "SERVER_SHUTTING_DOWN",
+        "PAGE_TRANSPORT_TIMEOUT",
+    )
 
     @property
     def connection(self) -> TrinoConnection:
@@ -220,6 +227,7 @@ class TrinoEngineAdapter(
         table_description: t.Optional[str] = None,
         column_descriptions: t.Optional[t.Dict[str, str]] = None,
         truncate: bool = False,
+        incremental_updates: bool = False,
     ) -> None:
         if columns_to_types and self.current_catalog_type == "delta_lake":
             columns_to_types = self._to_delta_ts(columns_to_types)
@@ -240,6 +248,7 @@ class TrinoEngineAdapter(
             table_description,
             column_descriptions,
             truncate,
+            incremental_updates,
         )
 
     # delta_lake only supports two timestamp data types. This method converts other
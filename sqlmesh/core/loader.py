@@ -46,11 +46,33 @@ def update_model_schemas(
     dag: DAG[str],
     models: UniqueKeyDict[str, Model],
     context_path: Path,
+    names: t.Optional[t.Set[str]] = None,
 ) -> None:
+    """Updates the schemas and optimized queries of models in topological order.
+
+    Args:
+        dag: The DAG of models.
+        models: All models of the project.
+        context_path: The path to the context, which contains the optimized query cache.
+        names: If provided, only models with these names are updated. The schemas of their upstream
+            models are assumed to be up to date.
+    """
     schema = MappingSchema(normalize=False)
     optimized_query_cache: OptimizedQueryCache = OptimizedQueryCache(context_path / c.CACHE)
 
+    if names is not None:
+        upstream = {dep for name in names if name in models for dep in models[name].depends_on}
+        for name in upstream - names:
+            model = models.get(name)
+            if model and model.columns_to_types is not None:
+                schema.add_table(
+                    model.fqn, model.columns_to_types, dialect=model.dialect, normalize=False
+                )
+
     for name in dag.sorted:
+        if names is not None and name not in names:
+            continue
+
         model = models.get(name)
 
         # External models don't exist in the context, so we need to skip them
@@ -90,6 +112,8 @@ class Loader(abc.ABC):
     def __init__(self) -> None:
         self._path_mtimes: t.Dict[Path, float] = {}
         self._dag: DAG[str] = DAG()
+        self._project: t.Optional[LoadedProject] = None
+        self._update_schemas = True
 
     def load(self, context: GenericContext, update_schemas: bool = True) -> LoadedProject:
         """
@@ -106,6 +130,8 @@ class Loader(abc.ABC):
         self._context = context
         self._path_mtimes.clear()
         self._dag = DAG()
+        self._project = None
+        self._update_schemas = update_schemas
 
         config_mtimes: t.Dict[Path, t.List[float]] = defaultdict(list)
         for context_path, config in self._context.configs.items():
@@ -145,8 +171,69 @@ class Loader(abc.ABC):
             metrics=expand_metrics(metrics),
             dag=self._dag,
         )
+        self._project = project
         return project
 
+    def reload(self, context: GenericContext, update_schemas: bool = True) -> LoadedProject:
+        """
+        Reloads only the models whose files have changed since the last load. Schemas and optimized
+        queries are only recomputed for these models and their downstream models. Falls back to a
+        full load if any other file the project depends on has changed.
+
+        Args:
+            context: The context to load macros and models for.
+            update_schemas: Convert star projections to explicit columns.
+        """
+        project = self._project
+        if (
+            project is None
+            or context is not self._context
+            or update_schemas != self._update_schemas
+        ):
+            return self.load(context, update_schemas)
+
+        try:
+            return self._reload(project, update_schemas)
+        except Exception:
+            # The state of the last load may be partially overwritten at this point
+            self._project = None
+            raise
+
+    def _reload(self, project: LoadedProject, update_schemas: bool) -> LoadedProject:
+        reloaded = self._reload_models(project, self._modified_paths())
+        if reloaded is None:
+            return self.load(self._context, update_schemas)
+
+        models, changed = reloaded
+        if not changed:
+            return project
+
+        self._dag = DAG()
+        for model in models.values():
+            self._add_model_to_dag(model)
+
+        affected = set(changed)
+        for name in self._dag.sorted:
+            model = models.get(name)
+            if model and not model.depends_on.isdisjoint(affected):
+                affected.add(name)
+
+        if update_schemas:
+            update_model_schemas(self._dag, models, self._context.path, names=affected)
+            for name in affected:
+                if name in models:
+                    models[name].validate_definition()
+
+        self._project = LoadedProject(
+            macros=project.macros,
+            jinja_macros=project.jinja_macros,
+            models=models,
+            audits=project.audits,
+            metrics=project.metrics,
+            dag=self._dag,
+        )
+        return self._project
+
     def reload_needed(self) -> bool:
         """
         Checks for any modifications to the files the macros and models depend on
@@ -155,10 +242,29 @@ class Loader(abc.ABC):
         Returns:
             True if a modification is found; False otherwise
         """
-        return any(
-            not path.exists() or path.stat().st_mtime > initial_mtime
+        return bool(self._modified_paths())
+
+    def _modified_paths(self) -> t.Set[Path]:
+        return {
+            path
             for path, initial_mtime in self._path_mtimes.items()
-        )
+            if not path.exists() or path.stat().st_mtime > initial_mtime
+        }
+
+    def _reload_models(
+        self, project: LoadedProject, modified_paths: t.Set[Path]
+    ) -> t.Optional[t.Tuple[UniqueKeyDict[str, Model], t.Set[str]]]:
+        """Reloads the models defined in modified files.
+
+        Args:
+            project: The project of the last load.
+            modified_paths: Tracked files that have been modified or deleted since the last load.
+
+        Returns:
+            The new models and the names of models that have been added, changed or removed, or None
+            if the modifications can't be applied without a full load.
+        """
+        return None
 
     @abc.abstractmethod
     def _load_scripts(self) -> t.Tuple[MacroRegistry, JinjaMacroRegistry]:
@@ -274,6 +380,7 @@ class SqlMeshLoader(Loader):
     ) -> UniqueKeyDict[str, Model]:
         """Loads the sql models into a Dict"""
         models: UniqueKeyDict[str, Model] = UniqueKeyDict("models")
+        self._sql_model_paths: t.Dict[Path, str] = {}
         for context_path, config in self._context.configs.items():
             cache = SqlMeshLoader._Cache(self, context_path)
             variables = self._variables(config)
@@ -282,42 +389,111 @@ class SqlMeshLoader(Loader):
                 if not os.path.getsize(path):
                     continue
 
-                self._track_file(path)
+                model = self._load_sql_model(
+                    path, context_path, config, macros, jinja_macros, cache, variables
+                )
+                models[model.fqn] = model
 
-                def _load() -> Model:
-                    with open(path, "r", encoding="utf-8") as file:
-                        try:
-                            expressions = parse(
-                                file.read(), default_dialect=config.model_defaults.dialect
-                            )
-                        except SqlglotError as ex:
-                            raise ConfigError(
-                                f"Failed to parse a model definition at '{path}': {ex}."
-                            )
-
-                    return load_sql_based_model(
-                        expressions,
-                        defaults=config.model_defaults.dict(),
-                        macros=macros,
-                        jinja_macros=jinja_macros,
-                        path=Path(path).absolute(),
-                        module_path=context_path,
-                        dialect=config.model_defaults.dialect,
-                        time_column_format=config.time_column_format,
-                        physical_schema_override=config.physical_schema_override,
-                        project=config.project,
-                        default_catalog=self._context.default_catalog,
-                        variables=variables,
-                    )
+        return models
 
-                model = cache.get_or_load_model(path, _load)
-                models[model.fqn] = model
+    def _load_sql_model(
+        self,
+        path: Path,
+        context_path: Path,
+        config: Config,
+        macros: MacroRegistry,
+        jinja_macros: JinjaMacroRegistry,
+        cache: SqlMeshLoader._Cache,
+        variables: t.Dict[str, t.Any],
+    ) -> Model:
+        """Loads a single sql model"""
+        self._track_file(path)
+
+        def _load() -> Model:
+            with open(path, "r", encoding="utf-8") as file:
+                try:
+                    expressions = parse(file.read(), default_dialect=config.model_defaults.dialect)
+                except SqlglotError as ex:
+                    raise ConfigError(f"Failed to parse a model definition at '{path}': {ex}.")
+
+            return load_sql_based_model(
+                expressions,
+                defaults=config.model_defaults.dict(),
+                macros=macros,
+                jinja_macros=jinja_macros,
+                path=Path(path).absolute(),
+                module_path=context_path,
+                dialect=config.model_defaults.dialect,
+                time_column_format=config.time_column_format,
+                physical_schema_override=config.physical_schema_override,
+                project=config.project,
+                default_catalog=self._context.default_catalog,
+                variables=variables,
+            )
 
-                if isinstance(model, SeedModel):
-                    seed_path = model.seed_path
-                    self._track_file(seed_path)
+        model = cache.get_or_load_model(path, _load)
+        self._sql_model_paths[path] = model.fqn
 
-        return models
+        if isinstance(model, SeedModel):
+            seed_path = model.seed_path
+            self._track_file(seed_path)
+
+        return model
+
+    def _reload_models(
+        self, project: LoadedProject, modified_paths: t.Set[Path]
+    ) -> t.Optional[t.Tuple[UniqueKeyDict[str, Model], t.Set[str]]]:
+        model_paths = {
+            path: (context_path, config)
+            for context_path, config in self._context.configs.items()
+            for path in self._glob_paths(context_path / c.MODELS, config=config, extension=".sql")
+            if os.path.getsize(path)
+        }
+
+        # Only changes to sql models can be applied incrementally. Changes to macros, configs, audits,
+        # python models, seeds and any other tracked file require a full load.
+        if any(path not in self._sql_model_paths for path in modified_paths):
+            return None
+
+        changed_paths = (
+            modified_paths
+            | (self._sql_model_paths.keys() - model_paths.keys())
+            | (model_paths.keys() - self._sql_model_paths.keys())
+        )
+        if not changed_paths:
+            return project.models, set()
+
+        changed = {
+            self._sql_model_paths.pop(path)
+            for path in changed_paths
+            if path in self._sql_model_paths
+        }
+        for path in changed_paths:
+            self._path_mtimes.pop(path, None)
+
+        new_models: UniqueKeyDict[str, Model] = UniqueKeyDict("models")
+        for name, model in project.models.items():
+            if name not in changed:
+                new_models[name] = model
+
+        caches: t.Dict[Path, SqlMeshLoader._Cache] = {}
+        for path in sorted(changed_paths & model_paths.keys()):
+            context_path, config = model_paths[path]
+            if context_path not in caches:
+                caches[context_path] = SqlMeshLoader._Cache(self, context_path)
+            model = self._load_sql_model(
+                path,
+                context_path,
+                config,
+                project.macros,
+                project.jinja_macros,
+                caches[context_path],
+                self._variables(config),
+            )
+            new_models[model.fqn] = model
+            changed.add(model.fqn)
+
+        return new_models, changed
 
     def _load_python_models(self) -> UniqueKeyDict[str, Model]:
         """Loads the python models into a Dict"""
@@ -67,6 +67,30 @@ class MacroStrTemplate(Template):
     delimiter = SQLMESH_MACRO_PREFIX
 
 
+class MacroPlan:
+    """The paths from the root of an expression to its outermost macro nodes in depth-first order.
+
+    Each path is a sequence of (arg_key, index) pairs, where the index is None for nodes that are not
+    part of a list. An empty plan means that the expression contains no macros.
+    """
+
+    __slots__ = ("paths",)
+
+    def __init__(self, paths: t.Sequence[t.Tuple[t.Tuple[str, t.Optional[int]], ...]]):
+        self.paths = tuple(paths)
+
+    def __bool__(self) -> bool:
+        return bool(self.paths)
+
+
+def _is_macro(node: exp.Expression) -> bool:
+    return (
+        isinstance(node, (MacroVar, MacroFunc))
+        or (isinstance(node, exp.Identifier) and "@" in node.this)
+        or (node.is_string and has_jinja(node.this))
+    )
+
+
 EXPRESSIONS_NAME_MAP = {}
 SQL = t.NewType("SQL", str)
 
@@ -220,9 +244,45 @@ class MacroEvaluator:
             print_exception(e, self.python_env)
             raise MacroEvalError("Error trying to eval macro.") from e
 
+    @staticmethod
+    def compile(expression: exp.Expression) -> MacroPlan:
+        """Records the paths of the outermost macro nodes of an expression.
+
+        A plan only depends on the structure of the expression, so it can be computed once and
+        passed to `transform` on every render of the same expression.
+
+        Args:
+            expression: The expression to analyze.
+
+        Returns:
+            The plan of the expression.
+        """
+        paths = []
+        for node in expression.dfs(prune=lambda n: isinstance(n, exp.Lambda) or _is_macro(n)):
+            if _is_macro(node):
+                path = []
+                while node is not expression:
+                    path.append((node.arg_key, node.index))
+                    node = node.parent
+                paths.append(tuple(reversed(path)))
+        return MacroPlan(paths)
+
     def transform(
-        self, expression: exp.Expression
+        self, expression: exp.Expression, plan: t.Optional[MacroPlan] = None
     ) -> exp.Expression | t.List[exp.Expression] | None:
+        """Evaluates all macros of an expression.
+
+        Args:
+            expression: The expression to transform. It's copied, not modified in place.
+            plan: The plan returned by `compile` for this expression. If not provided, it's computed.
+
+        Returns:
+            The transformed expression, a list of expressions or None.
+        """
+        plan = self.compile(expression) if plan is None else plan
+        if not plan:
+            return expression.copy()
+
         changed = False
 
         def evaluate_macros(
@@ -266,9 +326,23 @@ class MacroEvaluator:
                 return self.evaluate(node)
             return node
 
-        transformed = exp.replace_tree(
-            expression.copy(), evaluate_macros, prune=lambda n: isinstance(n, exp.Lambda)
-        )
+        transformed: exp.Expression | t.List[exp.Expression] | None = expression.copy()
+
+        # Macro nodes are replayed in reverse depth-first order, which is the order in which
+        # replace_tree visits them. Replacing a node can only shift the positions of the nodes
+        # that follow it, so the paths of the remaining nodes stay valid.
+        for path in reversed(plan.paths):
+            node: t.Any = transformed
+            for arg_key, index in path:
+                node = node.args[arg_key]
+                if index is not None:
+                    node = node[index]
+
+            result = exp.replace_tree(
+                node, evaluate_macros, prune=lambda n: isinstance(n, exp.Lambda)
+            )
+            if not path:
+                transformed = result
 
         if changed:
             # the transformations could have corrupted the ast, turning this into sql and reparsing ensures
@@ -1,5 +1,6 @@
 from sqlmesh.core.model.cache import (
     ModelCache as ModelCache,
+    ModelHashCache as ModelHashCache,
     OptimizedQueryCache as OptimizedQueryCache,
 )
 from sqlmesh.core.model.decorator import model as model
@@ -6,9 +6,10 @@ from pathlib import Path
 from sqlglot import exp
 from sqlglot.optimizer.simplify import gen
 
+from sqlmesh.core.audit import ModelAudit
 from sqlmesh.core.model.definition import Model, SqlModel
 from sqlmesh.utils.cache import FileCache
-from sqlmesh.utils.hashing import crc32
+from sqlmesh.utils.hashing import crc32, md5
 from sqlmesh.utils.pydantic import PydanticModel
 
 
@@ -47,6 +48,7 @@ class ModelCache:
         if cache_entry:
             model = cache_entry.model
             model._query_renderer.update_cache(cache_entry.rendered_query, optimized=False)
+            model._definition_cache_key = f"{self.path / name}__{entry_id}"
             return model
 
         loaded_model = loader()
@@ -55,6 +57,7 @@ class ModelCache:
                 model=loaded_model, rendered_query=loaded_model.render_query(optimize=False)
             )
             self._file_cache.put(name, entry_id, value=new_entry)
+            loaded_model._definition_cache_key = f"{self.path / name}__{entry_id}"
 
         return loaded_model
 
@@ -106,6 +109,69 @@ class OptimizedQueryCache:
         return False
 
 
+class ModelHashCacheEntry(PydanticModel):
+    data_hash: str
+    metadata_hash: str
+
+
+class ModelHashCache:
+    """File-based cache implementation for data and metadata hashes of models loaded from files.
+
+    Entries are keyed by the model's cache entry, which changes whenever its file or the project's
+    macros and configuration change, by the schemas of its dependencies and by the audits it references.
+    Only the most recent entry is kept for each model.
+
+    Args:
+        path: The path to the cache folder.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._file_cache: FileCache[ModelHashCacheEntry] = FileCache(
+            path, ModelHashCacheEntry, prefix="model_hash"
+        )
+        self._audit_hashes: t.Dict[str, str] = {}
+
+    def get_or_compute(self, model: Model, audits: t.Dict[str, ModelAudit]) -> t.Tuple[str, str]:
+        """Returns cached data and metadata hashes of the model or computes and caches new ones.
+
+        Args:
+            model: The model to hash.
+            audits: Available audits by name.
+
+        Returns:
+            A tuple of the data hash and the metadata hash.
+        """
+        if not isinstance(model, SqlModel) or not model._definition_cache_key:
+            return model.data_hash, model.metadata_hash(audits)
+
+        hash_data = [model._definition_cache_key, model.stamp or ""]
+        hash_data.extend(_mapping_schema_hash_data(model.mapping_schema))
+        for audit_name, _ in model.audits:
+            if audit_name in audits:
+                hash_data.append(self._audit_hash(audits[audit_name]))
+        entry_id = md5(hash_data)
+
+        cache_entry = self._file_cache.get(model.name, entry_id)
+        if cache_entry:
+            return cache_entry.data_hash, cache_entry.metadata_hash
+
+        data_hash, metadata_hash = model.data_hash, model.metadata_hash(audits)
+        # Entries of previous versions of the model won't be used again.
+        self._file_cache.delete(model.name)
+        self._file_cache.put(
+            model.name,
+            entry_id,
+            value=ModelHashCacheEntry(data_hash=data_hash, metadata_hash=metadata_hash),
+        )
+        return data_hash, metadata_hash
+
+    def _audit_hash(self, audit: ModelAudit) -> str:
+        if audit.name not in self._audit_hashes:
+            self._audit_hashes[audit.name] = md5([audit.json(sort_keys=True)])
+        return self._audit_hashes[audit.name]
+
+
 def _mapping_schema_hash_data(schema: t.Dict[str, t.Any]) -> t.List[str]:
     keys = sorted(schema) if all(isinstance(v, dict) for v in schema.values()) else schema
 
@@ -43,6 +43,7 @@ from sqlmesh.utils.metaprogramming import (
     print_exception,
     serialize_env,
 )
+from sqlmesh.utils.pydantic import field_validator
 
 if t.TYPE_CHECKING:
     from sqlmesh.core._typing import TableName
@@ -116,6 +117,11 @@ class _Model(ModelMeta, frozen=True):
 
     _expressions_validator = expression_validator
 
+    @field_validator("mapping_schema", mode="before")
+    @classmethod
+    def _mapping_schema_validator(cls, v: t.Any) -> t.Any:
+        return d.intern_schema(v) if isinstance(v, dict) else v
+
     def render(
         self,
         *,
@@ -243,7 +249,9 @@ class _Model(ModelMeta, frozen=True):
         """
         return exp.select(
             *(
-                exp.cast(exp.Null(), column_type, copy=False).as_(name, copy=False, quoted=True)
+                exp.cast(exp.Null(), column_type.copy(), copy=False).as_(
+                    name, copy=False, quoted=True
+                )
                 for name, column_type in (self.columns_to_types or {}).items()
             ),
             copy=False,
@@ -535,7 +543,12 @@ class _Model(ModelMeta, frozen=True):
                 nested_set(
                     self.mapping_schema,
                     tuple(part.sql(copy=False) for part in table.parts),
-                    {col: dtype.sql(dialect=self.dialect) for col, dtype in mapping_schema.items()},
+                    d.intern_schema(
+                        {
+                            col: dtype.sql(dialect=self.dialect)
+                            for col, dtype in mapping_schema.items()
+                        }
+                    ),
                 )
 
     @cached_property
@@ -942,6 +955,8 @@ class SqlModel(_SqlBasedModel):
     source_type: Literal["sql"] = "sql"
 
     _columns_to_types: t.Optional[t.Dict[str, exp.DataType]] = None
+    # Identifies the file and settings this model was loaded from, used to reuse cached hashes.
+    _definition_cache_key: t.Optional[str] = None
 
     def render_query(
         self,
@@ -991,7 +1006,9 @@ class SqlModel(_SqlBasedModel):
                 return None
 
             self._columns_to_types = {
-                select.output_name: select.type or exp.DataType.build("unknown")
+                sys.intern(select.output_name): d.intern_data_type(
+                    select.type or exp.DataType.build("unknown"), dialect=self.dialect
+                )
                 for select in query.selects
             }
 
@@ -2117,7 +2134,7 @@ META_FIELD_CONVERTER: t.Dict[str, t.Callable] = {
     "post": _list_of_calls_to_exp,
     "audits": _list_of_calls_to_exp,
     "columns_to_types_": lambda value: exp.Schema(
-        expressions=[exp.ColumnDef(this=exp.to_column(c), kind=t) for c, t in value.items()]
+        expressions=[exp.ColumnDef(this=exp.to_column(c), kind=t.copy()) for c, t in value.items()]
     ),
     "tags": _single_value_or_tuple,
     "grains": _refs_to_sql,
@@ -356,6 +356,7 @@ class IncrementalByUniqueKeyKind(_IncrementalBy):
     name: Literal[ModelKindName.INCREMENTAL_BY_UNIQUE_KEY] = ModelKindName.INCREMENTAL_BY_UNIQUE_KEY
     unique_key: SQLGlotListOfFields
     when_matched: t.Optional[exp.When] = None
+    change_detection: SQLGlotBool = False
     batch_concurrency: Literal[1] = 1
 
     @field_validator("when_matched", mode="before")
@@ -398,6 +399,10 @@ class IncrementalByUniqueKeyKind(_IncrementalBy):
             gen(self.when_matched) if self.when_matched is not None else None,
         ]
 
+    @property
+    def metadata_hash_values(self) -> t.List[t.Optional[str]]:
+        return [*super().metadata_hash_values, str(self.change_detection)]
+
 
 class IncrementalUnmanagedKind(_Incremental):
     name: Literal[ModelKindName.INCREMENTAL_UNMANAGED] = ModelKindName.INCREMENTAL_UNMANAGED
@@ -478,6 +483,7 @@ class _SCDType2Kind(_Incremental):
     valid_to_name: SQLGlotColumn = Field(exp.column("valid_to"), validate_default=True)
     invalidate_hard_deletes: SQLGlotBool = False
     time_data_type: exp.DataType = Field(exp.DataType.build("TIMESTAMP"), validate_default=True)
+    incremental_updates: SQLGlotBool = False
 
     forward_only: SQLGlotBool = True
     disable_restatement: SQLGlotBool = True
@@ -527,6 +533,7 @@ class _SCDType2Kind(_Incremental):
             *super().metadata_hash_values,
             str(self.forward_only),
             str(self.disable_restatement),
+            str(self.incremental_updates),
         ]
 
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import sys
 import typing as t
 from functools import cached_property
 
@@ -193,18 +194,16 @@ class ModelMeta(_Node):
 
         if isinstance(v, exp.Schema):
             for column in v.expressions:
-                expr = column.args["kind"]
-                expr.meta["dialect"] = dialect
-                columns_to_types[normalize_identifiers(column, dialect=dialect).name] = expr
+                name = sys.intern(normalize_identifiers(column, dialect=dialect).name)
+                columns_to_types[name] = d.intern_data_type(column.args["kind"], dialect=dialect)
 
             return columns_to_types
 
         if isinstance(v, dict):
             udt = Dialect.get_or_raise(dialect).SUPPORTS_USER_DEFINED_TYPES
             for k, data_type in v.items():
-                expr = exp.DataType.build(data_type, dialect=dialect, udt=udt)
-                expr.meta["dialect"] = dialect
-                columns_to_types[normalize_identifiers(k, dialect=dialect).name] = expr
+                name = sys.intern(normalize_identifiers(k, dialect=dialect).name)
+                columns_to_types[name] = d.intern_data_type(data_type, dialect=dialect, udt=udt)
 
             return columns_to_types
 
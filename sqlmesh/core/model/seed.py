@@ -1,18 +1,28 @@
 from __future__ import annotations
 
+import hashlib
+import io
 import typing as t
 import zlib
-from io import StringIO
+from contextlib import closing
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+from pydantic import Field
 from sqlglot import exp
 from sqlglot.optimizer.normalize_identifiers import normalize_identifiers
 
 from sqlmesh.core.model.common import parse_bool
-from sqlmesh.utils.pandas import columns_to_types_from_df
+from sqlmesh.utils.errors import SQLMeshError
+from sqlmesh.utils.pandas import columns_to_types_from_dtypes
 from sqlmesh.utils.pydantic import PydanticModel, field_validator
 
+# The number of rows parsed at a time when reading seeds.
+SEED_CHUNK_SIZE = 100_000
+# The number of bytes read at a time when hashing seed files.
+SEED_HASH_BLOCK_SIZE = 1_000_000
+
 
 class CsvSettings(PydanticModel):
     """Settings for CSV seeds."""
@@ -43,64 +53,272 @@ class CsvSettings(PydanticModel):
 
 
 class CsvSeedReader:
-    def __init__(self, content: str, dialect: str, settings: CsvSettings):
+    """Reads the CSV content of a seed in chunks.
+
+    The content is read from the seed file directly when its path is provided, so neither the content
+    nor the whole parsed dataset have to be held in memory at once. If the hash of the file's content
+    is provided as well, every read verifies that the file hasn't changed since the hash was computed.
+    """
+
+    def __init__(
+        self,
+        content: str,
+        dialect: str,
+        settings: CsvSettings,
+        path: t.Optional[Path] = None,
+        chunk_size: int = SEED_CHUNK_SIZE,
+        content_hash: t.Optional[str] = None,
+    ):
         self.content = content
         self.dialect = dialect
         self.settings = settings
+        self.path = path
+        self.chunk_size = chunk_size
+        self.content_hash = content_hash
+        self._dtypes: t.Optional[t.Dict[str, t.Any]] = None
+        self._column_hashes: t.Optional[t.Dict[str, str]] = None
+        # The parsed dataset is only kept when it fits into a single chunk
         self._df: t.Optional[pd.DataFrame] = None
 
     @property
     def columns_to_types(self) -> t.Dict[str, exp.DataType]:
-        return columns_to_types_from_df(self._get_df())
+        return columns_to_types_from_dtypes(self._get_dtypes().items())
 
     @property
     def column_hashes(self) -> t.Dict[str, str]:
-        df = self._get_df()
-        return {
-            column_name: str(zlib.crc32(df[column_name].to_json().encode("utf-8")))
-            for column_name in df.columns
-        }
+        if self._column_hashes is None:
+            dtypes = self._get_dtypes()
+            # The hashes are usually computed while the types are inferred
+            if self._column_hashes is None:
+                hasher = _ColumnHasher()
+                for df in self._read_chunks():
+                    hasher.update(df, dtypes)
+                self._column_hashes = hasher.hashes()
+        return self._column_hashes
 
     def read(self, batch_size: t.Optional[int] = None) -> t.Generator[pd.DataFrame, None, None]:
-        df = self._get_df()
-
-        batch_size = batch_size or df.size
-        batch_start = 0
-        while batch_start < df.shape[0]:
-            yield df.iloc[batch_start : batch_start + batch_size, :]
-            batch_start += batch_size
-
-    def _get_df(self) -> pd.DataFrame:
-        if self._df is None:
-            self._df = pd.read_csv(
-                StringIO(self.content),
-                index_col=False,
-                on_bad_lines="error",
-                low_memory=False,
-                **{k: v for k, v in self.settings.dict().items() if v is not None},
-            )
-            self._df = self._df.rename(
-                columns={
-                    col: normalize_identifiers(col, dialect=self.dialect).name
-                    for col in self._df.columns
-                },
-            )
-
-        return self._df
+        dtypes = self._get_dtypes()
+        for df in self._read_chunks(batch_size):
+            mismatched = {
+                column: dtype for column, dtype in dtypes.items() if df[column].dtype != dtype
+            }
+            yield df.astype(mismatched) if mismatched else df
+
+    def _get_dtypes(self) -> t.Dict[str, t.Any]:
+        if self._dtypes is None:
+            dtypes: t.Dict[str, t.Any] = {}
+            # Columns whose values in some chunk were not parsed as strings
+            non_string_columns: t.Set[str] = set()
+            # Column hashes are computed in the same pass, which is only valid if every chunk already
+            # has the final types.
+            hasher = _ColumnHasher()
+            chunk_dtypes: t.Dict[str, t.Set[t.Any]] = {}
+            chunks = 0
+            for df in self._read_chunks():
+                chunks += 1
+                hasher.update(df)
+                for column, dtype in df.dtypes.items():
+                    column = str(column)
+                    dtypes[column] = (
+                        _common_dtype(dtypes[column], dtype) if column in dtypes else dtype
+                    )
+                    chunk_dtypes.setdefault(column, set()).add(dtype)
+                    if not _is_string_column(df[column]):
+                        non_string_columns.add(column)
+                self._df = df if chunks == 1 else None
+
+            if chunks > 1 and any(
+                dtype == np.dtype("O") and column in non_string_columns
+                for column, dtype in dtypes.items()
+            ):
+                # Values of a column with mixed types are parsed as strings when the whole file is
+                # read at once, while chunks that only contain numbers or booleans keep them as is.
+                # Converting the latter doesn't turn them into the same strings, so the file is
+                # parsed again as a whole instead.
+                self._df = next(self._parse())
+                dtypes = {str(column): dtype for column, dtype in self._df.dtypes.items()}
+            elif all(chunk_dtypes[column] == {dtype} for column, dtype in dtypes.items()):
+                self._column_hashes = hasher.hashes()
+
+            self._dtypes = dtypes
+        return self._dtypes
+
+    def _read_chunks(
+        self, batch_size: t.Optional[int] = None
+    ) -> t.Generator[pd.DataFrame, None, None]:
+        if self._df is not None:
+            batch_size = batch_size or self._df.shape[0]
+            batch_start = 0
+            while batch_start < self._df.shape[0]:
+                yield self._df.iloc[batch_start : batch_start + batch_size, :]
+                batch_start += batch_size
+            return
+
+        yield from self._parse(batch_size or self.chunk_size)
+
+    def _parse(self, chunk_size: t.Optional[int] = None) -> t.Generator[pd.DataFrame, None, None]:
+        """Parses the CSV content in chunks of the given size or as a whole if no size is given."""
+        kwargs = dict(
+            index_col=False,
+            on_bad_lines="error",
+            low_memory=False,
+            **{k: v for k, v in self.settings.dict().items() if v is not None},
+        )
+        if self.path is None:
+            source: t.IO = io.StringIO(self.content)
+        elif self.content_hash is None:
+            source = open(self.path, "rb")
+        else:
+            source = io.BufferedReader(_HashVerifyingFile(self.path, self.content_hash))
+
+        with closing(source):
+            if chunk_size is None:
+                yield self._normalize_columns(pd.read_csv(source, **kwargs))
+                return
+
+            with pd.read_csv(source, chunksize=chunk_size, **kwargs) as reader:
+                for df in reader:
+                    yield self._normalize_columns(df)
+
+    def _normalize_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        return df.rename(
+            columns={
+                col: normalize_identifiers(col, dialect=self.dialect).name for col in df.columns
+            }
+        )
 
 
 class Seed(PydanticModel):
     """Represents content of a seed.
 
-    Presently only CSV format is supported.
+    Presently only CSV format is supported. Seeds created from a file only keep its path and the hash
+    of its content, and read the content from the file when it's accessed.
     """
 
-    content: str
+    content_: t.Optional[str] = Field(default=None, alias="content")
+    path: t.Optional[str] = None
+    content_hash: t.Optional[str] = None
+
+    @property
+    def content(self) -> str:
+        if self.content_ is not None:
+            return self.content_
+        if self.path is None:
+            return ""
+
+        data = Path(self.path).read_bytes()
+        if self.content_hash is not None and hashlib.md5(data).hexdigest() != self.content_hash:
+            raise _seed_file_changed_error(self.path)
+        return io.TextIOWrapper(io.BytesIO(data), encoding="utf-8").read()
+
+    @content.setter
+    def content(self, content: str) -> None:
+        self.content_ = content
 
     def reader(self, dialect: str = "", settings: t.Optional[CsvSettings] = None) -> CsvSeedReader:
-        return CsvSeedReader(self.content, dialect, settings or CsvSettings())
+        from_file = self.content_ is None and self.path is not None
+        return CsvSeedReader(
+            "" if from_file else self.content,
+            dialect,
+            settings or CsvSettings(),
+            path=Path(self.path) if from_file and self.path else None,
+            content_hash=self.content_hash if from_file else None,
+        )
+
+    def with_content(self) -> Seed:
+        """Returns a copy of this seed that holds its content instead of the path to its file."""
+        if self.content_ is not None:
+            return self
+        return Seed(content=self.content)
 
 
 def create_seed(path: str | Path) -> Seed:
-    with open(Path(path), "r", encoding="utf-8") as fd:
-        return Seed(content=fd.read())
+    path = Path(path)
+    if not path.is_file():
+        raise FileNotFoundError(f"Seed file '{path}' does not exist.")
+
+    content_hash = hashlib.md5()
+    with open(path, "rb") as fd:
+        for block in iter(lambda: fd.read(SEED_HASH_BLOCK_SIZE), b""):
+            content_hash.update(block)
+    return Seed(path=str(path), content_hash=content_hash.hexdigest())
+
+
+class _HashVerifyingFile(io.RawIOBase):
+    """A seed file which verifies the hash of its content once it has been read to the end."""
+
+    def __init__(self, path: Path, content_hash: str):
+        self._path = path
+        self._content_hash = content_hash
+        self._hash = hashlib.md5()
+        self._file = open(path, "rb")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: t.Any) -> int:
+        size = self._file.readinto(buffer)
+        if size:
+            self._hash.update(memoryview(buffer)[:size])
+        elif self._hash.hexdigest() != self._content_hash:
+            raise _seed_file_changed_error(self._path)
+        return size
+
+    def close(self) -> None:
+        self._file.close()
+        super().close()
+
+
+class _ColumnHasher:
+    """Hashes each column as if the whole column was serialized to JSON at once."""
+
+    def __init__(self) -> None:
+        self._checksums: t.Dict[str, int] = {}
+        self._empty: t.Dict[str, bool] = {}
+
+    def update(self, df: pd.DataFrame, dtypes: t.Optional[t.Dict[str, t.Any]] = None) -> None:
+        for column in dtypes or df.columns:
+            column = str(column)
+            series = df[column]
+            if dtypes and series.dtype != dtypes[column]:
+                series = series.astype(dtypes[column])
+            checksum = self._checksums.get(column, zlib.crc32(b"{"))
+            values = series.to_json()[1:-1]
+            if values:
+                if not self._empty.get(column, True):
+                    values = f",{values}"
+                checksum = zlib.crc32(values.encode("utf-8"), checksum)
+                self._empty[column] = False
+            self._checksums[column] = checksum
+
+    def hashes(self) -> t.Dict[str, str]:
+        return {
+            column: str(zlib.crc32(b"}", checksum)) for column, checksum in self._checksums.items()
+        }
+
+
+def _seed_file_changed_error(path: str | Path) -> SQLMeshError:
+    return SQLMeshError(
+        f"Seed file '{path}' has changed since it was loaded. Please reload the project."
+    )
+
+
+def _common_dtype(left: t.Any, right: t.Any) -> t.Any:
+    """Returns the type a column would have been inferred as if the chunks were read at once."""
+    if left == right:
+        return left
+    if (
+        pd.api.types.is_numeric_dtype(left)
+        and pd.api.types.is_numeric_dtype(right)
+        and not pd.api.types.is_bool_dtype(left)
+        and not pd.api.types.is_bool_dtype(right)
+    ):
+        return np.result_type(left, right)
+    return np.dtype("O")
+
+
+def _is_string_column(series: pd.Series) -> bool:
+    return series.dtype == np.dtype("O") and pd.api.types.infer_dtype(series, skipna=True) in (
+        "string",
+        "empty",
+    )
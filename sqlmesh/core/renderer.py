@@ -13,7 +13,7 @@ from sqlglot.optimizer.simplify import simplify
 
 from sqlmesh.core import constants as c
 from sqlmesh.core import dialect as d
-from sqlmesh.core.macros import MacroEvaluator, RuntimeStage
+from sqlmesh.core.macros import MacroEvaluator, MacroPlan, RuntimeStage
 from sqlmesh.utils.date import TimeLike, date_dict, make_inclusive_end, to_datetime
 from sqlmesh.utils.errors import (
     ConfigError,
@@ -22,7 +22,7 @@ from sqlmesh.utils.errors import (
     SQLMeshError,
     raise_config_error,
 )
-from sqlmesh.utils.jinja import JinjaMacroRegistry
+from sqlmesh.utils.jinja import JinjaMacroRegistry, has_jinja
 from sqlmesh.utils.metaprogramming import Executable, prepare_env
 
 if t.TYPE_CHECKING:
@@ -33,6 +33,8 @@ if t.TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_DATE_PLACEHOLDER_PREFIX = "__sqlmesh_"
+
 
 class BaseExpressionRenderer:
     def __init__(
@@ -63,6 +65,7 @@ class BaseExpressionRenderer:
         self.update_schema({} if schema is None else schema)
         self._cache: t.List[t.Optional[exp.Expression]] = []
         self._model_fqn = model_fqn
+        self._macro_plan: t.Optional[MacroPlan] = None
 
     def update_schema(self, schema: t.Dict[str, t.Any]) -> None:
         self.schema = d.normalize_mapping_schema(schema, dialect=self._dialect)
@@ -117,11 +120,7 @@ class BaseExpressionRenderer:
         expressions = [self._expression]
 
         render_kwargs = {
-            **date_dict(
-                to_datetime(execution_time or c.EPOCH),
-                to_datetime(start or c.EPOCH) if not self._only_execution_time else None,
-                make_inclusive_end(end or c.EPOCH) if not self._only_execution_time else None,
-            ),
+            **self._date_variables(start, end, execution_time),
             **kwargs,
         }
 
@@ -183,7 +182,9 @@ class BaseExpressionRenderer:
 
         for expression in expressions:
             try:
-                expression = macro_evaluator.transform(expression)  # type: ignore
+                expression = macro_evaluator.transform(  # type: ignore
+                    expression, plan=self._get_macro_plan(expression)
+                )
             except MacroEvalError as ex:
                 raise_config_error(f"Failed to resolve macro for expression. {ex}", self._path)
 
@@ -213,6 +214,15 @@ class BaseExpressionRenderer:
             self._cache = resolved_expressions
         return resolved_expressions
 
+    def _get_macro_plan(self, expression: exp.Expression) -> t.Optional[MacroPlan]:
+        # Expressions rendered from Jinja are parsed on every render, so only the plan of the
+        # original expression is worth keeping.
+        if expression is not self._expression:
+            return None
+        if self._macro_plan is None:
+            self._macro_plan = MacroEvaluator.compile(expression)
+        return self._macro_plan
+
     def update_cache(self, expression: t.Optional[exp.Expression]) -> None:
         self._cache = [expression]
 
@@ -299,6 +309,18 @@ class BaseExpressionRenderer:
         else:
             yield query
 
+    def _date_variables(
+        self,
+        start: t.Optional[TimeLike],
+        end: t.Optional[TimeLike],
+        execution_time: t.Optional[TimeLike],
+    ) -> t.Dict[str, t.Any]:
+        return date_dict(
+            to_datetime(execution_time or c.EPOCH),
+            to_datetime(start or c.EPOCH) if not self._only_execution_time else None,
+            make_inclusive_end(end or c.EPOCH) if not self._only_execution_time else None,
+        )
+
     def _should_cache(self, runtime_stage: RuntimeStage, *args: t.Any) -> bool:
         return runtime_stage == RuntimeStage.LOADING and not any(args)
 
@@ -355,10 +377,16 @@ class QueryRenderer(BaseExpressionRenderer):
     def __init__(self, *args: t.Any, **kwargs: t.Any):
         super().__init__(*args, **kwargs)
         self._optimized_cache: t.Optional[exp.Query] = None
+        self._runtime_template: t.Optional[exp.Query] = None
+        self._runtime_template_failed = False
+        self._runtime_template_variables: t.Optional[t.Set[str]] = None
+        self._runtime_template_variables_found = False
 
     def update_schema(self, schema: t.Dict[str, t.Any]) -> None:
         super().update_schema(schema)
         self._optimized_cache = None
+        self._runtime_template = None
+        self._runtime_template_failed = False
 
     def render(
         self,
@@ -397,9 +425,18 @@ class QueryRenderer(BaseExpressionRenderer):
         should_cache = self._should_cache(
             runtime_stage, start, end, execution_time, *kwargs.values()
         )
+        use_runtime_template = (
+            optimize
+            and runtime_stage == RuntimeStage.EVALUATING
+            and self._supports_runtime_template(kwargs)
+        )
 
         if should_cache and self._optimized_cache and optimize:
             query = self._optimized_cache
+        elif use_runtime_template and self._runtime_template:
+            query = self._substitute_date_variables(
+                self._runtime_template, start, end, execution_time
+            )
         else:
             try:
                 expressions = super()._render(
@@ -438,6 +475,17 @@ class QueryRenderer(BaseExpressionRenderer):
 
                 if should_cache:
                     self._optimized_cache = query
+                elif use_runtime_template:
+                    self._build_runtime_template(
+                        query,
+                        start=start,
+                        end=end,
+                        execution_time=execution_time,
+                        snapshots=snapshots,
+                        table_mapping=table_mapping,
+                        deployability_index=deployability_index,
+                        **kwargs,
+                    )
 
         if optimize:
             query = self._resolve_tables(
@@ -463,6 +511,117 @@ class QueryRenderer(BaseExpressionRenderer):
         else:
             super().update_cache(expression)
 
+    def _supports_runtime_template(self, kwargs: t.Dict[str, t.Any]) -> bool:
+        if self._runtime_template_failed:
+            return False
+
+        if not self._runtime_template_variables_found:
+            self._runtime_template_variables = self._find_runtime_template_variables()
+            self._runtime_template_variables_found = True
+
+        return self._runtime_template_variables is not None and not (
+            self._runtime_template_variables & kwargs.keys()
+        )
+
+    def _find_runtime_template_variables(self) -> t.Optional[t.Set[str]]:
+        """Returns the names of date variables referenced by the query if the query can be rendered from
+        a template, ie. if date variables are the only macros it contains, or None otherwise."""
+        if isinstance(self._expression, d.Jinja) or self._macro_definitions:
+            return None
+
+        date_variables = self._date_variables(c.EPOCH, c.EPOCH, c.EPOCH)
+        variables = set()
+
+        for node in self._expression.walk():
+            if isinstance(node, d.MacroVar):
+                if node.name not in date_variables:
+                    return None
+                variables.add(node.name)
+            elif (
+                isinstance(node, d.MacroFunc)
+                or (isinstance(node, exp.Identifier) and "@" in node.this)
+                or (node.is_string and has_jinja(node.this))
+            ):
+                return None
+
+        return variables
+
+    def _build_runtime_template(
+        self,
+        query: exp.Query,
+        start: t.Optional[TimeLike] = None,
+        end: t.Optional[TimeLike] = None,
+        execution_time: t.Optional[TimeLike] = None,
+        **kwargs: t.Any,
+    ) -> None:
+        """Optimizes the query once with placeholders in place of date variables, so that subsequent
+        renders only need to substitute date literals.
+
+        The template is only used if it produces the same query as the full render for the current dates.
+        """
+        variables = self._runtime_template_variables or set()
+        sentinels = {f"{_DATE_PLACEHOLDER_PREFIX}{name}": name for name in variables}
+
+        def _to_placeholder(node: exp.Expression) -> exp.Expression:
+            if node.is_string and node.this in sentinels:
+                return exp.Placeholder(this=node.this)
+            return node
+
+        try:
+            expressions = super()._render(
+                start=start,
+                end=end,
+                execution_time=execution_time,
+                runtime_stage=RuntimeStage.EVALUATING,
+                **kwargs,
+                **{name: sentinel for sentinel, name in sentinels.items()},
+            )
+            template = expressions[0] if len(expressions) == 1 else None
+            if isinstance(template, exp.Query):
+                template = template.transform(_to_placeholder, copy=False)
+                template = self._optimize_query(
+                    template,
+                    d.find_tables(
+                        template, default_catalog=self._default_catalog, dialect=self._dialect
+                    ),
+                )
+        except Exception:
+            logger.debug(
+                "Failed to render a template for model '%s'", self._model_fqn, exc_info=True
+            )
+            template = None
+
+        if isinstance(template, exp.Query) and self._substitute_date_variables(
+            template, start, end, execution_time
+        ).sql(dialect=self._dialect) == query.sql(dialect=self._dialect):
+            self._runtime_template = template
+        else:
+            self._runtime_template_failed = True
+
+    def _substitute_date_variables(
+        self,
+        template: exp.Query,
+        start: t.Optional[TimeLike],
+        end: t.Optional[TimeLike],
+        execution_time: t.Optional[TimeLike],
+    ) -> exp.Query:
+        date_variables = self._date_variables(start, end, execution_time)
+        literals: t.Dict[str, exp.Expression] = {}
+
+        def _substitute(node: exp.Expression) -> exp.Expression:
+            if isinstance(node, exp.Placeholder) and node.name.startswith(_DATE_PLACEHOLDER_PREFIX):
+                name = node.name[len(_DATE_PLACEHOLDER_PREFIX) :]
+                if name not in literals:
+                    # Round trip through SQL so that literals match the ones produced by the macro evaluator
+                    literals[name] = exp.maybe_parse(
+                        exp.convert(date_variables[name]).sql(dialect=self._dialect),
+                        dialect=self._dialect,
+                    )
+                return literals[name].copy()
+            return node
+
+        return template.transform(_substitute)
+
     def _optimize_query(self, query: exp.Query, all_deps: t.Set[str]) -> exp.Query:
         # We don't want to normalize names in the schema because that's handled by the optimizer
         original = query
@@ -0,0 +1,178 @@
+"""
+# RunHistory
+
+Execution metrics of snapshot evaluations, like the time spent in each statement, the number of affected rows
+and the number of bytes processed by the engine, are collected by the scheduler and, when a run is profiled,
+stored in a local DuckDB database in the project's cache directory. The history can then be used to find models that dominate a run.
+"""
+
+from __future__ import annotations
+
+import json
+import typing as t
+from contextlib import contextmanager
+from pathlib import Path
+
+import pandas as pd
+from sqlglot import exp
+
+from sqlmesh.core.engine_adapter import EngineAdapter, create_engine_adapter
+from sqlmesh.core.engine_adapter.shared import ExecutionStats
+from sqlmesh.core.snapshot import SnapshotId
+from sqlmesh.utils.date import now_timestamp
+from sqlmesh.utils.pydantic import PydanticModel
+
+
+class SnapshotExecutionStats(PydanticModel):
+    """Execution metrics of a single evaluated batch of a snapshot."""
+
+    snapshot_id: SnapshotId
+    start_ts: int
+    end_ts: int
+    batch_index: int
+    duration_ms: int
+    queries: t.List[ExecutionStats] = []
+
+    @property
+    def rows_affected(self) -> t.Optional[int]:
+        return _sum_known(q.rows_affected for q in self.queries)
+
+    @property
+    def bytes_processed(self) -> t.Optional[int]:
+        return _sum_known(q.bytes_processed for q in self.queries)
+
+
+class RunHistory:
+    """Stores execution metrics of snapshot evaluations across runs in a local DuckDB database.
+
+    The database is only opened while reading or writing, so that concurrent processes can share it.
+
+    Args:
+        path: The path to the DuckDB database file.
+        max_runs: The number of most recent runs to keep. Metrics of older runs are removed whenever a new
+            run is recorded.
+    """
+
+    TABLE = "run_history"
+
+    COLUMNS_TO_TYPES = {
+        "run_id": exp.DataType.build("text"),
+        "recorded_ts": exp.DataType.build("bigint"),
+        "name": exp.DataType.build("text"),
+        "identifier": exp.DataType.build("text"),
+        "start_ts": exp.DataType.build("bigint"),
+        "end_ts": exp.DataType.build("bigint"),
+        "batch_index": exp.DataType.build("int"),
+        "duration_ms": exp.DataType.build("bigint"),
+        "rows_affected": exp.DataType.build("bigint"),
+        "bytes_processed": exp.DataType.build("bigint"),
+        "queries": exp.DataType.build("text"),
+    }
+
+    def __init__(self, path: Path, max_runs: int = 50):
+        self.path = path
+        self.max_runs = max_runs
+
+    def record(self, run_id: str, stats: t.Collection[SnapshotExecutionStats]) -> None:
+        """Stores execution metrics of batches evaluated as part of the given run.
+
+        Args:
+            run_id: The ID of the run.
+            stats: The execution metrics of evaluated batches.
+        """
+        if not stats:
+            return
+
+        recorded_ts = now_timestamp()
+        df = pd.DataFrame(
+            [
+                {
+                    "run_id": run_id,
+                    "recorded_ts": recorded_ts,
+                    "name": s.snapshot_id.name,
+                    "identifier": s.snapshot_id.identifier,
+                    "start_ts": s.start_ts,
+                    "end_ts": s.end_ts,
+                    "batch_index": s.batch_index,
+                    "duration_ms": s.duration_ms,
+                    "rows_affected": s.rows_affected,
+                    "bytes_processed": s.bytes_processed,
+                    "queries": json.dumps([q.dict() for q in s.queries]),
+                }
+                for s in stats
+            ]
+        )
+        with self._engine_adapter() as engine_adapter:
+            engine_adapter.create_table(self.TABLE, self.COLUMNS_TO_TYPES, exists=True)
+            engine_adapter.insert_append(self.TABLE, df, columns_to_types=self.COLUMNS_TO_TYPES)
+            # Only keep the most recent runs, so that the history doesn't grow indefinitely.
+            engine_adapter.delete_from(
+                self.TABLE,
+                where=exp.column("run_id").isin(
+                    query=exp.select("run_id")
+                    .from_(self.TABLE)
+                    .group_by("run_id")
+                    .order_by(exp.func("MAX", exp.column("recorded_ts")).desc(), "run_id")
+                    .offset(self.max_runs)
+                ),
+            )
+
+    def get_stats(
+        self, run_id: t.Optional[str] = None, names: t.Optional[t.Iterable[str]] = None
+    ) -> t.List[SnapshotExecutionStats]:
+        """Returns stored execution metrics in the order in which they were recorded.
+
+        Args:
+            run_id: If provided, only metrics of this run are returned.
+            names: If provided, only metrics of snapshots with these names are returned.
+
+        Returns:
+            The list of execution metrics.
+        """
+        if not self.path.exists():
+            return []
+
+        query = (
+            exp.select(
+                "name", "identifier", "start_ts", "end_ts", "batch_index", "duration_ms", "queries"
+            )
+            .from_(self.TABLE)
+            .order_by("recorded_ts", "name", "batch_index")
+        )
+        if run_id is not None:
+            query = query.where(exp.column("run_id").eq(run_id))
+        if names is not None:
+            query = query.where(exp.column("name").isin(*names))
+
+        with self._engine_adapter() as engine_adapter:
+            if not engine_adapter.table_exists(self.TABLE):
+                return []
+            rows = engine_adapter.fetchall(query)
+
+        return [
+            SnapshotExecutionStats(
+                snapshot_id=SnapshotId.trusted(name, identifier),
+                start_ts=start_ts,
+                end_ts=end_ts,
+                batch_index=batch_index,
+                duration_ms=duration_ms,
+                queries=[ExecutionStats.parse_obj(q) for q in json.loads(queries)],
+            )
+            for name, identifier, start_ts, end_ts, batch_index, duration_ms, queries in rows
+        ]
+
+    @contextmanager
+    def _engine_adapter(self) -> t.Iterator[EngineAdapter]:
+        import duckdb
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        engine_adapter = create_engine_adapter(lambda: duckdb.connect(str(self.path)), "duckdb")
+        try:
+            yield engine_adapter
+        finally:
+            engine_adapter.close()
+
+
+def _sum_known(values: t.Iterable[t.Optional[int]]) -> t.Optional[int]:
+    known = [v for v in values if v is not None]
+    return sum(known) if known else None
@@ -3,16 +3,21 @@ from __future__ import annotations
 import logging
 import traceback
 import typing as t
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 
 from sqlmesh.core import constants as c
+from sqlmesh.core.audit import AuditResult
 from sqlmesh.core.console import Console, get_console
+from sqlmesh.core.engine_adapter.shared import ExecutionStats
 from sqlmesh.core.environment import EnvironmentNamingInfo
 from sqlmesh.core.model import SeedModel
 from sqlmesh.core.notification_target import (
     NotificationEvent,
     NotificationTargetManager,
 )
+from sqlmesh.core.run_history import RunHistory, SnapshotExecutionStats
 from sqlmesh.core.snapshot import (
     DeployabilityIndex,
     Snapshot,
@@ -23,14 +28,20 @@ from sqlmesh.core.snapshot import (
 from sqlmesh.core.snapshot.definition import Interval as SnapshotInterval
 from sqlmesh.core.snapshot.definition import SnapshotId
 from sqlmesh.core.state_sync import StateSync
-from sqlmesh.utils import format_exception
-from sqlmesh.utils.concurrency import concurrent_apply_to_dag
+from sqlmesh.utils import format_exception, random_id
+from sqlmesh.utils.concurrency import (
+    NodeExecutionFailedError,
+    async_apply_to_dag,
+    concurrent_apply_to_dag,
+    run_coroutine,
+)
 from sqlmesh.utils.dag import DAG
 from sqlmesh.utils.date import (
     TimeLike,
     now,
     now_timestamp,
     to_datetime,
+    to_timestamp,
     validate_date_range,
 )
 from sqlmesh.utils.errors import AuditError, CircuitBreakerError, SQLMeshError
@@ -51,16 +62,23 @@ class Scheduler:
     topological order. It consults the state sync to understand what intervals for each
     snapshot needs to be backfilled.
 
-    The scheduler comes equipped with a simple ThreadPoolExecutor based evaluation engine.
+    The scheduler comes equipped with a simple ThreadPoolExecutor based evaluation engine. If the engine supports
+    asynchronous queries, statements are instead submitted to the engine and awaited from a single event loop,
+    so that up to `max_workers` snapshots can be evaluated at the same time without holding a thread each.
 
     Args:
         snapshots: A collection of snapshots.
         snapshot_evaluator: The snapshot evaluator to execute queries.
         state_sync: The state sync to pull saved snapshots.
-        max_workers: The maximum number of parallel queries to run.
+        max_workers: The maximum number of snapshots that are evaluated at the same time.
         console: The rich instance used for printing scheduling information.
+        notification_target_manager: The manager of notification targets.
+        run_history: The history to which execution metrics of evaluated batches are stored when profiling.
     """
 
+    # The maximum number of threads used alongside the event loop when statements are awaited asynchronously.
+    MAX_ASYNC_THREADS = 16
+
     def __init__(
         self,
         snapshots: t.Iterable[Snapshot],
@@ -70,6 +88,7 @@ class Scheduler:
         max_workers: int = 1,
         console: t.Optional[Console] = None,
         notification_target_manager: t.Optional[NotificationTargetManager] = None,
+        run_history: t.Optional[RunHistory] = None,
     ):
         self.state_sync = state_sync
         self.snapshots = {s.snapshot_id: s for s in snapshots}
@@ -81,6 +100,7 @@ class Scheduler:
         self.notification_target_manager = (
             notification_target_manager or NotificationTargetManager()
         )
+        self.run_history = run_history
 
     def batches(
         self,
@@ -142,10 +162,14 @@ class Scheduler:
         execution_time: TimeLike,
         deployability_index: DeployabilityIndex,
         batch_index: int,
+        audit_executor: t.Optional[Executor] = None,
         **kwargs: t.Any,
-    ) -> None:
+    ) -> t.Optional[Future]:
         """Evaluate a snapshot and add the processed interval to the state sync.
 
+        If an audit executor is provided, the snapshot's non-blocking audits are submitted to it instead of
+        being executed inline, since their outcome doesn't affect the evaluation of downstream snapshots.
+
         Args:
             snapshot: Snapshot to evaluate.
             start: The start datetime to render.
@@ -153,10 +177,104 @@ class Scheduler:
             execution_time: The date/time time reference to use for execution time. Defaults to now.
             deployability_index: Determines snapshots that are deployable in the context of this evaluation.
             batch_index: If the snapshot is part of a batch of related snapshots; which index in the batch is it
+            audit_executor: An optional executor used to run the non-blocking audits asynchronously.
             kwargs: Additional kwargs to pass to the renderer.
+
+        Returns:
+            The future of the non-blocking audits if they were submitted to the audit executor, None otherwise.
         """
         validate_date_range(start, end)
 
+        snapshot, snapshots = self._prepare_evaluation(snapshot)
+        wap_id = self.snapshot_evaluator.evaluate(
+            snapshot,
+            start=start,
+            end=end,
+            execution_time=execution_time,
+            snapshots=snapshots,
+            deployability_index=deployability_index,
+            batch_index=batch_index,
+            on_retry=self._on_evaluation_retry(snapshot, batch_index),
+            **kwargs,
+        )
+        return self._complete_evaluation(
+            snapshot,
+            start,
+            end,
+            execution_time,
+            snapshots,
+            deployability_index,
+            wap_id,
+            audit_executor=audit_executor,
+            **kwargs,
+        )
+
+    async def evaluate_async(
+        self,
+        snapshot: Snapshot,
+        start: TimeLike,
+        end: TimeLike,
+        execution_time: TimeLike,
+        deployability_index: DeployabilityIndex,
+        batch_index: int,
+        executor: Executor,
+        audit_executor: t.Optional[Executor] = None,
+        **kwargs: t.Any,
+    ) -> t.Optional[Future]:
+        """Same as `evaluate`, but waits for the snapshot's statements without blocking the running event loop.
+
+        Everything besides the execution of the snapshot's statements, like fetching the snapshot's seed,
+        running its audits and adding the processed interval, happens in a thread of the given executor.
+
+        Args:
+            snapshot: Snapshot to evaluate.
+            start: The start datetime to render.
+            end: The end datetime to render.
+            execution_time: The date/time time reference to use for execution time. Defaults to now.
+            deployability_index: Determines snapshots that are deployable in the context of this evaluation.
+            batch_index: If the snapshot is part of a batch of related snapshots; which index in the batch is it
+            executor: The executor whose threads prepare the evaluation and complete it once its statements ran.
+            audit_executor: An optional executor used to run the non-blocking audits asynchronously.
+            kwargs: Additional kwargs to pass to the renderer.
+
+        Returns:
+            The future of the non-blocking audits if they were submitted to the audit executor, None otherwise.
+        """
+        validate_date_range(start, end)
+
+        snapshot, snapshots = await self.snapshot_evaluator.run_in_executor(
+            executor, partial(self._prepare_evaluation, snapshot)
+        )
+        wap_id = await self.snapshot_evaluator.evaluate_async(
+            snapshot,
+            start=start,
+            end=end,
+            execution_time=execution_time,
+            snapshots=snapshots,
+            deployability_index=deployability_index,
+            batch_index=batch_index,
+            on_retry=self._on_evaluation_retry(snapshot, batch_index),
+            executor=executor,
+            **kwargs,
+        )
+        return await self.snapshot_evaluator.run_in_executor(
+            executor,
+            partial(
+                self._complete_evaluation,
+                snapshot,
+                start,
+                end,
+                execution_time,
+                snapshots,
+                deployability_index,
+                wap_id,
+                audit_executor=audit_executor,
+                **kwargs,
+            ),
+        )
+
+    def _prepare_evaluation(self, snapshot: Snapshot) -> t.Tuple[Snapshot, t.Dict[str, Snapshot]]:
+        """Returns the snapshot with its seed hydrated, along with its parents and itself by name."""
         snapshots = {
             self.snapshots[p_sid].name: self.snapshots[p_sid] for p_sid in snapshot.parents
         }
@@ -166,29 +284,49 @@ class Scheduler:
             snapshot = self.state_sync.get_snapshots([snapshot], hydrate_seeds=True)[
                 snapshot.snapshot_id
             ]
+        return snapshot, snapshots
 
-        is_deployable = deployability_index.is_deployable(snapshot)
+    def _on_evaluation_retry(
+        self, snapshot: Snapshot, batch_index: int
+    ) -> t.Callable[[int, Exception], None]:
+        return lambda attempt, error: self.console.log_snapshot_evaluation_retry(
+            snapshot, batch_index, attempt, error
+        )
 
-        wap_id = self.snapshot_evaluator.evaluate(
-            snapshot,
+    def _complete_evaluation(
+        self,
+        snapshot: Snapshot,
+        start: TimeLike,
+        end: TimeLike,
+        execution_time: TimeLike,
+        snapshots: t.Dict[str, Snapshot],
+        deployability_index: DeployabilityIndex,
+        wap_id: t.Optional[str],
+        audit_executor: t.Optional[Executor] = None,
+        **kwargs: t.Any,
+    ) -> t.Optional[Future]:
+        """Audits an evaluated snapshot and adds the processed interval to the state sync."""
+        is_deployable = deployability_index.is_deployable(snapshot)
+        audit_kwargs: t.Dict[str, t.Any] = dict(
+            snapshot=snapshot,
             start=start,
             end=end,
             execution_time=execution_time,
             snapshots=snapshots,
             deployability_index=deployability_index,
-            batch_index=batch_index,
+            wap_id=wap_id,
             **kwargs,
         )
+        # The WAP table is only available until the evaluation results are published
+        defer_non_blocking_audits = (
+            audit_executor is not None
+            and wap_id is None
+            and any(not audit.blocking for audit, _ in snapshot.audits_with_args)
+        )
+
         try:
             self.snapshot_evaluator.audit(
-                snapshot=snapshot,
-                start=start,
-                end=end,
-                execution_time=execution_time,
-                snapshots=snapshots,
-                deployability_index=deployability_index,
-                wap_id=wap_id,
-                **kwargs,
+                **audit_kwargs, blocking=True if defer_non_blocking_audits else None
             )
         except AuditError as e:
             self.notification_target_manager.notify(NotificationEvent.AUDIT_FAILURE, e)
@@ -201,6 +339,18 @@ class Scheduler:
 
         self.state_sync.add_interval(snapshot, start, end, is_dev=not is_deployable)
 
+        if defer_non_blocking_audits:
+            assert audit_executor  # mypy
+
+            def _audit_non_blocking() -> t.List[AuditResult]:
+                try:
+                    return self.snapshot_evaluator.audit(**audit_kwargs, blocking=False)
+                finally:
+                    self.snapshot_evaluator.adapter.release()
+
+            return audit_executor.submit(_audit_non_blocking)
+        return None
+
     def run(
         self,
         environment: str | EnvironmentNamingInfo,
@@ -213,6 +363,7 @@ class Scheduler:
         selected_snapshots: t.Optional[t.Set[str]] = None,
         circuit_breaker: t.Optional[t.Callable[[], bool]] = None,
         deployability_index: t.Optional[DeployabilityIndex] = None,
+        profile: bool = False,
     ) -> bool:
         """Concurrently runs all snapshots in topological order.
 
@@ -230,6 +381,8 @@ class Scheduler:
             selected_snapshots: A set of snapshot names to run. If not provided, all snapshots will be run.
             circuit_breaker: An optional handler which checks if the run should be aborted.
             deployability_index: Determines snapshots that are deployable in the context of this render.
+            profile: Whether to display a report of the time, rows and bytes spent on each snapshot after the run
+                and store these metrics in the run history.
 
         Returns:
             True if the execution was successful and False otherwise.
@@ -275,26 +428,118 @@ class Scheduler:
         )
 
         snapshots_by_name = {snapshot.name: snapshot for snapshot in self.snapshots.values()}
+        execution_stats: t.List[SnapshotExecutionStats] = []
 
-        def evaluate_node(node: SchedulingUnit) -> None:
+        # Non-blocking audits run off the critical path when snapshots are evaluated concurrently
+        audit_executor = (
+            ThreadPoolExecutor(max_workers=self._max_audit_workers)
+            if self.max_workers > 1
+            else None
+        )
+        audit_futures: t.List[t.Tuple[SchedulingUnit, Future]] = []
+
+        # Statements are awaited from a single event loop if the engine supports asynchronous queries, in which
+        # case threads only prepare evaluations and complete them once their statements ran.
+        async_executor = (
+            ThreadPoolExecutor(max_workers=self._max_async_threads)
+            if self._use_async_queries
+            else None
+        )
+
+        def start_node(node: SchedulingUnit) -> t.Optional[Snapshot]:
             if circuit_breaker and circuit_breaker():
                 raise CircuitBreakerError()
 
-            snapshot_name, ((start, end), batch_idx) = node
+            snapshot_name, (_, batch_idx) = node
             if batch_idx == -1:
-                return
+                return None
             snapshot = snapshots_by_name[snapshot_name]
 
             self.console.start_snapshot_evaluation_progress(snapshot)
+            return snapshot
+
+        def complete_node(
+            node: SchedulingUnit,
+            snapshot: Snapshot,
+            execution_start_ts: int,
+            query_stats: t.List[ExecutionStats],
+            audit_future: t.Optional[Future],
+        ) -> int:
+            _, ((start, end), batch_idx) = node
+            if audit_future:
+                audit_futures.append((node, audit_future))
+            evaluation_duration_ms = now_timestamp() - execution_start_ts
+            execution_stats.append(
+                SnapshotExecutionStats(
+                    snapshot_id=snapshot.snapshot_id,
+                    start_ts=to_timestamp(start),
+                    end_ts=to_timestamp(end),
+                    batch_index=batch_idx,
+                    duration_ms=evaluation_duration_ms,
+                    queries=list(query_stats),
+                )
+            )
+            return evaluation_duration_ms
 
+        def evaluate_node(node: SchedulingUnit) -> None:
+            snapshot = start_node(node)
+            if not snapshot:
+                return
+
+            _, ((start, end), batch_idx) = node
             execution_start_ts = now_timestamp()
             evaluation_duration_ms: t.Optional[int] = None
 
             try:
                 assert execution_time  # mypy
                 assert deployability_index  # mypy
-                self.evaluate(snapshot, start, end, execution_time, deployability_index, batch_idx)
-                evaluation_duration_ms = now_timestamp() - execution_start_ts
+                with self.snapshot_evaluator.adapter.track_execution_stats() as query_stats:
+                    audit_future = self.evaluate(
+                        snapshot,
+                        start,
+                        end,
+                        execution_time,
+                        deployability_index,
+                        batch_idx,
+                        audit_executor=audit_executor,
+                    )
+                evaluation_duration_ms = complete_node(
+                    node, snapshot, execution_start_ts, query_stats, audit_future
+                )
+            finally:
+                # Let the connection of this worker be reused by other workers in the meantime
+                self.snapshot_evaluator.adapter.release()
+                self.console.update_snapshot_evaluation_progress(
+                    snapshot, batch_idx, evaluation_duration_ms
+                )
+
+        async def evaluate_node_async(node: SchedulingUnit) -> None:
+            snapshot = start_node(node)
+            if not snapshot:
+                return
+
+            _, ((start, end), batch_idx) = node
+            execution_start_ts = now_timestamp()
+            evaluation_duration_ms: t.Optional[int] = None
+
+            try:
+                assert execution_time  # mypy
+                assert deployability_index  # mypy
+                assert async_executor  # mypy
+                with self.snapshot_evaluator.adapter.track_execution_stats() as query_stats:
+                    audit_future = await self.evaluate_async(
+                        snapshot,
+                        start,
+                        end,
+                        execution_time,
+                        deployability_index,
+                        batch_idx,
+                        executor=async_executor,
+                        audit_executor=audit_executor,
+                    )
+                evaluation_duration_ms = complete_node(
+                    node, snapshot, execution_start_ts, query_stats, audit_future
+                )
             finally:
                 self.console.update_snapshot_evaluation_progress(
                     snapshot, batch_idx, evaluation_duration_ms
@@ -302,17 +547,49 @@ class Scheduler:
 
         try:
             with self.snapshot_evaluator.concurrent_context():
-                errors, skipped_intervals = concurrent_apply_to_dag(
-                    dag,
-                    evaluate_node,
-                    self.max_workers,
-                    raise_on_error=False,
-                )
+                try:
+                    if async_executor:
+                        errors, skipped_intervals = run_coroutine(
+                            async_apply_to_dag(
+                                dag,
+                                evaluate_node_async,
+                                self.max_workers,
+                                raise_on_error=False,
+                            )
+                        )
+                    else:
+                        errors, skipped_intervals = concurrent_apply_to_dag(
+                            dag,
+                            evaluate_node,
+                            self.max_workers,
+                            raise_on_error=False,
+                        )
+                finally:
+                    if async_executor:
+                        async_executor.shutdown()
+                    if audit_executor:
+                        audit_executor.shutdown()
+
+                for node, audit_future in audit_futures:
+                    audit_exception = audit_future.exception()
+                    if audit_exception:
+                        error = NodeExecutionFailedError(node)
+                        error.__cause__ = audit_exception
+                        errors.append(error)
         finally:
             self.state_sync.recycle()
 
         self.console.stop_evaluation_progress(success=not errors)
 
+        if profile and self.run_history:
+            try:
+                self.run_history.record(random_id(), execution_stats)
+            except Exception:
+                logger.warning("Failed to store the run history", exc_info=True)
+
+        if profile:
+            self.console.show_run_profile(execution_stats)
+
         skipped_snapshots = {i[0] for i in skipped_intervals}
         for skipped in skipped_snapshots:
             log_message = f"SKIPPED snapshot {skipped}\n"
@@ -331,6 +608,34 @@ class Scheduler:
 
         return not errors
 
+    @property
+    def _use_async_queries(self) -> bool:
+        return self.snapshot_evaluator.adapter.SUPPORTS_ASYNC_QUERIES and self.max_workers > 1
+
+    @property
+    def _max_async_threads(self) -> int:
+        """The number of threads that prepare and complete evaluations whose statements are awaited asynchronously.
+
+        Unlike `max_workers`, which bounds the number of evaluations in flight, this bounds the number of
+        connections that are opened to render models, run audits and fetch data.
+        """
+        adapter = self.snapshot_evaluator.adapter
+        if not adapter.supports_concurrent_queries:
+            return 1
+        return min(self.max_workers, adapter.connection_pool_size or self.MAX_ASYNC_THREADS)
+
+    @property
+    def _max_audit_workers(self) -> int:
+        """The number of threads that run deferred non-blocking audits.
+
+        Evaluation workers can hold up to `max_workers` connections of a bounded connection pool at the same
+        time, so audits only get the connections that remain.
+        """
+        pool_size = self.snapshot_evaluator.adapter.connection_pool_size
+        if pool_size is None:
+            return self.max_workers
+        return max(min(self.max_workers, pool_size - self.max_workers), 1)
+
     def _dag(self, batches: SnapshotToBatches) -> DAG[SchedulingUnit]:
         """Builds a DAG of snapshot intervals to be evaluated.
 
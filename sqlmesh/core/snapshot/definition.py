@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import sys
 import typing as t
+import weakref
 from collections import defaultdict
 from datetime import datetime, timedelta
 from enum import IntEnum
@@ -35,7 +36,7 @@ from sqlmesh.utils.date import (
 )
 from sqlmesh.utils.errors import SQLMeshError
 from sqlmesh.utils.hashing import hash_data
-from sqlmesh.utils.pydantic import PydanticModel, field_validator
+from sqlmesh.utils.pydantic import PydanticModel, construct_trusted, field_validator
 
 if sys.version_info >= (3, 9):
     from typing import Annotated
@@ -99,9 +100,17 @@ class SnapshotFingerprint(PydanticModel, frozen=True):
     parent_metadata_hash: str = "0"
 
     def to_version(self) -> str:
-        return hash_data([self.data_hash, self.parent_data_hash])
+        return self._version
 
     def to_identifier(self) -> str:
+        return self._identifier
+
+    @cached_property
+    def _version(self) -> str:
+        return hash_data([self.data_hash, self.parent_data_hash])
+
+    @cached_property
+    def _identifier(self) -> str:
         return hash_data(
             [
                 self.data_hash,
@@ -119,19 +128,33 @@ class SnapshotId(PydanticModel, frozen=True):
     name: str
     identifier: str
 
+    @classmethod
+    def trusted(cls, name: str, identifier: str) -> SnapshotId:
+        """Returns a shared snapshot ID instance for the given name and identifier."""
+        key = (name, identifier)
+        snapshot_id = _interned_snapshot_ids.get(key)
+        if snapshot_id is None:
+            snapshot_id = cls(name=sys.intern(name), identifier=identifier)
+            _interned_snapshot_ids[key] = snapshot_id
+        return snapshot_id
+
     @property
     def snapshot_id(self) -> SnapshotId:
         """Helper method to return self."""
         return self
 
     def __eq__(self, other: t.Any) -> bool:
-        return (
+        return self is other or (
             isinstance(other, self.__class__)
             and self.name == other.name
             and self.identifier == other.identifier
         )
 
     def __hash__(self) -> int:
+        return self._hash
+
+    @cached_property
+    def _hash(self) -> int:
         return hash((self.__class__, self.name, self.identifier))
 
     def __lt__(self, other: SnapshotId) -> bool:
@@ -145,11 +168,45 @@ class SnapshotNameVersion(PydanticModel, frozen=True):
     name: str
     version: str
 
+    @classmethod
+    def trusted(cls, name: str, version: str) -> SnapshotNameVersion:
+        """Returns a shared snapshot name and version instance for the given name and version."""
+        key = (name, version)
+        name_version = _interned_name_versions.get(key)
+        if name_version is None:
+            name_version = cls(name=sys.intern(name), version=version)
+            _interned_name_versions[key] = name_version
+        return name_version
+
     @property
     def name_version(self) -> SnapshotNameVersion:
         """Helper method to return self."""
         return self
 
+    def __eq__(self, other: t.Any) -> bool:
+        return self is other or (
+            isinstance(other, self.__class__)
+            and self.name == other.name
+            and self.version == other.version
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    @cached_property
+    def _hash(self) -> int:
+        return hash((self.__class__, self.name, self.version))
+
+
+# Identity objects are created over and over again from the same snapshots. Sharing instances saves
+# memory and lets hashes be computed only once, while weak references allow unused ones to be collected.
+_interned_snapshot_ids: weakref.WeakValueDictionary[t.Tuple[str, str], SnapshotId] = (
+    weakref.WeakValueDictionary()
+)
+_interned_name_versions: weakref.WeakValueDictionary[t.Tuple[str, str], SnapshotNameVersion] = (
+    weakref.WeakValueDictionary()
+)
+
 
 class SnapshotIntervals(PydanticModel, frozen=True):
     name: str
@@ -160,11 +217,11 @@ class SnapshotIntervals(PydanticModel, frozen=True):
 
     @property
     def snapshot_id(self) -> SnapshotId:
-        return SnapshotId(name=self.name, identifier=self.identifier)
+        return SnapshotId.trusted(self.name, self.identifier)
 
     @property
     def name_version(self) -> SnapshotNameVersion:
-        return SnapshotNameVersion(name=self.name, version=self.version)
+        return SnapshotNameVersion.trusted(self.name, self.version)
 
 
 class SnapshotDataVersion(PydanticModel, frozen=True):
@@ -175,7 +232,7 @@ class SnapshotDataVersion(PydanticModel, frozen=True):
     physical_schema_: t.Optional[str] = Field(default=None, alias="physical_schema")
 
     def snapshot_id(self, name: str) -> SnapshotId:
-        return SnapshotId(name=name, identifier=self.fingerprint.to_identifier())
+        return SnapshotId.trusted(name, self.fingerprint.to_identifier())
 
     @property
     def physical_schema(self) -> str:
@@ -248,7 +305,7 @@ class SnapshotInfoMixin(ModelKindMixin):
 
     @property
     def snapshot_id(self) -> SnapshotId:
-        return SnapshotId(name=self.name, identifier=self.identifier)
+        return SnapshotId.trusted(self.name, self.identifier)
 
     @property
     def qualified_view_name(self) -> QualifiedViewName:
@@ -421,7 +478,7 @@ class SnapshotTableInfo(PydanticModel, SnapshotInfoMixin, frozen=True):
     @property
     def name_version(self) -> SnapshotNameVersion:
         """Returns the name and version of the snapshot."""
-        return SnapshotNameVersion(name=self.name, version=self.version)
+        return SnapshotNameVersion.trusted(self.name, self.version)
 
 
 class Snapshot(PydanticModel, SnapshotInfoMixin):
@@ -593,9 +650,9 @@ class Snapshot(PydanticModel, SnapshotInfoMixin):
             ),
             node=node,
             parents=tuple(
-                SnapshotId(
-                    name=parent_node.fqn,
-                    identifier=fingerprint_from_node(
+                SnapshotId.trusted(
+                    parent_node.fqn,
+                    fingerprint_from_node(
                         parent_node,
                         nodes=nodes,
                         audits=audits,
@@ -1178,6 +1235,9 @@ class DeployabilityIndex(PydanticModel, frozen=True):
         return self._add_snapshot(snapshot, True)
 
     def _add_snapshot(self, snapshot: SnapshotIdLike, deployable: bool) -> DeployabilityIndex:
+        if self.is_deployable(snapshot) == deployable:
+            return self
+
         snapshot_id = {self._snapshot_id_key(snapshot.snapshot_id)}
         indexed_ids = self.indexed_ids
         if self.is_opposite_index:
@@ -1185,7 +1245,8 @@ class DeployabilityIndex(PydanticModel, frozen=True):
         else:
             indexed_ids = indexed_ids | snapshot_id if deployable else indexed_ids - snapshot_id
 
-        return DeployabilityIndex(
+        return construct_trusted(
+            DeployabilityIndex,
             indexed_ids=indexed_ids,
             is_opposite_index=self.is_opposite_index,
             representative_shared_version_ids=self.representative_shared_version_ids,
@@ -1205,65 +1266,82 @@ class DeployabilityIndex(PydanticModel, frozen=True):
     ) -> DeployabilityIndex:
         if not isinstance(snapshots, dict):
             snapshots = {s.snapshot_id: s for s in snapshots}
-        dag = snapshots_to_dag(snapshots.values())
-        reversed_dag = dag.reversed.graph
 
-        deployability_mapping: t.Dict[SnapshotId, bool] = {}
-        representative_shared_version_ids: t.Set[SnapshotId] = set()
-
-        def _visit(node: SnapshotId, deployable: bool = True) -> None:
-            if deployability_mapping.get(node) in (False, deployable) and (
-                deployable or node not in representative_shared_version_ids
-            ):
-                return
-
-            if deployable and node in snapshots:
-                snapshot = snapshots[node]
+        # A snapshot is deployable only if all of its parents let their children be deployable.
+        # Parents that are not part of the given snapshots never do.
+        children_deployable: t.Dict[SnapshotId, bool] = {}
+        deployable_ids: t.Set[str] = set()
+        non_deployable_ids: t.Set[str] = set()
+        representative_shared_version_ids: t.Set[str] = set()
+
+        # Snapshots are visited in topological order using an explicit stack, since the DAG can
+        # be deeper than the recursion limit.
+        for snapshot_id in snapshots:
+            stack = [snapshot_id]
+            visiting: t.Set[SnapshotId] = set()
+            while stack:
+                node = stack[-1]
+                if node in children_deployable:
+                    stack.pop()
+                    continue
+
+                snapshot = snapshots.get(node)
+                if snapshot is None:
+                    children_deployable[node] = False
+                    stack.pop()
+                    continue
+
+                pending = [p for p in snapshot.parents if p not in children_deployable]
+                if pending:
+                    if node in visiting:
+                        raise SQLMeshError(f"Detected a cycle in the DAG at snapshot {node}.")
+                    visiting.add(node)
+                    stack.extend(pending)
+                    continue
+
+                stack.pop()
+                visiting.discard(node)
+
+                parents_deployable = all(children_deployable[p] for p in snapshot.parents)
                 # Capture uncategorized snapshot which represents a forward-only model.
                 is_forward_only_model = (
                     snapshot.previous_versions and snapshot.is_model and snapshot.model.forward_only
                 )
+                key = cls._snapshot_id_key(node)
                 if (
                     snapshot.is_forward_only
                     or snapshot.is_indirect_non_breaking
                     or is_forward_only_model
                 ):
                     # FORWARD_ONLY and INDIRECT_NON_BREAKING snapshots are not deployable by nature.
-                    this_deployable = False
-                    if not snapshot.is_paused or snapshot.is_indirect_non_breaking:
+                    non_deployable_ids.add(key)
+                    if parents_deployable and (
+                        not snapshot.is_paused or snapshot.is_indirect_non_breaking
+                    ):
                         # This snapshot represents what's currently deployed in prod.
-                        representative_shared_version_ids.add(node)
+                        representative_shared_version_ids.add(key)
+                elif parents_deployable:
+                    deployable_ids.add(key)
                 else:
-                    this_deployable = True
-                children_deployable = not (
+                    non_deployable_ids.add(key)
+
+                children_deployable[node] = parents_deployable and not (
                     snapshot.is_paused and (snapshot.is_forward_only or is_forward_only_model)
                 )
-            else:
-                this_deployable, children_deployable = False, False
-                representative_shared_version_ids.discard(node)
-
-            deployability_mapping[node] = deployability_mapping.get(node, True) and this_deployable
-            for child in reversed_dag[node]:
-                _visit(child, children_deployable)
-
-        for node in dag.roots:
-            _visit(node)
-
-        deployable_ids = {
-            snapshot_id for snapshot_id, deployable in deployability_mapping.items() if deployable
-        }
-        non_deployable_ids = set(snapshots) - deployable_ids
 
         # Pick the smaller set to reduce the size of the serialized object.
         if len(deployable_ids) <= len(non_deployable_ids):
-            return cls(
-                indexed_ids=deployable_ids,
-                representative_shared_version_ids=representative_shared_version_ids,
+            return construct_trusted(
+                cls,
+                indexed_ids=frozenset(deployable_ids),
+                is_opposite_index=False,
+                representative_shared_version_ids=frozenset(representative_shared_version_ids),
             )
-        return cls(
-            indexed_ids=non_deployable_ids,
+        return construct_trusted(
+            cls,
+            indexed_ids=frozenset(non_deployable_ids),
             is_opposite_index=True,
-            representative_shared_version_ids=representative_shared_version_ids,
+            representative_shared_version_ids=frozenset(representative_shared_version_ids),
         )
 
     @staticmethod
@@ -1322,6 +1400,7 @@ def fingerprint_from_node(
     nodes: t.Dict[str, Node],
     audits: t.Optional[t.Dict[str, ModelAudit]] = None,
     cache: t.Optional[t.Dict[str, SnapshotFingerprint]] = None,
+    node_hashes: t.Optional[t.Dict[str, t.Tuple[str, str]]] = None,
 ) -> SnapshotFingerprint:
     """Helper function to generate a fingerprint based on the data and metadata of the node and its parents.
 
@@ -1335,36 +1414,58 @@ def fingerprint_from_node(
             If no dictionary is passed in the fingerprint will not be dependent on a node's parents.
         audits: Available audits by name.
         cache: Cache of node name to fingerprints.
+        node_hashes: Precomputed data and metadata hashes of nodes by name.
 
     Returns:
         The fingerprint.
     """
     cache = {} if cache is None else cache
+    node_hashes = node_hashes or {}
 
     if node.fqn not in cache:
-        parents = [
-            fingerprint_from_node(
-                nodes[table],
-                nodes=nodes,
-                audits=audits,
-                cache=cache,
-            )
-            for table in node.depends_on
-            if table in nodes
-        ]
+        # Fingerprint ancestors in topological order instead of recursively, so that deep
+        # DAGs don't exceed the recursion limit.
+        dag: DAG[str] = DAG()
+        visited = set()
+        queue = [node.fqn]
+        while queue:
+            fqn = queue.pop()
+            if fqn in visited:
+                continue
+            visited.add(fqn)
+            parents = {
+                parent
+                for parent in (node if fqn == node.fqn else nodes[fqn]).depends_on
+                if parent in nodes and parent not in cache
+            }
+            dag.add(fqn, parents)
+            queue.extend(parents)
 
-        parent_data_hash = hash_data(sorted(p.to_version() for p in parents))
+        for fqn in dag.sorted:
+            current = node if fqn == node.fqn else nodes[fqn]
+            parent_fingerprints = [cache[table] for table in current.depends_on if table in nodes]
 
-        parent_metadata_hash = hash_data(
-            sorted(h for p in parents for h in (p.metadata_hash, p.parent_metadata_hash))
-        )
+            parent_data_hash = hash_data(sorted(p.to_version() for p in parent_fingerprints))
 
-        cache[node.fqn] = SnapshotFingerprint(
-            data_hash=node.data_hash,
-            metadata_hash=node.metadata_hash(audits or {}),
-            parent_data_hash=parent_data_hash,
-            parent_metadata_hash=parent_metadata_hash,
-        )
+            parent_metadata_hash = hash_data(
+                sorted(
+                    h
+                    for p in parent_fingerprints
+                    for h in (p.metadata_hash, p.parent_metadata_hash)
+                )
+            )
+
+            if fqn in node_hashes:
+                data_hash, metadata_hash = node_hashes[fqn]
+            else:
+                data_hash, metadata_hash = current.data_hash, current.metadata_hash(audits or {})
+
+            cache[fqn] = SnapshotFingerprint(
+                data_hash=data_hash,
+                metadata_hash=metadata_hash,
+                parent_data_hash=parent_data_hash,
+                parent_metadata_hash=parent_metadata_hash,
+            )
 
     return cache[node.fqn]
 
@@ -23,16 +23,22 @@ For more information about audits, see `sqlmesh.core.audit`.
 from __future__ import annotations
 
 import abc
+import asyncio
+import contextvars
 import logging
+import random
+import time
 import typing as t
 from collections import defaultdict
+from concurrent.futures import Executor
 from contextlib import contextmanager
-from functools import reduce
+from functools import partial, reduce
 
 import pandas as pd
 from sqlglot import exp, select
 from sqlglot.executor import execute
 
+from sqlmesh.core import analytics
 from sqlmesh.core import constants as c
 from sqlmesh.core import dialect as d
 from sqlmesh.core.audit import Audit, AuditResult
@@ -41,6 +47,7 @@ from sqlmesh.core.engine_adapter import EngineAdapter
 from sqlmesh.core.engine_adapter.shared import InsertOverwriteStrategy
 from sqlmesh.core.macros import RuntimeStage
 from sqlmesh.core.model import (
+    IncrementalByUniqueKeyKind,
     IncrementalUnmanagedKind,
     Model,
     SCDType2ByColumnKind,
@@ -72,6 +79,9 @@ if t.TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+A = t.TypeVar("A")
+R = t.TypeVar("R")
+
 
 class SnapshotEvaluator:
     """Evaluates a snapshot given runtime arguments through an arbitrary EngineAdapter.
@@ -84,11 +94,23 @@ class SnapshotEvaluator:
         adapter: The adapter that interfaces with the execution engine.
         ddl_concurrent_tasks: The number of concurrent tasks used for DDL
             operations (table / view creation, deletion, etc). Default: 1.
+        retries: The number of times a batch is retried if its evaluation failed due to a transient error,
+            like a dropped connection or a conflict with a concurrent write. Only batches of snapshots whose
+            evaluation strategy is idempotent are retried. Default: 1.
     """
 
-    def __init__(self, adapter: EngineAdapter, ddl_concurrent_tasks: int = 1):
+    RETRY_BACKOFF_SEC = 1.0
+    RETRY_MAX_BACKOFF_SEC = 60.0
+
+    def __init__(
+        self,
+        adapter: EngineAdapter,
+        ddl_concurrent_tasks: int = 1,
+        retries: int = 1,
+    ):
         self.adapter = adapter
         self.ddl_concurrent_tasks = ddl_concurrent_tasks
+        self.retries = retries
 
     def evaluate(
         self,
@@ -100,6 +122,7 @@ class SnapshotEvaluator:
         snapshots: t.Dict[str, Snapshot],
         deployability_index: t.Optional[DeployabilityIndex] = None,
         batch_index: int = 0,
+        on_retry: t.Optional[t.Callable[[int, Exception], None]] = None,
         **kwargs: t.Any,
     ) -> t.Optional[str]:
         """Renders the snapshot's model, executes it and stores the result in the snapshot's physical table.
@@ -112,26 +135,121 @@ class SnapshotEvaluator:
             snapshots: All upstream snapshots (by name) to use for expansion and mapping of physical locations.
             deployability_index: Determines snapshots that are deployable in the context of this evaluation.
             batch_index: If the snapshot is part of a batch of related snapshots; which index in the batch is it
+            on_retry: A callback invoked with the attempt number and the error before the evaluation is retried.
             kwargs: Additional kwargs to pass to the renderer.
 
         Returns:
             The WAP ID of this evaluation if supported, None otherwise.
         """
-        result = self._evaluate_snapshot(
-            snapshot,
-            start,
-            end,
-            execution_time,
-            snapshots,
-            deployability_index=deployability_index,
-            batch_index=batch_index,
-            **kwargs,
-        )
-        if result is None or isinstance(result, str):
-            return result
-        raise SQLMeshError(
-            f"Unexpected result {result} when evaluating snapshot {snapshot.snapshot_id}."
-        )
+        attempt = 0
+        while True:
+            try:
+                result = self._evaluate_snapshot(
+                    snapshot,
+                    start,
+                    end,
+                    execution_time,
+                    snapshots,
+                    deployability_index=deployability_index,
+                    batch_index=batch_index,
+                    **kwargs,
+                )
+                break
+            except Exception as ex:
+                if attempt >= self.retries or not self._is_retryable(snapshot, ex):
+                    raise
+                attempt += 1
+                self._on_evaluation_retry(snapshot, start, end, attempt, ex, on_retry)
+                if not self.adapter.is_write_conflict(ex):
+                    # The error may have broken the connection, so the retry starts with a new one.
+                    self.adapter.reset_connection()
+                time.sleep(self._retry_backoff(attempt))
+
+        return self._wap_id_from_result(snapshot, result)
+
+    async def evaluate_async(
+        self,
+        snapshot: Snapshot,
+        *,
+        start: TimeLike,
+        end: TimeLike,
+        execution_time: TimeLike,
+        snapshots: t.Dict[str, Snapshot],
+        deployability_index: t.Optional[DeployabilityIndex] = None,
+        batch_index: int = 0,
+        on_retry: t.Optional[t.Callable[[int, Exception], None]] = None,
+        executor: t.Optional[Executor] = None,
+        **kwargs: t.Any,
+    ) -> t.Optional[str]:
+        """Same as `evaluate`, but doesn't block the running event loop or hold a thread while the engine
+        executes the snapshot's statements.
+
+        The model is rendered and its evaluation strategy is applied in a thread of the given executor, while
+        the statements that would have been executed are deferred. Afterwards the deferred statements are
+        executed with `EngineAdapter.execute_async`. If the engine doesn't support asynchronous queries or the
+        model sets session properties, the snapshot is evaluated with `evaluate` in the executor instead.
+
+        Args:
+            snapshot: Snapshot to evaluate.
+            start: The start datetime to render.
+            end: The end datetime to render.
+            execution_time: The date/time time reference to use for execution time.
+            snapshots: All upstream snapshots (by name) to use for expansion and mapping of physical locations.
+            deployability_index: Determines snapshots that are deployable in the context of this evaluation.
+            batch_index: If the snapshot is part of a batch of related snapshots; which index in the batch is it
+            on_retry: A callback invoked with the attempt number and the error before the evaluation is retried.
+            executor: The executor whose threads render the model. Defaults to the event loop's default executor.
+            kwargs: Additional kwargs to pass to the renderer.
+
+        Returns:
+            The WAP ID of this evaluation if supported, None otherwise.
+        """
+        if not self.adapter.SUPPORTS_ASYNC_QUERIES or (
+            snapshot.is_model and snapshot.model.session_properties
+        ):
+            return await self.run_in_executor(
+                executor,
+                partial(
+                    self.evaluate,
+                    snapshot,
+                    start=start,
+                    end=end,
+                    execution_time=execution_time,
+                    snapshots=snapshots,
+                    deployability_index=deployability_index,
+                    batch_index=batch_index,
+                    on_retry=on_retry,
+                    **kwargs,
+                ),
+            )
+
+        attempt = 0
+        while True:
+            try:
+                result, statements = await self.run_in_executor(
+                    executor,
+                    partial(
+                        self._evaluate_snapshot_deferred,
+                        snapshot,
+                        start,
+                        end,
+                        execution_time,
+                        snapshots,
+                        deployability_index=deployability_index,
+                        batch_index=batch_index,
+                        **kwargs,
+                    ),
+                )
+                await self.adapter.execute_async(statements)
+                break
+            except Exception as ex:
+                if attempt >= self.retries or not self._is_retryable(snapshot, ex):
+                    raise
+                attempt += 1
+                self._on_evaluation_retry(snapshot, start, end, attempt, ex, on_retry)
+                await asyncio.sleep(self._retry_backoff(attempt))
+
+        return self._wap_id_from_result(snapshot, result)
 
     def evaluate_and_fetch(
         self,
@@ -203,11 +321,13 @@ class SnapshotEvaluator:
         with self.concurrent_context():
             concurrent_apply_to_snapshots(
                 target_snapshots,
-                lambda s: self._promote_snapshot(
-                    s,
-                    environment_naming_info,
-                    deployability_index,  # type: ignore
-                    on_complete,
+                self._releasing(
+                    lambda s: self._promote_snapshot(
+                        s,
+                        environment_naming_info,
+                        deployability_index,  # type: ignore
+                        on_complete,
+                    )
                 ),
                 self.ddl_concurrent_tasks,
             )
@@ -228,7 +348,9 @@ class SnapshotEvaluator:
         with self.concurrent_context():
             concurrent_apply_to_snapshots(
                 target_snapshots,
-                lambda s: self._demote_snapshot(s, environment_naming_info, on_complete),
+                self._releasing(
+                    lambda s: self._demote_snapshot(s, environment_naming_info, on_complete)
+                ),
                 self.ddl_concurrent_tasks,
             )
 
@@ -270,7 +392,9 @@ class SnapshotEvaluator:
             existing_objects = {
                 obj
                 for objs in concurrent_apply_to_values(
-                    list(tables_by_schema), _get_data_objects, self.ddl_concurrent_tasks
+                    list(tables_by_schema),
+                    self._releasing(_get_data_objects),
+                    self.ddl_concurrent_tasks,
                 )
                 for obj in objs
             }
@@ -289,8 +413,10 @@ class SnapshotEvaluator:
         with self.concurrent_context():
             concurrent_apply_to_snapshots(
                 snapshots_to_create,
-                lambda s: self._create_snapshot(
-                    s, snapshots, deployability_index, on_complete, allow_destructive_snapshots
+                self._releasing(
+                    lambda s: self._create_snapshot(
+                        s, snapshots, deployability_index, on_complete, allow_destructive_snapshots
+                    )
                 ),
                 self.ddl_concurrent_tasks,
             )
@@ -311,7 +437,9 @@ class SnapshotEvaluator:
         with self.concurrent_context():
             concurrent_apply_to_snapshots(
                 target_snapshots,
-                lambda s: self._migrate_snapshot(s, snapshots, allow_destructive_snapshots),
+                self._releasing(
+                    lambda s: self._migrate_snapshot(s, snapshots, allow_destructive_snapshots)
+                ),
                 self.ddl_concurrent_tasks,
             )
 
@@ -332,8 +460,10 @@ class SnapshotEvaluator:
         with self.concurrent_context():
             concurrent_apply_to_snapshots(
                 [t.snapshot for t in target_snapshots],
-                lambda s: self._cleanup_snapshot(
-                    s, snapshots_to_dev_table_only[s.snapshot_id], on_complete
+                self._releasing(
+                    lambda s: self._cleanup_snapshot(
+                        s, snapshots_to_dev_table_only[s.snapshot_id], on_complete
+                    )
                 ),
                 self.ddl_concurrent_tasks,
                 reverse_order=True,
@@ -350,6 +480,7 @@ class SnapshotEvaluator:
         raise_exception: bool = True,
         deployability_index: t.Optional[DeployabilityIndex] = None,
         wap_id: t.Optional[str] = None,
+        blocking: t.Optional[bool] = None,
         **kwargs: t.Any,
     ) -> t.List[AuditResult]:
         """Execute a snapshot's node's audit queries.
@@ -364,6 +495,7 @@ class SnapshotEvaluator:
                 AuditError is thrown or if we just warn with logger
             deployability_index: Determines snapshots that are deployable in the context of this evaluation.
             wap_id: The WAP ID if applicable, None otherwise.
+            blocking: If set, only the audits whose blocking flag matches it are executed.
             kwargs: Additional kwargs to pass to the renderer.
         """
         deployability_index = deployability_index or DeployabilityIndex.all_deployable()
@@ -391,28 +523,47 @@ class SnapshotEvaluator:
             kwargs["table_mapping"] = table_mapping
             kwargs["this_model"] = exp.to_table(wap_table_name, dialect=self.adapter.dialect)
 
-        results = []
-
-        audits_with_args = snapshot.audits_with_args
+        audits_with_args = [
+            (audit, audit_args)
+            for audit, audit_args in snapshot.audits_with_args
+            if blocking is None or audit.blocking == blocking
+        ]
 
         if audits_with_args:
             logger.info("Auditing snapshot %s", snapshot.snapshot_id)
 
-        for audit, audit_args in snapshot.audits_with_args:
-            results.append(
-                self._audit(
-                    audit=audit,
-                    audit_args=audit_args,
-                    snapshot=snapshot,
-                    snapshots=snapshots,
-                    start=start,
-                    end=end,
-                    execution_time=execution_time,
-                    raise_exception=raise_exception,
-                    deployability_index=deployability_index,
-                    **kwargs,
-                )
+        queries = [
+            None
+            if audit.skip
+            else audit.render_query(
+                snapshot,
+                start=start,
+                end=end,
+                execution_time=execution_time,
+                snapshots=snapshots,
+                deployability_index=deployability_index,
+                engine_adapter=self.adapter,
+                **audit_args,
+                **kwargs,
             )
+            for audit, audit_args in audits_with_args
+        ]
+        counts = iter(self._audit_counts([query for query in queries if query is not None]))
+
+        results = []
+        for (audit, _), query in zip(audits_with_args, queries):
+            if query is None:
+                results.append(AuditResult(audit=audit, model=snapshot.model_or_none, skipped=True))
+            else:
+                results.append(
+                    self._audit(
+                        audit=audit,
+                        snapshot=snapshot,
+                        query=query,
+                        count=next(counts),
+                        raise_exception=raise_exception,
+                    )
+                )
 
         if wap_id is not None:
             logger.info(
@@ -446,6 +597,101 @@ class SnapshotEvaluator:
         except Exception:
             logger.exception("Failed to close Snapshot Evaluator")
 
+    def _evaluate_snapshot_deferred(
+        self,
+        snapshot: Snapshot,
+        start: TimeLike,
+        end: TimeLike,
+        execution_time: TimeLike,
+        snapshots: t.Dict[str, Snapshot],
+        **kwargs: t.Any,
+    ) -> t.Tuple[DF | str | None, t.List[str]]:
+        """Evaluates the snapshot while deferring its statements and returns the statements that are still
+        pending along with the result of the evaluation."""
+        try:
+            with self.adapter.deferred_statements() as statements:
+                result = self._evaluate_snapshot(
+                    snapshot, start, end, execution_time, snapshots, **kwargs
+                )
+        except Exception as ex:
+            if self._is_retryable(snapshot, ex) and not self.adapter.is_write_conflict(ex):
+                # The error may have broken the connection of this thread, so the retry starts with a new one.
+                self.adapter.reset_connection()
+            raise
+        return result, statements
+
+    async def run_in_executor(self, executor: t.Optional[Executor], func: t.Callable[[], R]) -> R:
+        """Runs the function in a thread of the executor without blocking the running event loop.
+
+        The function runs within a copy of the current context, so statements that it executes are tracked by
+        `EngineAdapter.track_execution_stats` of the calling task. The thread's connection goes back to the
+        connection pool once the function is done.
+
+        Args:
+            executor: The target executor. Defaults to the event loop's default executor.
+            func: The function to run.
+
+        Returns:
+            The result of the function.
+        """
+        context = contextvars.copy_context()
+
+        def _run() -> R:
+            try:
+                return context.run(func)
+            finally:
+                # Let the connection of this thread be reused by other threads in the meantime.
+                self.adapter.release()
+
+        return await asyncio.get_running_loop().run_in_executor(executor, _run)
+
+    def _on_evaluation_retry(
+        self,
+        snapshot: Snapshot,
+        start: TimeLike,
+        end: TimeLike,
+        attempt: int,
+        error: Exception,
+        on_retry: t.Optional[t.Callable[[int, Exception], None]],
+    ) -> None:
+        logger.warning(
+            "Batch (%s, %s) of snapshot %s failed with a transient error: %s. Retrying (%s/%s)",
+            start,
+            end,
+            snapshot.snapshot_id,
+            error,
+            attempt,
+            self.retries,
+        )
+        analytics.collector.on_snapshot_evaluation_retry(
+            engine_type=self.adapter.dialect, attempt=attempt, error=error
+        )
+        if on_retry:
+            on_retry(attempt, error)
+
+    def _retry_backoff(self, attempt: int) -> float:
+        backoff = min(self.RETRY_MAX_BACKOFF_SEC, self.RETRY_BACKOFF_SEC * 2 ** (attempt - 1))
+        # Full jitter keeps concurrently retried batches from colliding again.
+        return random.uniform(0, backoff)
+
+    def _wap_id_from_result(self, snapshot: Snapshot, result: DF | str | None) -> t.Optional[str]:
+        if result is None or isinstance(result, str):
+            return result
+        raise SQLMeshError(
+            f"Unexpected result {result} when evaluating snapshot {snapshot.snapshot_id}."
+        )
+
+    def _releasing(self, func: t.Callable[[A], R]) -> t.Callable[[A], R]:
+        """Wraps a concurrent task so that its connection goes back to the connection pool once it's done."""
+
+        def _wrapper(value: A) -> R:
+            try:
+                return func(value)
+            finally:
+                self.adapter.release()
+
+        return _wrapper
+
     def _evaluate_snapshot(
         self,
         snapshot: Snapshot,
@@ -785,41 +1031,59 @@ class SnapshotEvaluator:
         table_name = snapshot.table_name(is_deployable=deployability_index.is_deployable(snapshot))
         self.adapter.wap_publish(table_name, wap_id)
 
+    def _audit_counts(self, queries: t.List[exp.Query]) -> t.List[int]:
+        """Returns the number of rows that violate each of the given audit queries.
+
+        Audits that filter the same source, like the built-in `not_null` and `accepted_values` audits
+        of a model, are evaluated together with a single scan of that source. The resulting count queries
+        are executed sequentially, since audits are already parallelized across snapshots by the caller.
+        """
+        filters_by_source: t.Dict[exp.Expression, t.List[t.Tuple[int, exp.Expression]]] = (
+            defaultdict(list)
+        )
+        for i, query in enumerate(queries):
+            source_and_filter = _audit_source_and_filter(query)
+            if source_and_filter:
+                source, condition = source_and_filter
+                filters_by_source[source].append((i, condition))
+
+        count_queries: t.List[t.Tuple[t.List[int], exp.Query]] = []
+        batched_indices = set()
+        for source, filters in filters_by_source.items():
+            if len(filters) < 2:
+                continue
+
+            count_query = select(
+                *(
+                    exp.func("COUNT", exp.case().when(condition, exp.Literal.number(1))).as_(
+                        f"audit_{i}"
+                    )
+                    for i, condition in filters
+                )
+            ).from_(source)
+            count_queries.append(([i for i, _ in filters], count_query))
+            batched_indices.update(i for i, _ in filters)
+
+        for i, query in enumerate(queries):
+            if i not in batched_indices:
+                count_queries.append(([i], select("COUNT(*)").from_(query.subquery("audit"))))
+
+        counts = [0] * len(queries)
+        for indices, count_query in count_queries:
+            row = self.adapter.fetchone(count_query, quote_identifiers=True)
+            for i, count in zip(indices, row):
+                counts[i] = count
+
+        return counts
+
     def _audit(
         self,
         audit: Audit,
-        audit_args: t.Dict[t.Any, t.Any],
         snapshot: Snapshot,
-        snapshots: t.Dict[str, Snapshot],
-        start: t.Optional[TimeLike],
-        end: t.Optional[TimeLike],
-        execution_time: t.Optional[TimeLike],
+        query: exp.Query,
+        count: int,
         raise_exception: bool,
-        deployability_index: t.Optional[DeployabilityIndex],
-        **kwargs: t.Any,
     ) -> AuditResult:
-        if audit.skip:
-            return AuditResult(
-                audit=audit,
-                model=snapshot.model_or_none,
-                skipped=True,
-            )
-
-        query = audit.render_query(
-            snapshot,
-            start=start,
-            end=end,
-            execution_time=execution_time,
-            snapshots=snapshots,
-            deployability_index=deployability_index,
-            engine_adapter=self.adapter,
-            **audit_args,
-            **kwargs,
-        )
-        count, *_ = self.adapter.fetchone(
-            select("COUNT(*)").from_(query.subquery("audit")),
-            quote_identifiers=True,
-        )
         if count and raise_exception:
             audit_error = AuditError(
                 audit_name=audit.name,
@@ -839,6 +1103,11 @@ class SnapshotEvaluator:
             query=query,
         )
 
+    def _is_retryable(self, snapshot: Snapshot, error: Exception) -> bool:
+        # Re-running a batch that failed midway is only safe if doing so yields the same result.
+        strategy = _evaluation_strategy(snapshot, self.adapter)
+        return strategy.is_idempotent(snapshot) and self.adapter.is_retryable_error(error)
+
     def _create_schemas(self, tables: t.Iterable[t.Union[exp.Table, str]]) -> None:
         table_exprs = [exp.to_table(t) for t in tables]
         unique_schemas = {(t.args["db"], t.args.get("catalog")) for t in table_exprs if t and t.db}
@@ -878,6 +1147,14 @@ class EvaluationStrategy(abc.ABC):
     def __init__(self, adapter: EngineAdapter):
         self.adapter = adapter
 
+    def is_idempotent(self, snapshot: Snapshot) -> bool:
+        """Returns True if re-running a partially failed evaluation of the given snapshot yields the same result.
+
+        Args:
+            snapshot: The target snapshot.
+        """
+        return False
+
     @abc.abstractmethod
     def insert(
         self,
@@ -1021,6 +1298,9 @@ class EvaluationStrategy(abc.ABC):
 
 
 class SymbolicStrategy(EvaluationStrategy):
+    def is_idempotent(self, snapshot: Snapshot) -> bool:
+        return True
+
     def insert(
         self,
         snapshot: Snapshot,
@@ -1207,6 +1487,9 @@ class MaterializableStrategy(PromotableStrategy):
 
 
 class IncrementalByTimeRangeStrategy(MaterializableStrategy):
+    def is_idempotent(self, snapshot: Snapshot) -> bool:
+        return True
+
     def insert(
         self,
         snapshot: Snapshot,
@@ -1230,6 +1513,9 @@ class IncrementalByTimeRangeStrategy(MaterializableStrategy):
 
 
 class IncrementalByUniqueKeyStrategy(MaterializableStrategy):
+    def is_idempotent(self, snapshot: Snapshot) -> bool:
+        return True
+
     def insert(
         self,
         snapshot: Snapshot,
@@ -1247,13 +1533,7 @@ class IncrementalByUniqueKeyStrategy(MaterializableStrategy):
         if not _intervals(snapshot, deployability_index) and batch_index == 0:
             self._replace_query_for_model(model, name, query_or_df)
         else:
-            self.adapter.merge(
-                name,
-                query_or_df,
-                columns_to_types=model.columns_to_types,
-                unique_key=model.unique_key,
-                when_matched=model.when_matched,
-            )
+            self._merge(model, name, query_or_df)
 
     def append(
         self,
@@ -1265,17 +1545,26 @@ class IncrementalByUniqueKeyStrategy(MaterializableStrategy):
         batch_index: int,
         **kwargs: t.Any,
     ) -> None:
-        model = snapshot.model
+        self._merge(snapshot.model, table_name, query_or_df)
+
+    def _merge(self, model: Model, table_name: str, query_or_df: QueryOrDF) -> None:
         self.adapter.merge(
             table_name,
             query_or_df,
             columns_to_types=model.columns_to_types,
             unique_key=model.unique_key,
             when_matched=model.when_matched,
+            change_detection=isinstance(model.kind, IncrementalByUniqueKeyKind)
+            and model.kind.change_detection,
         )
 
 
 class IncrementalUnmanagedStrategy(MaterializableStrategy):
+    def is_idempotent(self, snapshot: Snapshot) -> bool:
+        # Appended records would be duplicated if the evaluation was re-run.
+        kind = snapshot.model.kind
+        return isinstance(kind, IncrementalUnmanagedKind) and kind.insert_overwrite
+
     def insert(
         self,
         snapshot: Snapshot,
@@ -1309,6 +1598,9 @@ class IncrementalUnmanagedStrategy(MaterializableStrategy):
 
 
 class FullRefreshStrategy(MaterializableStrategy):
+    def is_idempotent(self, snapshot: Snapshot) -> bool:
+        return True
+
     def insert(
         self,
         snapshot: Snapshot,
@@ -1387,6 +1679,7 @@ class SCDType2Strategy(MaterializableStrategy):
                 columns_to_types=model.columns_to_types,
                 table_description=model.description,
                 column_descriptions=model.column_descriptions,
+                incremental_updates=model.kind.incremental_updates,
                 truncate=truncate,
                 **kwargs,
             )
@@ -1403,6 +1696,7 @@ class SCDType2Strategy(MaterializableStrategy):
                 execution_time_as_valid_from=model.kind.execution_time_as_valid_from,
                 table_description=model.description,
                 column_descriptions=model.column_descriptions,
+                incremental_updates=model.kind.incremental_updates,
                 truncate=truncate,
                 **kwargs,
             )
@@ -1435,6 +1729,7 @@ class SCDType2Strategy(MaterializableStrategy):
                 columns_to_types=model.columns_to_types,
                 table_description=model.description,
                 column_descriptions=model.column_descriptions,
+                incremental_updates=model.kind.incremental_updates,
                 **kwargs,
             )
         elif isinstance(model.kind, SCDType2ByColumnKind):
@@ -1450,6 +1745,7 @@ class SCDType2Strategy(MaterializableStrategy):
                 execution_time_as_valid_from=model.kind.execution_time_as_valid_from,
                 table_description=model.description,
                 column_descriptions=model.column_descriptions,
+                incremental_updates=model.kind.incremental_updates,
                 **kwargs,
             )
         else:
@@ -1459,6 +1755,9 @@ class SCDType2Strategy(MaterializableStrategy):
 
 
 class ViewStrategy(PromotableStrategy):
+    def is_idempotent(self, snapshot: Snapshot) -> bool:
+        return True
+
     def insert(
         self,
         snapshot: Snapshot,
@@ -1573,6 +1872,31 @@ class ViewStrategy(PromotableStrategy):
         return isinstance(model.kind, ViewKind) and model.kind.materialized
 
 
+def _audit_source_and_filter(
+    query: exp.Query,
+) -> t.Optional[t.Tuple[exp.Expression, exp.Expression]]:
+    """Returns the source and condition of an audit query that selects the rows of a single source that
+    match a condition, e.g. `SELECT * FROM source WHERE condition`, so it can be evaluated with others."""
+    if (
+        not isinstance(query, exp.Select)
+        or len(query.expressions) != 1
+        or not isinstance(query.expressions[0], exp.Star)
+        or any(
+            value
+            for key, value in query.args.items()
+            if key not in ("expressions", "from", "where")
+        )
+    ):
+        return None
+
+    source = query.args.get("from")
+    where = query.args.get("where")
+    if not source or not where or where.find(exp.Query):
+        return None
+
+    return source.this, where.this
+
+
 def _intervals(snapshot: Snapshot, deployability_index: DeployabilityIndex) -> Intervals:
     return (
         snapshot.intervals
@@ -16,11 +16,13 @@ adapter to read and write state to the underlying data store.
 
 from __future__ import annotations
 
+import base64
 import contextlib
 import json
 import logging
 import time
 import typing as t
+import zlib
 from collections import defaultdict
 from copy import deepcopy
 from pathlib import Path
@@ -62,9 +64,11 @@ from sqlmesh.core.snapshot.definition import (
 from sqlmesh.core.state_sync.base import MIGRATIONS, SCHEMA_VERSION, StateSync, Versions
 from sqlmesh.core.state_sync.common import CommonStateSyncMixin, transactional
 from sqlmesh.utils import major_minor, random_id, unique
+from sqlmesh.utils.concurrency import concurrent_apply_to_values
 from sqlmesh.utils.dag import DAG
 from sqlmesh.utils.date import TimeLike, now_timestamp, time_like_to_str
 from sqlmesh.utils.errors import SQLMeshError
+from sqlmesh.utils.hashing import md5
 from sqlmesh.utils.pydantic import parse_obj_as
 
 logger = logging.getLogger(__name__)
@@ -102,6 +106,9 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
     SNAPSHOT_BATCH_SIZE = 1000
     SNAPSHOT_MIGRATION_BATCH_SIZE = 500
     SNAPSHOT_SEED_MIGRATION_BATCH_SIZE = 200
+    SEED_CONTENT_BATCH_SIZE = 10
+    SEED_CONTENT_CHUNK_SIZE = 1_000_000
+    SEED_CONTENT_CONCURRENT_TASKS = 4
 
     def __init__(
         self,
@@ -118,6 +125,7 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
         self.snapshots_table = exp.table_("_snapshots", db=self.schema)
         self.environments_table = exp.table_("_environments", db=self.schema)
         self.seeds_table = exp.table_("_seeds", db=self.schema)
+        self.seed_contents_table = exp.table_("_seed_contents", db=self.schema)
         self.intervals_table = exp.table_("_intervals", db=self.schema)
         self.plan_dags_table = exp.table_("_plan_dags", db=self.schema)
         self.versions_table = exp.table_("_versions", db=self.schema)
@@ -149,7 +157,13 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
         self._seed_columns_to_types = {
             "name": exp.DataType.build("text"),
             "version": exp.DataType.build("text"),
-            "content": exp.DataType.build("text"),
+            "content_hash": exp.DataType.build("text"),
+        }
+
+        self._seed_content_columns_to_types = {
+            "content_hash": exp.DataType.build("text"),
+            "chunk_index": exp.DataType.build("int"),
+            "chunk": exp.DataType.build("text"),
         }
 
         self._interval_columns_to_types = {
@@ -217,7 +231,8 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
             snapshots = tuple(snapshots)
             self.delete_snapshots(snapshots)
 
-        seed_contents = []
+        seed_rows = []
+        seed_contents: t.Dict[str, str] = {}
         snapshots_to_store = []
 
         for snapshot in snapshots:
@@ -227,11 +242,14 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
             ):
                 seed_model = t.cast(SeedModel, snapshot.node)
                 if push_seeds:
-                    seed_contents.append(
+                    content = seed_model.seed.content
+                    content_hash = md5([content])
+                    seed_contents[content_hash] = content
+                    seed_rows.append(
                         {
                             "name": snapshot.name,
                             "version": snapshot.version,
-                            "content": seed_model.seed.content,
+                            "content_hash": content_hash,
                         }
                     )
                 snapshot = snapshot.copy(update={"node": seed_model.to_dehydrated()})
@@ -243,13 +261,100 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
             columns_to_types=self._snapshot_columns_to_types,
         )
 
-        if push_seeds and seed_contents:
+        if push_seeds and seed_rows:
+            self._push_seed_contents(seed_contents)
             self.engine_adapter.insert_append(
                 self.seeds_table,
-                pd.DataFrame(seed_contents),
+                pd.DataFrame(seed_rows),
                 columns_to_types=self._seed_columns_to_types,
             )
 
+    def _push_seed_contents(self, seed_contents: t.Dict[str, str]) -> None:
+        """Stores the compressed seed contents keyed by their hash, skipping ones that are already stored.
+
+        Concurrent pushes of the same content may both store its chunks. The contents table has no primary
+        key for this reason, and duplicate chunks are ignored when the contents are read back.
+        """
+        existing_hashes = {
+            content_hash
+            for content_hashes in self._batches(sorted(seed_contents))
+            for (content_hash,) in self._fetchall(
+                exp.select("content_hash")
+                .distinct()
+                .from_(self.seed_contents_table)
+                .where(exp.column("content_hash").isin(*content_hashes))
+            )
+        }
+
+        chunk_rows = [
+            {"content_hash": content_hash, "chunk_index": index, "chunk": chunk}
+            for content_hash, content in seed_contents.items()
+            if content_hash not in existing_hashes
+            for index, chunk in enumerate(
+                _compress_seed_content(content, self.SEED_CONTENT_CHUNK_SIZE)
+            )
+        ]
+        if chunk_rows:
+            self.engine_adapter.insert_append(
+                self.seed_contents_table,
+                pd.DataFrame(chunk_rows),
+                columns_to_types=self._seed_content_columns_to_types,
+            )
+
+    def _get_seed_contents(
+        self, snapshots: t.Collection[SnapshotNameVersionLike]
+    ) -> t.Dict[t.Tuple[str, str], str]:
+        """Fetches the contents of the given seed snapshots.
+
+        Each distinct content is only fetched once, even if it's shared by multiple versions. Batches
+        of contents are fetched concurrently when the engine adapter allows it.
+
+        Args:
+            snapshots: The seed snapshots to fetch the contents for.
+
+        Returns:
+            A dictionary of (name, version) pairs to seed contents.
+        """
+        if not snapshots:
+            return {}
+
+        content_hashes = {
+            (name, version): content_hash
+            for where in self._snapshot_name_version_filter(snapshots, alias=None)
+            for name, version, content_hash in self._fetchall(
+                exp.select("name", "version", "content_hash").from_(self.seeds_table).where(where)
+            )
+        }
+
+        def _fetch_chunks(batch: t.List[str]) -> t.List[t.Tuple]:
+            return self._fetchall(
+                exp.select("content_hash", "chunk_index", "chunk")
+                .from_(self.seed_contents_table)
+                .where(exp.column("content_hash").isin(*batch))
+            )
+
+        chunks_by_hash: t.Dict[str, t.Dict[int, str]] = defaultdict(dict)
+        for rows in concurrent_apply_to_values(
+            self._batches(sorted(set(content_hashes.values())), self.SEED_CONTENT_BATCH_SIZE),
+            _fetch_chunks,
+            self.SEED_CONTENT_CONCURRENT_TASKS
+            if self.engine_adapter.supports_concurrent_queries
+            else 1,
+        ):
+            # Duplicate chunks of the same content are identical, so they simply overwrite each other.
+            for content_hash, chunk_index, chunk in rows:
+                chunks_by_hash[content_hash][int(chunk_index)] = chunk
+
+        contents_by_hash = {
+            content_hash: _decompress_seed_content(chunks[i] for i in sorted(chunks))
+            for content_hash, chunks in chunks_by_hash.items()
+        }
+        return {
+            name_version: contents_by_hash[content_hash]
+            for name_version, content_hash in content_hashes.items()
+            if content_hash in contents_by_hash
+        }
+
     def _update_versions(
         self,
         schema_version: int = SCHEMA_VERSION,
@@ -295,9 +400,7 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
             .where(exp.column("expiration_ts") <= current_ts)
         )
         expired_candidates = {
-            SnapshotId(name=name, identifier=identifier): SnapshotNameVersion(
-                name=name, version=version
-            )
+            SnapshotId.trusted(name, identifier): SnapshotNameVersion.trusted(name, version)
             for name, identifier, version in self._fetchall(expired_query)
         }
         if not expired_candidates:
@@ -464,7 +567,6 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
         self,
         snapshot_ids: t.Optional[t.Iterable[SnapshotIdLike]] = None,
         lock_for_update: bool = False,
-        hydrate_seeds: bool = False,
         batch_size: t.Optional[int] = None,
     ) -> t.Iterator[exp.Expression]:
         for where in (
@@ -482,19 +584,6 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
                 .from_(exp.to_table(self.snapshots_table).as_("snapshots"))
                 .where(where)
             )
-            if hydrate_seeds:
-                query = query.select(exp.column("content", table="seeds")).join(
-                    exp.to_table(self.seeds_table).as_("seeds"),
-                    on=exp.and_(
-                        exp.column("name", table="snapshots").eq(exp.column("name", table="seeds")),
-                        exp.column("version", table="snapshots").eq(
-                            exp.column("version", table="seeds")
-                        ),
-                    ),
-                    join_type="left",
-                )
-            else:
-                query = query.select(exp.Null().as_("content"))
             if lock_for_update:
                 query = query.lock(copy=False)
             yield query
@@ -521,14 +610,13 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
         duplicates: t.Dict[SnapshotId, Snapshot] = {}
         model_cache = ModelCache(self._context_path / c.CACHE)
 
-        for query in self._get_snapshots_expressions(snapshot_ids, lock_for_update, hydrate_seeds):
-            for serialized_snapshot, name, identifier, _, seed_content in self._fetchall(query):
+        for query in self._get_snapshots_expressions(snapshot_ids, lock_for_update):
+            for serialized_snapshot, name, identifier, _ in self._fetchall(query):
                 snapshot = parse_snapshot(
                     model_cache,
                     serialized_snapshot=serialized_snapshot,
                     name=name,
                     identifier=identifier,
-                    seed_content=seed_content,
                 )
                 snapshot_id = snapshot.snapshot_id
                 if snapshot_id in snapshots:
@@ -540,6 +628,18 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
                 else:
                     snapshots[snapshot_id] = snapshot
 
+        if hydrate_seeds:
+            seed_snapshots = [
+                s
+                for s in snapshots.values()
+                if isinstance(s.node, SeedModel) and not s.node.is_hydrated
+            ]
+            seed_contents = self._get_seed_contents(seed_snapshots)
+            for snapshot in seed_snapshots:
+                seed_content = seed_contents.get((snapshot.name, snapshot.version))
+                if seed_content:
+                    snapshot.node = t.cast(SeedModel, snapshot.node).to_hydrated(seed_content)
+
         if snapshots and hydrate_intervals:
             _, intervals = self._get_snapshot_intervals(snapshots.values())
             Snapshot.hydrate_with_intervals_by_version(snapshots.values(), intervals)
@@ -1000,7 +1100,12 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
         """Rollback to the previous migration."""
         logger.info("Starting migration rollback.")
         tables = (self.snapshots_table, self.environments_table, self.versions_table)
-        optional_tables = (self.seeds_table, self.intervals_table, self.plan_dags_table)
+        optional_tables = (
+            self.seeds_table,
+            self.seed_contents_table,
+            self.intervals_table,
+            self.plan_dags_table,
+        )
         versions = self.get_versions(validate=False)
         if versions.schema_version == 0:
             # Clean up state tables
@@ -1029,6 +1134,7 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
             self.environments_table,
             self.versions_table,
             self.seeds_table,
+            self.seed_contents_table,
             self.intervals_table,
             self.plan_dags_table,
         ):
@@ -1078,7 +1184,7 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
     ) -> t.Dict[SnapshotId, SnapshotTableInfo]:
         logger.info("Migrating snapshot rows...")
         raw_snapshots = {
-            SnapshotId(name=name, identifier=identifier): json.loads(raw_snapshot)
+            SnapshotId.trusted(name, identifier): json.loads(raw_snapshot)
             for where in (self._snapshot_id_filter(snapshots) if snapshots is not None else [None])
             for name, identifier, raw_snapshot in self._fetchall(
                 exp.select("name", "identifier", "snapshot")
@@ -1256,12 +1362,19 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
     def _delete_seeds(self, snapshots: t.Iterable[SnapshotNameVersionLike]) -> None:
         for where in self._snapshot_name_version_filter(snapshots, alias=None):
             self.engine_adapter.delete_from(self.seeds_table, where=where)
+        # Contents are shared across versions, so only the ones no longer referenced can be removed.
+        self.engine_adapter.delete_from(
+            self.seed_contents_table,
+            where=exp.column("content_hash")
+            .isin(query=exp.select("content_hash").from_(self.seeds_table))
+            .not_(),
+        )
 
     def _snapshot_ids_exist(
         self, snapshot_ids: t.Iterable[SnapshotIdLike], table_name: exp.Table
     ) -> t.Set[SnapshotId]:
         return {
-            SnapshotId(name=name, identifier=identifier)
+            SnapshotId.trusted(name, identifier)
             for where in self._snapshot_id_filter(snapshot_ids)
             for name, identifier in self._fetchall(
                 exp.select("name", "identifier").from_(table_name).where(where)
@@ -1465,12 +1578,20 @@ def _snapshot_to_json(snapshot: Snapshot) -> str:
     return snapshot.json(exclude={"intervals", "dev_intervals"})
 
 
+def _compress_seed_content(content: str, chunk_size: int) -> t.List[str]:
+    compressed = base64.b64encode(zlib.compress(content.encode("utf-8"))).decode("ascii")
+    return [compressed[i : i + chunk_size] for i in range(0, len(compressed), chunk_size)]
+
+
+def _decompress_seed_content(chunks: t.Iterable[str]) -> str:
+    return zlib.decompress(base64.b64decode("".join(chunks))).decode("utf-8")
+
+
 def parse_snapshot(
     model_cache: ModelCache,
     serialized_snapshot: str,
     name: str,
     identifier: str,
-    seed_content: t.Optional[str],
 ) -> Snapshot:
     payload = json.loads(serialized_snapshot)
 
@@ -1478,12 +1599,7 @@ def parse_snapshot(
         return parse_obj_as(Node, payload["node"])  # type: ignore
 
     payload["node"] = model_cache.get_or_load(f"{name}_{identifier}", loader=loader)  # type: ignore
-    snapshot = Snapshot(**payload)
-
-    if seed_content and isinstance(snapshot.node, SeedModel):
-        snapshot.node = snapshot.node.to_hydrated(seed_content)
-
-    return snapshot
+    return Snapshot(**payload)
 
 
 class LazilyParsedSnapshots:
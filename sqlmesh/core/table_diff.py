@@ -8,6 +8,7 @@ from sqlglot import exp
 from sqlglot.optimizer.normalize_identifiers import normalize_identifiers
 from sqlglot.optimizer.qualify_columns import quote_identifiers
 
+from sqlmesh.utils.errors import SQLMeshError
 from sqlmesh.utils.pydantic import PydanticModel
 
 if t.TYPE_CHECKING:
@@ -15,6 +16,20 @@ if t.TYPE_CHECKING:
     from sqlmesh.core.engine_adapter import EngineAdapter
 
 
+HEX_DIGITS = "0123456789abcdef"
+# The number of leading key hash digits used to sample rows deterministically.
+SAMPLE_DIGITS = 4
+# The key space is bisected by this many key hash digits at a time.
+SEGMENT_DIGITS_STEP = 2
+MAX_SEGMENT_DIGITS = 6
+# Bisection stops once the mismatching segments contain at most this many rows...
+SEGMENT_ROW_THRESHOLD = 10_000
+# ... or once there are too many of them to be listed in a filter.
+MAX_MISMATCHED_SEGMENTS = 1_000
+# The number of row hash digits summed up into the checksum of a segment.
+CHECKSUM_DIGITS = 7
+
+
 class SchemaDiff(PydanticModel, frozen=True):
     """An object containing the schema difference between a source and target table."""
 
@@ -145,7 +160,20 @@ class TableDiff:
         target_alias: t.Optional[str] = None,
         model_name: t.Optional[str] = None,
         decimals: int = 3,
+        sample_rate: t.Optional[float] = None,
+        segmented: bool = False,
     ):
+        """
+        Args:
+            sample_rate: The fraction of rows to compare. Rows are sampled deterministically by
+                hashing their join keys, so the same keys are sampled from both tables.
+            segmented: Whether to compare checksums of segments of the key space first and join
+                only the rows of the segments that differ. The where condition, if any, is then
+                applied to each table before they are compared.
+        """
+        if sample_rate is not None and not 0 < sample_rate <= 1:
+            raise SQLMeshError(f"Sample rate must be between 0 and 1, got {sample_rate}.")
+
         self.adapter = adapter
         self.source = source
         self.target = target
@@ -154,6 +182,8 @@ class TableDiff:
         self.limit = limit
         self.model_name = model_name
         self.decimals = decimals
+        self.sample_rate = sample_rate
+        self.segmented = segmented
 
         # Support environment aliases for diff output improvement in certain cases
         self.source_alias = source_alias
@@ -226,7 +256,7 @@ class TableDiff:
                 c: t for c, t in self.source_schema.items() if t == self.target_schema.get(c)
             }
 
-            def _column_expr(name: str, table: str) -> exp.Expression:
+            def _column_expr(name: str, table: t.Optional[str] = None) -> exp.Expression:
                 if matched_columns[name].this in exp.DataType.FLOAT_TYPES:
                     return exp.func(
                         "ROUND", exp.column(name, table), exp.Literal.number(self.decimals)
@@ -252,6 +282,42 @@ class TableDiff:
             def name(e: exp.Expression) -> str:
                 return e.args["alias"].sql(identify=True)
 
+            key_hash = _hash(exp.column(c) for c in index_cols)
+            where = self.where
+            filters: t.List[exp.Expression] = []
+            matched_segment_rows = 0
+
+            if self.sample_rate is not None and self.sample_rate < 1:
+                threshold = int(self.sample_rate * len(HEX_DIGITS) ** SAMPLE_DIGITS)
+                filters.append(
+                    _prefix(key_hash, SAMPLE_DIGITS)
+                    < exp.Literal.string(f"{threshold:0{SAMPLE_DIGITS}x}")
+                )
+
+            if self.segmented:
+                if where:
+                    filters.append(
+                        where.transform(
+                            lambda node: exp.column(node.this)
+                            if isinstance(node, exp.Column)
+                            else node
+                        )
+                    )
+                    where = None
+
+                segment_filter, matched_segment_rows = self._mismatched_segments(
+                    key_hash, [_column_expr(c) for c in matched_columns], filters
+                )
+                filters.append(segment_filter)
+
+            source: exp.Expression = exp.alias_(self.source, "s")
+            target: exp.Expression = exp.to_table(self.target)
+            join_alias: t.Optional[str] = "t"
+            if filters:
+                source = exp.select("*").from_(self.source).where(*filters).subquery("s")
+                target = exp.select("*").from_(self.target).where(*filters).subquery("t")
+                join_alias = None
+
             query = (
                 exp.select(
                     *s_selects.values(),
@@ -279,14 +345,14 @@ class TableDiff:
                     ).as_("row_joined"),
                     *comparisons,
                 )
-                .from_(exp.alias_(self.source, "s"))
+                .from_(source)
                 .join(
-                    self.target,
+                    target,
                     on=self.on,
                     join_type="FULL",
-                    join_alias="t",
+                    join_alias=join_alias,
                 )
-                .where(self.where)
+                .where(where)
             )
 
             query = exp.select(
@@ -318,16 +384,35 @@ class TableDiff:
                 ).from_(table)
 
                 stats_df = self.adapter.fetchdf(summary_query, quote_identifiers=True)
+                if self.segmented:
+                    # Rows of matching segments are identical in both tables
+                    stats_df = stats_df.fillna(0)
+                    for column in (
+                        "s_count",
+                        "t_count",
+                        "join_count",
+                        "full_match_count",
+                        *(c.alias for c in comparisons),
+                    ):
+                        stats_df[column] += matched_segment_rows
                 stats_df["s_only_count"] = stats_df["s_count"] - stats_df["join_count"]
                 stats_df["t_only_count"] = stats_df["t_count"] - stats_df["join_count"]
                 stats = stats_df.iloc[0].to_dict()
 
+                def _match_ratio(column: str) -> exp.Expression:
+                    matches: exp.Expression = exp.func("SUM", column)
+                    joined: exp.Expression = exp.func("COUNT", column)
+                    if matched_segment_rows:
+                        matches = exp.paren(exp.func("COALESCE", matches, 0) + matched_segment_rows)
+                        joined = exp.paren(joined + matched_segment_rows)
+                    return matches / joined
+
                 column_stats_query = (
                     exp.select(
                         *(
                             exp.func(
                                 "ROUND",
-                                100 * (exp.func("SUM", name(c)) / exp.func("COUNT", name(c))),
+                                100 * _match_ratio(name(c)),
                                 1,
                             ).as_(c.alias)
                             for c in comparisons
@@ -436,3 +521,125 @@ class TableDiff:
                     model_name=self.model_name,
                 )
         return self._row_diff
+
+    def _mismatched_segments(
+        self,
+        key_hash: exp.Expression,
+        columns: t.List[exp.Expression],
+        filters: t.List[exp.Expression],
+    ) -> t.Tuple[exp.Expression, int]:
+        """Bisects the key space into segments until the ones that differ are small enough.
+
+        Segments are ranges of the key hash that are compared by their row counts and the sum
+        of their row hashes, so only aggregates are fetched for the parts of the tables that match.
+        A pass that finds more than MAX_MISMATCHED_SEGMENTS mismatching segments is discarded, and
+        the segments of the previous pass are used instead.
+
+        Returns:
+            A condition selecting the rows of the mismatching segments and the number of rows in
+            each table that belong to the matching ones.
+        """
+        key = exp.column("key_hash")
+        row_hash = _hash(columns)
+        segment_filter: exp.Expression = exp.true()
+        # The condition and the number of matched rows after the last accepted pass
+        result: t.Tuple[exp.Expression, int] = (exp.true(), 0)
+        matched_rows = 0
+        digits = 0
+
+        def _checksums(table: TableName, side: str, digits: int) -> exp.Select:
+            hashed = (
+                exp.select(key_hash.as_("key_hash"), row_hash.as_("row_hash"))
+                .from_(table)
+                .where(*filters)
+            )
+            return (
+                exp.select(
+                    exp.Literal.string(side).as_("side"),
+                    _prefix(key, digits).as_("segment"),
+                    exp.func("COUNT", exp.Star()).as_("row_count"),
+                    exp.cast(
+                        exp.func("SUM", _hex_to_int(exp.column("row_hash"), CHECKSUM_DIGITS)),
+                        "text",
+                    ).as_("checksum"),
+                )
+                .from_(hashed.subquery("hashed"))
+                .where(segment_filter)
+                .group_by(_prefix(key, digits))
+            )
+
+        while digits < MAX_SEGMENT_DIGITS:
+            digits += SEGMENT_DIGITS_STEP
+            query = exp.union(
+                _checksums(self.source, "s", digits),
+                _checksums(self.target, "t", digits),
+                distinct=False,
+            )
+            df = self.adapter.fetchdf(quote_identifiers(query, dialect=self.dialect))
+            checksums = (
+                df[df["side"] == "s"]
+                .set_index("segment")
+                .join(
+                    df[df["side"] == "t"].set_index("segment"),
+                    how="outer",
+                    lsuffix="_s",
+                    rsuffix="_t",
+                )
+            )
+            matched = (checksums["row_count_s"] == checksums["row_count_t"]) & (
+                checksums["checksum_s"] == checksums["checksum_t"]
+            )
+            mismatched = list(checksums.index[~matched])
+            if len(mismatched) > MAX_MISMATCHED_SEGMENTS:
+                # Too many segments to list them in a filter, so the previous pass is used instead
+                break
+
+            matched_rows += int(checksums[matched]["row_count_s"].sum())
+            if not mismatched:
+                return exp.false(), matched_rows
+
+            segment_filter = _prefix(key, digits).isin(*mismatched)
+            result = (_prefix(key_hash, digits).isin(*mismatched), matched_rows)
+
+            mismatched_rows = checksums[~matched][["row_count_s", "row_count_t"]].max(axis=1).sum()
+            if mismatched_rows <= SEGMENT_ROW_THRESHOLD:
+                break
+
+        return result
+
+
+def _hash(columns: t.Iterable[exp.Expression]) -> exp.Expression:
+    """Hashes the given columns the same way the @GENERATE_SURROGATE_KEY macro does."""
+    string_fields: t.List[exp.Expression] = []
+    for i, column in enumerate(columns):
+        if i > 0:
+            string_fields.append(exp.Literal.string("|"))
+        string_fields.append(
+            exp.func(
+                "COALESCE",
+                exp.cast(column, exp.DataType.build("text")),
+                exp.Literal.string("_sqlmesh_table_diff_null_"),
+            )
+        )
+    return exp.func("MD5", exp.func("CONCAT", *string_fields))
+
+
+def _prefix(hash_expr: exp.Expression, digits: int) -> exp.Expression:
+    return exp.func("SUBSTRING", hash_expr.copy(), 1, digits)
+
+
+def _hex_to_int(hash_expr: exp.Expression, digits: int) -> exp.Expression:
+    """Converts the leading digits of a hex hash into an integer without engine specific functions."""
+    value: t.Optional[exp.Expression] = None
+    for i in range(digits):
+        digit = exp.Case(
+            this=exp.func("SUBSTRING", hash_expr.copy(), i + 1, 1),
+            ifs=[
+                exp.If(this=exp.Literal.string(char), true=exp.Literal.number(n))
+                for n, char in enumerate(HEX_DIGITS)
+            ],
+        )
+        term = exp.paren(digit) * len(HEX_DIGITS) ** (digits - i - 1)
+        value = term if value is None else value + term
+    assert value is not None
+    return value
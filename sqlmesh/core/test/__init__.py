@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import functools
 import pathlib
 import typing as t
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
 
 from sqlmesh.core.engine_adapter import EngineAdapter
 from sqlmesh.core.model import Model
-from sqlmesh.core.test.definition import ModelTest as ModelTest, generate_test as generate_test
+from sqlmesh.core.test.definition import (
+    ModelTest as ModelTest,
+    SharedFixtures as SharedFixtures,
+    generate_test as generate_test,
+)
 from sqlmesh.core.test.discovery import (
     ModelTestMetadata as ModelTestMetadata,
     filter_tests_by_patterns as filter_tests_by_patterns,
@@ -31,6 +38,7 @@ def run_tests(
     stream: t.TextIO | None = None,
     default_catalog: str | None = None,
     default_catalog_dialect: str = "",
+    num_workers: int = 1,
 ) -> ModelTextTestResult:
     """Create a test suite of ModelTest objects and run it.
 
@@ -39,23 +47,29 @@ def run_tests(
         models: All models to use for expansion and mapping of physical locations.
         verbosity: The verbosity level.
         preserve_fixtures: Preserve the fixture tables in the testing database, useful for debugging.
+        num_workers: The number of tests to run concurrently. Each worker uses its own testing engine
+            adapters, and the output is reported in the order of the tests regardless.
     """
-    testing_adapter_by_gateway: t.Dict[str, EngineAdapter] = {}
+    testing_adapter_by_gateway: t.Dict[t.Tuple[str, int], EngineAdapter] = {}
     default_gateway = gateway or config.default_gateway_name
+    concurrent = num_workers > 1 and len(model_test_metadata) > 1
+    fixtures = SharedFixtures(preserve=preserve_fixtures)
 
     try:
         tests = []
-        for metadata in model_test_metadata:
+        for i, metadata in enumerate(model_test_metadata):
             body = metadata.body
-            gateway = body.get("gateway") or default_gateway
-            testing_engine_adapter = testing_adapter_by_gateway.get(gateway)
+            test_gateway = body.get("gateway") or default_gateway
+            # Each worker runs its share of the tests using its own testing engine adapters
+            adapter_key = (test_gateway, i % num_workers if concurrent else 0)
+            testing_engine_adapter = testing_adapter_by_gateway.get(adapter_key)
             if not testing_engine_adapter:
                 testing_engine_adapter = config.get_test_connection(
-                    gateway,
+                    test_gateway,
                     default_catalog,
                     default_catalog_dialect,
                 ).create_engine_adapter(register_comments_override=False)
-                testing_adapter_by_gateway[gateway] = testing_engine_adapter
+                testing_adapter_by_gateway[adapter_key] = testing_engine_adapter
 
             tests.append(
                 ModelTest.create_test(
@@ -67,22 +81,73 @@ def run_tests(
                     path=metadata.path,
                     default_catalog=default_catalog,
                     preserve_fixtures=preserve_fixtures,
+                    fixtures=fixtures,
                 )
             )
 
+        if concurrent:
+            suite: t.Callable[[unittest.TestResult], t.Any] = functools.partial(
+                _run_concurrently, tests, num_workers=num_workers, verbosity=verbosity
+            )
+        else:
+            suite = unittest.TestSuite(tests)
+
         result = t.cast(
             ModelTextTestResult,
             unittest.TextTestRunner(
                 stream=stream, verbosity=verbosity, resultclass=ModelTextTestResult
-            ).run(unittest.TestSuite(tests)),
+            ).run(suite),  # type: ignore
         )
     finally:
-        for testing_engine_adapter in testing_adapter_by_gateway.values():
-            testing_engine_adapter.close()
+        try:
+            fixtures.close()
+        finally:
+            for testing_engine_adapter in testing_adapter_by_gateway.values():
+                testing_engine_adapter.close()
 
     return result
 
 
+def _run_concurrently(
+    tests: t.List[ModelTest],
+    result: ModelTextTestResult,
+    num_workers: int,
+    verbosity: int,
+) -> None:
+    """Runs tests using a pool of workers and merges their results in the order of the tests.
+
+    Tests that share an engine adapter are run one after the other by the same worker and each test
+    reports to its own result, whose output is buffered until it's merged. Tests that aren't thread
+    safe are run one by one on the calling thread once the pool is done.
+    """
+    tests_by_adapter: t.Dict[int, t.List[ModelTest]] = {}
+    for test in tests:
+        if test.is_thread_safe:
+            tests_by_adapter.setdefault(id(test.engine_adapter), []).append(test)
+
+    def _run(test: ModelTest) -> ModelTextTestResult:
+        test_result = ModelTextTestResult(
+            unittest.runner._WritelnDecorator(StringIO()),  # type: ignore
+            descriptions=True,
+            verbosity=verbosity,
+        )
+        test(test_result)
+        return test_result
+
+    def _run_all(tests: t.List[ModelTest]) -> t.List[ModelTextTestResult]:
+        return [_run(test) for test in tests]
+
+    test_results: t.Dict[int, ModelTextTestResult] = {}
+    with ThreadPoolExecutor(max_workers=num_workers) as pool:
+        for adapter_tests, adapter_results in zip(
+            tests_by_adapter.values(), pool.map(_run_all, tests_by_adapter.values())
+        ):
+            test_results.update(zip(map(id, adapter_tests), adapter_results))
+
+    for test in tests:
+        result.merge(test_results.get(id(test)) or _run(test))
+
+
 def run_model_tests(
     tests: list[str],
     models: UniqueKeyDict[str, Model],
@@ -95,6 +160,7 @@ def run_model_tests(
     stream: t.TextIO | None = None,
     default_catalog: t.Optional[str] = None,
     default_catalog_dialect: str = "",
+    num_workers: int = 1,
 ) -> ModelTextTestResult:
     """Load and run tests.
 
@@ -104,6 +170,7 @@ def run_model_tests(
         verbosity: The verbosity level.
         patterns: A list of patterns to match against.
         preserve_fixtures: Preserve the fixture tables in the testing database, useful for debugging.
+        num_workers: The number of tests to run concurrently.
     """
     loaded_tests = []
     for test in tests:
@@ -129,4 +196,5 @@ def run_model_tests(
         stream=stream,
         default_catalog=default_catalog,
         default_catalog_dialect=default_catalog_dialect,
+        num_workers=num_workers,
     )
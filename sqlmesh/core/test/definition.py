@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import datetime
+import json
+import threading
 import typing as t
 import unittest
 from collections import Counter
@@ -25,6 +27,7 @@ from sqlmesh.core.model import Model, PythonModel, SqlModel
 from sqlmesh.utils import UniqueKeyDict, random_id, type_is_known, yaml
 from sqlmesh.utils.date import pandas_timestamp_to_pydatetime
 from sqlmesh.utils.errors import ConfigError, TestError
+from sqlmesh.utils.hashing import hash_data
 from sqlmesh.utils.yaml import load as yaml_load
 
 if t.TYPE_CHECKING:
@@ -47,6 +50,7 @@ class ModelTest(unittest.TestCase):
         path: Path | None = None,
         preserve_fixtures: bool = False,
         default_catalog: str | None = None,
+        fixtures: t.Optional[SharedFixtures] = None,
     ) -> None:
         """ModelTest encapsulates a unit test for a model.
 
@@ -59,6 +63,8 @@ class ModelTest(unittest.TestCase):
             dialect: The models' dialect, used for normalization purposes.
             path: An optional path to the test definition yaml file.
             preserve_fixtures: Preserve the fixture tables in the testing database, useful for debugging.
+            fixtures: The fixture tables shared by the tests of a run. When set, identical inputs across
+                tests are loaded into the same fixture table.
         """
         self.body = body
         self.test_name = test_name
@@ -70,6 +76,8 @@ class ModelTest(unittest.TestCase):
         self.default_catalog = default_catalog
         self.dialect = dialect
 
+        self._fixtures = fixtures
+        self._fixture_keys: t.Dict[str, str] = {}
         self._fixture_table_cache: t.Dict[str, exp.Table] = {}
         self._normalized_column_name_cache: t.Dict[str, str] = {}
         self._normalized_model_name_cache: t.Dict[t.Tuple[str, bool], str] = {}
@@ -85,8 +93,15 @@ class ModelTest(unittest.TestCase):
         else:
             self._fixture_catalog = None
 
-        # The test schema name is randomized to avoid concurrency issues
-        self._fixture_schema = exp.to_identifier(f"sqlmesh_test_{random_id(short=True)}")
+        if self._fixtures:
+            self._fixture_schema = self._fixtures.schema(self.engine_adapter)
+            for name, values in self.body.get("inputs", {}).items():
+                self._fixture_keys[name] = _fixture_key(name, values)
+                self._fixtures.register(self.engine_adapter, self._fixture_keys[name])
+        else:
+            # The test schema name is randomized to avoid concurrency issues
+            self._fixture_schema = exp.to_identifier(f"sqlmesh_test_{random_id(short=True)}")
+
         self._qualified_fixture_schema = schema_(self._fixture_schema, self._fixture_catalog)
 
         self._transforms = self._test_adapter_dialect.generator_class.TRANSFORMS
@@ -108,59 +123,37 @@ class ModelTest(unittest.TestCase):
     def shortDescription(self) -> t.Optional[str]:
         return self.body.get("description")
 
+    @property
+    def is_thread_safe(self) -> bool:
+        """Whether this test can run concurrently with other tests.
+
+        Tests that mock the execution time patch global state, like the SQL generator's transforms.
+        """
+        return not self._execution_time
+
     def setUp(self) -> None:
         """Load all input tables"""
-        self.engine_adapter.create_schema(self._qualified_fixture_schema)
-
-        for name, values in self.body.get("inputs", {}).items():
-            all_types_are_known = False
-            known_columns_to_types: t.Dict[str, exp.DataType] = {}
-
-            model = self.models.get(name)
-            if model:
-                inferred_columns_to_types = model.columns_to_types or {}
-                known_columns_to_types = {
-                    c: t for c, t in inferred_columns_to_types.items() if type_is_known(t)
-                }
-                all_types_are_known = bool(inferred_columns_to_types) and (
-                    len(known_columns_to_types) == len(inferred_columns_to_types)
+        if self._fixtures:
+            for name, values in self.body.get("inputs", {}).items():
+                self._fixtures.acquire(
+                    self.engine_adapter,
+                    self._fixture_keys[name],
+                    self._test_fixture_table(name),
+                    lambda: self._create_fixture(name, values),
                 )
+            return
 
-            # Types specified in the test will override the corresponding inferred ones
-            known_columns_to_types.update(values.get("columns", {}))
-
-            rows = values.get("rows")
-            if not all_types_are_known and rows:
-                for col, value in rows[0].items():
-                    if col not in known_columns_to_types:
-                        v_type = annotate_types(exp.convert(value)).type or type(value).__name__
-                        v_type = exp.maybe_parse(
-                            v_type, into=exp.DataType, dialect=self._test_adapter_dialect
-                        )
-
-                        if not type_is_known(v_type):
-                            _raise_error(
-                                f"Failed to infer the data type of column '{col}' for '{name}'. This issue can be "
-                                "mitigated by casting the column in the model definition, setting its type in "
-                                "schema.yaml if it's an external model, setting the model's 'columns' property, "
-                                "or setting its 'columns' mapping in the test itself",
-                                self.path,
-                            )
-
-                        known_columns_to_types[col] = v_type
-
-            if rows is None:
-                query_or_df = values["query"]
-            else:
-                query_or_df = self._create_df(values, columns=known_columns_to_types)
+        self.engine_adapter.create_schema(self._qualified_fixture_schema)
 
-            self.engine_adapter.create_view(
-                self._test_fixture_table(name), query_or_df, known_columns_to_types
-            )
+        for name, values in self.body.get("inputs", {}).items():
+            self._create_fixture(name, values)
 
     def tearDown(self) -> None:
         """Drop all fixture tables."""
-        if not self.preserve_fixtures:
+        if self._fixtures:
+            for name, key in self._fixture_keys.items():
+                self._fixtures.release(self.engine_adapter, key, self._test_fixture_table(name))
+        elif not self.preserve_fixtures:
             self.engine_adapter.drop_schema(self._qualified_fixture_schema, cascade=True)
 
     def assert_equal(
@@ -254,6 +247,12 @@ class ModelTest(unittest.TestCase):
     def runTest(self) -> None:
         raise NotImplementedError
 
+    def _patch_transforms(self) -> AbstractContextManager:
+        # The transforms are shared by all tests, so they are only patched when execution time is mocked
+        if not self._execution_time:
+            return nullcontext()
+        return patch.dict(self._test_adapter_dialect.generator_class.TRANSFORMS, self._transforms)
+
     def path_relative_to(self, other: Path) -> Path | None:
         """Compute a version of this test's path relative to the `other` path"""
         return self.path.relative_to(other) if self.path else None
@@ -268,6 +267,7 @@ class ModelTest(unittest.TestCase):
         path: Path | None,
         preserve_fixtures: bool = False,
         default_catalog: str | None = None,
+        fixtures: t.Optional[SharedFixtures] = None,
     ) -> ModelTest:
         """Create a SqlModelTest or a PythonModelTest.
 
@@ -279,6 +279,7 @@ class ModelTest(unittest.TestCase):
             dialect: The models' dialect, used for normalization purposes.
             path: An optional path to the test definition yaml file.
             preserve_fixtures: Preserve the fixture tables in the testing database, useful for debugging.
+            fixtures: The fixture tables shared by the tests of a run.
         """
         name = normalize_model_name(body["model"], default_catalog=default_catalog, dialect=dialect)
         model = models.get(name)
@@ -302,6 +303,7 @@ class ModelTest(unittest.TestCase):
             path,
             preserve_fixtures,
             default_catalog,
+            fixtures,
         )
 
     def __str__(self) -> str:
@@ -425,6 +427,52 @@ class ModelTest(unittest.TestCase):
                 query, self.model.name, partial=partial, dialect=self.model.dialect
             )
 
+    def _create_fixture(self, name: str, values: t.Dict[str, t.Any]) -> None:
+        all_types_are_known = False
+        known_columns_to_types: t.Dict[str, exp.DataType] = {}
+
+        model = self.models.get(name)
+        if model:
+            inferred_columns_to_types = model.columns_to_types or {}
+            known_columns_to_types = {
+                c: t for c, t in inferred_columns_to_types.items() if type_is_known(t)
+            }
+            all_types_are_known = bool(inferred_columns_to_types) and (
+                len(known_columns_to_types) == len(inferred_columns_to_types)
+            )
+
+        # Types specified in the test will override the corresponding inferred ones
+        known_columns_to_types.update(values.get("columns", {}))
+
+        rows = values.get("rows")
+        if not all_types_are_known and rows:
+            for col, value in rows[0].items():
+                if col not in known_columns_to_types:
+                    v_type = annotate_types(exp.convert(value)).type or type(value).__name__
+                    v_type = exp.maybe_parse(
+                        v_type, into=exp.DataType, dialect=self._test_adapter_dialect
+                    )
+
+                    if not type_is_known(v_type):
+                        _raise_error(
+                            f"Failed to infer the data type of column '{col}' for '{name}'. This issue can be "
+                            "mitigated by casting the column in the model definition, setting its type in "
+                            "schema.yaml if it's an external model, setting the model's 'columns' property, "
+                            "or setting its 'columns' mapping in the test itself",
+                            self.path,
+                        )
+
+                    known_columns_to_types[col] = v_type
+
+        if rows is None:
+            query_or_df = values["query"]
+        else:
+            query_or_df = self._create_df(values, columns=known_columns_to_types)
+
+        self.engine_adapter.create_view(
+            self._test_fixture_table(name), query_or_df, known_columns_to_types
+        )
+
     def _test_fixture_table(self, name: str) -> exp.Table:
         table = self._fixture_table_cache.get(name)
         if not table:
@@ -433,6 +481,12 @@ class ModelTest(unittest.TestCase):
             # We change the table path below, so this ensures there are no name clashes
             table.this.set("this", "__".join(part.name for part in table.parts))
 
+            # Shared fixture tables are suffixed by their content's hash, since the same input
+            # can have different data across tests
+            key = self._fixture_keys.get(name)
+            if key:
+                table.this.set("this", f"{table.name}__{key}")
+
             table.set("db", self._fixture_schema.copy())
             if self._fixture_catalog:
                 table.set("catalog", self._fixture_catalog.copy())
@@ -462,7 +516,7 @@ class ModelTest(unittest.TestCase):
 
     def _execute(self, query: exp.Query) -> pd.DataFrame:
         """Executes the given query using the testing engine adapter and returns a DataFrame."""
-        with patch.dict(self._test_adapter_dialect.generator_class.TRANSFORMS, self._transforms):
+        with self._patch_transforms():
             return self.engine_adapter.fetchdf(query)
 
     def _create_df(
@@ -551,6 +605,7 @@ class PythonModelTest(ModelTest):
         path: Path | None = None,
         preserve_fixtures: bool = False,
         default_catalog: str | None = None,
+        fixtures: t.Optional[SharedFixtures] = None,
     ) -> None:
         """PythonModelTest encapsulates a unit test for a Python model.
 
@@ -563,6 +618,7 @@ class PythonModelTest(ModelTest):
             dialect: The models' dialect, used for normalization purposes.
             path: An optional path to the test definition yaml file.
             preserve_fixtures: Preserve the fixture tables in the testing database, useful for debugging.
+            fixtures: The fixture tables shared by the tests of a run.
         """
         from sqlmesh.core.test.context import TestExecutionContext
 
@@ -576,6 +632,7 @@ class PythonModelTest(ModelTest):
             path,
             preserve_fixtures,
             default_catalog,
+            fixtures,
         )
 
         self.context = TestExecutionContext(
@@ -600,7 +657,7 @@ class PythonModelTest(ModelTest):
     def _execute_model(self) -> pd.DataFrame:
         """Executes the python model and returns a DataFrame."""
         time_ctx = freeze_time(self._execution_time) if self._execution_time else nullcontext()
-        with patch.dict(self._test_adapter_dialect.generator_class.TRANSFORMS, self._transforms):
+        with self._patch_transforms():
             with t.cast(AbstractContextManager, time_ctx):
                 return t.cast(
                     pd.DataFrame,
@@ -608,6 +665,92 @@ class PythonModelTest(ModelTest):
                 )
 
 
+class SharedFixtures:
+    """The fixture tables shared by the tests of a run.
+
+    Tests whose inputs have the same content use the same fixture table, which is created once per
+    engine adapter when it's first needed and dropped after the last test that uses it is done.
+
+    Args:
+        preserve: Preserve the fixture tables in the testing database, useful for debugging.
+    """
+
+    def __init__(self, preserve: bool = False) -> None:
+        self.preserve = preserve
+
+        self._lock = threading.Lock()
+        self._adapter_locks: t.Dict[int, threading.Lock] = {}
+        self._schemas: t.Dict[int, exp.Identifier] = {}
+        self._created_schemas: t.Dict[int, t.Tuple[EngineAdapter, exp.Table]] = {}
+        self._created_tables: t.Set[t.Tuple[int, str]] = set()
+        self._refcounts: t.Counter[t.Tuple[int, str]] = Counter()
+
+    def schema(self, engine_adapter: EngineAdapter) -> exp.Identifier:
+        """Returns the name of the schema that holds the fixture tables of an engine adapter."""
+        with self._lock:
+            schema = self._schemas.get(id(engine_adapter))
+            if not schema:
+                # The schema name is randomized to avoid concurrency issues
+                schema = exp.to_identifier(f"sqlmesh_test_{random_id(short=True)}")
+                self._schemas[id(engine_adapter)] = schema
+
+        return schema.copy()
+
+    def register(self, engine_adapter: EngineAdapter, key: str) -> None:
+        """Records that a test will use the fixture table with the given key."""
+        with self._lock:
+            self._refcounts[(id(engine_adapter), key)] += 1
+
+    def acquire(
+        self,
+        engine_adapter: EngineAdapter,
+        key: str,
+        table: exp.Table,
+        create: t.Callable[[], None],
+    ) -> None:
+        """Creates the fixture table with the given key, unless it already exists."""
+        adapter_id = id(engine_adapter)
+        with self._lock:
+            adapter_lock = self._adapter_locks.setdefault(adapter_id, threading.Lock())
+
+        with adapter_lock:
+            if (adapter_id, key) in self._created_tables:
+                return
+
+            if adapter_id not in self._created_schemas:
+                schema = schema_(table.args["db"], table.args.get("catalog"))
+                engine_adapter.create_schema(schema)
+                self._created_schemas[adapter_id] = (engine_adapter, schema)
+
+            create()
+            self._created_tables.add((adapter_id, key))
+
+    def release(self, engine_adapter: EngineAdapter, key: str, table: exp.Table) -> None:
+        """Drops the fixture table with the given key once no other test needs it."""
+        adapter_id = id(engine_adapter)
+        with self._lock:
+            self._refcounts[(adapter_id, key)] -= 1
+            drop = (
+                not self.preserve
+                and self._refcounts[(adapter_id, key)] <= 0
+                and (adapter_id, key) in self._created_tables
+            )
+            if drop:
+                self._created_tables.discard((adapter_id, key))
+
+        if drop:
+            engine_adapter.drop_view(table)
+
+    def close(self) -> None:
+        """Drops the schemas of the fixture tables, unless they're preserved."""
+        if not self.preserve:
+            for engine_adapter, schema in self._created_schemas.values():
+                engine_adapter.drop_schema(schema, cascade=True)
+
+        self._created_schemas.clear()
+        self._created_tables.clear()
+
+
 def generate_test(
     model: Model,
     input_queries: t.Dict[str, str],
@@ -759,6 +902,12 @@ def _row_difference(left: pd.DataFrame, right: pd.DataFrame) -> pd.DataFrame:
     return pd.DataFrame(rows_missing_from_right)
 
 
+def _fixture_key(name: str, values: t.Dict[str, t.Any]) -> str:
+    """Hashes the content of a test input, so that identical inputs can share a fixture table."""
+    content = {k: values[k] for k in ("rows", "query", "columns") if k in values}
+    return hash_data([name, json.dumps(content, default=repr)])
+
+
 def _raise_error(msg: str, path: Path | None = None) -> None:
     if path:
         raise TestError(f"{msg} at {path}")
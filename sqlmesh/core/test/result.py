@@ -38,3 +38,19 @@ class ModelTextTestResult(unittest.TextTestResult):
         """
         super().addSuccess(test)
         self.successes.append(test)
+
+    def merge(self, other: ModelTextTestResult) -> None:
+        """Merges the outcomes and the output of another test result into this one.
+
+        Args:
+            other: The test result to merge, whose stream must be an in-memory buffer.
+        """
+        self.stream.write(other.stream.getvalue())  # type: ignore
+        self.stream.flush()
+        self.testsRun += other.testsRun
+        self.failures.extend(other.failures)
+        self.errors.extend(other.errors)
+        self.skipped.extend(other.skipped)
+        self.expectedFailures.extend(other.expectedFailures)
+        self.unexpectedSuccesses.extend(other.unexpectedSuccesses)
+        self.successes.extend(other.successes)
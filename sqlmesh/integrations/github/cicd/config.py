@@ -34,6 +34,7 @@ class GithubCICDBotConfig(BaseConfig):
     pr_include_unmodified: t.Optional[bool] = None
     run_on_deploy_to_prod: bool = True
     pr_environment_name: t.Optional[str] = None
+    enable_table_diff: bool = False
 
     @model_validator(mode="before")
     @model_validator_v1_args
@@ -54,4 +55,5 @@ class GithubCICDBotConfig(BaseConfig):
         "skip_pr_backfill",
         "pr_include_unmodified",
         "run_on_deploy_to_prod",
+        "enable_table_diff",
     }
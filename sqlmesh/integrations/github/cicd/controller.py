@@ -471,6 +471,28 @@ class GithubController:
         except PlanError as e:
             return f"Plan failed to generate. Check for pending or unresolved changes. Error: {e}"
 
+    def get_table_diff_summary(self) -> str:
+        """
+        Diffs the tables of the directly modified models between prod and the PR environment
+        """
+        plan = self.prod_plan_with_gaps
+        models = [plan.context_diff.snapshots[s_id].name for s_id in sorted(plan.directly_modified)]
+        # Clear out any output that might exist from prior steps
+        self._console.clear_captured_outputs()
+        table_diffs = self._context.table_diff_models(
+            source=c.PROD,
+            target=self.pr_environment_name,
+            models=models,
+            show_sample=False,
+        )
+        summary = self._console.consume_captured_output()
+        captured_errors = self._console.consume_captured_errors()
+        if captured_errors:
+            summary = f"{summary}\n**Errors:**\n{captured_errors}"
+        if not table_diffs and not captured_errors:
+            return "No tables to diff."
+        return summary
+
     def run_tests(self) -> t.Tuple[unittest.result.TestResult, str]:
         """
         Run tests for the PR
@@ -814,6 +836,15 @@ class GithubController:
                     table_header = h("thead", [h("tr", row) for row in header_rows])
                     table_body = h("tbody", [h("tr", row) for row in body_rows])
                     summary = str(h("table", [table_header, table_body]))
+                    if self.bot_config.enable_table_diff:
+                        try:
+                            table_diff_summary = self.get_table_diff_summary()
+                        except Exception as e:
+                            logger.debug(
+                                "Table diff failed. Stack trace: " + traceback.format_exc()
+                            )
+                            table_diff_summary = f"Failed to diff tables: {e}"
+                        summary += f"\n\n**Table Diff**\n\n{table_diff_summary}"
                 updated_comment, _ = self.update_sqlmesh_comment_info(
                     value=f"- {check_title}",
                     dedup_regex=rf"- {check_title_static}.*",
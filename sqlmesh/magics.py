@@ -436,6 +436,11 @@ class SQLMeshMagics(Magics):
         action="store_true",
         help="Run for all missing intervals, ignoring individual cron schedules.",
     )
+    @argument(
+        "--profile",
+        action="store_true",
+        help="Display the time, rows and bytes spent on each model after the run and record them in the local run history.",
+    )
     @line_magic
     @pass_sqlmesh_context
     def run_dag(self, context: Context, line: str) -> None:
@@ -448,6 +453,7 @@ class SQLMeshMagics(Magics):
             end=args.end,
             skip_janitor=args.skip_janitor,
             ignore_cron=args.ignore_cron,
+            profile=args.profile,
         )
         if not success:
             raise SQLMeshError("Error Running DAG. Check logs for details.")
@@ -604,6 +610,16 @@ class SQLMeshMagics(Magics):
         default=3,
         help="The number of decimal places to keep when comparing floating point columns. Default: 3",
     )
+    @argument(
+        "--sample-rate",
+        type=float,
+        help="The fraction of rows to compare, sampled deterministically by their join keys.",
+    )
+    @argument(
+        "--segmented",
+        action="store_true",
+        help="Compare checksums of key segments first and only join the rows of the segments that differ.",
+    )
     @line_magic
     @pass_sqlmesh_context
     def table_diff(self, context: Context, line: str) -> None:
@@ -622,6 +638,8 @@ class SQLMeshMagics(Magics):
             limit=args.limit,
             show_sample=args.show_sample,
             decimals=args.decimals,
+            sample_rate=args.sample_rate,
+            segmented=args.segmented,
         )
 
     @magic_arguments()
@@ -814,6 +832,13 @@ class SQLMeshMagics(Magics):
         action="store_true",
         help="Preserve the fixture tables in the testing database, useful for debugging.",
     )
+    @argument(
+        "--num-workers",
+        "-n",
+        type=str,
+        default="1",
+        help="The number of tests to run concurrently, or 'auto' to use one worker per CPU.",
+    )
     @line_magic
     @pass_sqlmesh_context
     def run_test(self, context: Context, line: str) -> None:
@@ -824,6 +849,7 @@ class SQLMeshMagics(Magics):
             tests=args.tests,
             verbose=args.verbose,
             preserve_fixtures=args.preserve_fixtures,
+            num_workers=args.num_workers if args.num_workers == "auto" else int(args.num_workers),
         )
 
     @magic_arguments()
@@ -0,0 +1,105 @@
+"""Store compressed seed contents in chunks keyed by their hash."""
+
+import base64
+import hashlib
+import zlib
+
+import pandas as pd
+from sqlglot import exp
+
+from sqlmesh.utils.migration import blob_text_type, index_text_type
+
+CHUNK_SIZE = 1_000_000
+BATCH_SIZE = 200
+
+
+def migrate(state_sync, **kwargs):  # type: ignore
+    engine_adapter = state_sync.engine_adapter
+
+    seeds_table = "_seeds"
+    new_seeds_table = f"{seeds_table}_v50"
+    seed_contents_table = "_seed_contents"
+
+    if state_sync.schema:
+        seeds_table = f"{state_sync.schema}.{seeds_table}"
+        new_seeds_table = f"{state_sync.schema}.{new_seeds_table}"
+        seed_contents_table = f"{state_sync.schema}.{seed_contents_table}"
+
+    index_type = index_text_type(engine_adapter.dialect)
+    seed_columns_to_types = {
+        "name": exp.DataType.build(index_type),
+        "version": exp.DataType.build(index_type),
+        "content_hash": exp.DataType.build(index_type),
+    }
+    seed_content_columns_to_types = {
+        "content_hash": exp.DataType.build(index_type),
+        "chunk_index": exp.DataType.build("int"),
+        "chunk": exp.DataType.build(blob_text_type(engine_adapter.dialect)),
+    }
+
+    engine_adapter.drop_table(new_seeds_table)
+    engine_adapter.create_state_table(
+        new_seeds_table,
+        seed_columns_to_types,
+        primary_key=("name", "version"),
+    )
+    # No primary key, since concurrent pushes of the same content may store its chunks more than once.
+    engine_adapter.create_state_table(seed_contents_table, seed_content_columns_to_types)
+
+    name_versions = sorted(
+        engine_adapter.fetchall(
+            exp.select("name", "version").from_(seeds_table),
+            quote_identifiers=True,
+        )
+    )
+
+    content_hashes = set()
+    for i in range(0, len(name_versions), BATCH_SIZE):
+        new_seeds = []
+        chunks = []
+        for name, version, content in engine_adapter.fetchall(
+            exp.select("name", "version", "content")
+            .from_(seeds_table)
+            .where(
+                exp.or_(
+                    *[
+                        exp.and_(exp.column("name").eq(name), exp.column("version").eq(version))
+                        for name, version in name_versions[i : i + BATCH_SIZE]
+                    ]
+                )
+            ),
+            quote_identifiers=True,
+        ):
+            content = content or ""
+            content_hash = hashlib.md5(content.encode("utf-8")).hexdigest()
+            new_seeds.append({"name": name, "version": version, "content_hash": content_hash})
+
+            if content_hash not in content_hashes:
+                content_hashes.add(content_hash)
+                compressed = base64.b64encode(zlib.compress(content.encode("utf-8"))).decode(
+                    "ascii"
+                )
+                chunks.extend(
+                    {
+                        "content_hash": content_hash,
+                        "chunk_index": index,
+                        "chunk": compressed[offset : offset + CHUNK_SIZE],
+                    }
+                    for index, offset in enumerate(range(0, len(compressed), CHUNK_SIZE))
+                )
+
+        if new_seeds:
+            engine_adapter.insert_append(
+                new_seeds_table,
+                pd.DataFrame(new_seeds),
+                columns_to_types=seed_columns_to_types,
+            )
+        if chunks:
+            engine_adapter.insert_append(
+                seed_contents_table,
+                pd.DataFrame(chunks),
+                columns_to_types=seed_content_columns_to_types,
+            )
+
+    engine_adapter.drop_table(seeds_table)
+    engine_adapter.rename_table(new_seeds_table, seeds_table)
@@ -9,6 +9,7 @@ import requests
 
 from sqlmesh.core.console import Console
 from sqlmesh.core.environment import Environment
+from sqlmesh.core.model import SeedModel
 from sqlmesh.core.notification_target import NotificationTarget
 from sqlmesh.core.snapshot import Snapshot, SnapshotId
 from sqlmesh.core.snapshot.definition import Interval
@@ -205,7 +206,7 @@ class AirflowClient(BaseAirflowClient):
         execution_time: t.Optional[TimeLike] = None,
     ) -> None:
         request = common.PlanApplicationRequest(
-            new_snapshots=list(new_snapshots),
+            new_snapshots=[_with_seed_content(s) for s in new_snapshots],
             environment=environment,
             no_gaps=no_gaps,
             skip_backfill=skip_backfill,
@@ -369,3 +370,11 @@ def _list_to_json(models: t.Collection[T], batch_size: t.Optional[int] = None) -
 
 def _json_query_param(value: t.Any) -> str:
     return json.dumps(value, separators=(",", ":"))
+
+
+def _with_seed_content(snapshot: Snapshot) -> Snapshot:
+    """Embeds the content of seed files, which Airflow has no access to, into the snapshot."""
+    node = snapshot.node
+    if isinstance(node, SeedModel) and node.seed.path is not None:
+        return snapshot.copy(update={"node": node.copy(update={"seed": node.seed.with_content()})})
+    return snapshot
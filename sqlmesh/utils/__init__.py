@@ -308,7 +308,10 @@ def columns_to_types_to_struct(
     return exp.DataType(
         this=exp.DataType.Type.STRUCT,
         expressions=[
-            exp.ColumnDef(this=exp.to_identifier(k), kind=v) for k, v in columns_to_types.items()
+            exp.ColumnDef(
+                this=exp.to_identifier(k), kind=v.copy() if isinstance(v, exp.DataType) else v
+            )
+            for k, v in columns_to_types.items()
         ],
         nested=True,
     )
@@ -121,6 +121,17 @@ class FileCache(t.Generic[T]):
         with gzip.open(self._cache_entry_path(name, entry_id), "wb", compresslevel=1) as fd:
             pickle.dump(value.dict(), fd)
 
+    def delete(self, name: str) -> None:
+        """Removes all entries with the given name, regardless of their identifiers.
+
+        Args:
+            name: The name of the entries.
+        """
+        entry_path = self._cache_entry_path(name)
+        entry_path.unlink(missing_ok=True)
+        for file in self._path.glob(f"{entry_path.name}__*"):
+            file.unlink(missing_ok=True)
+
     def _cache_entry_path(self, name: str, entry_id: str = "") -> Path:
         entry_file_name = "__".join(p for p in (self._cache_version, name, entry_id) if p)
         return self._path / sanitize_name(entry_file_name)
@@ -1,3 +1,4 @@
+import asyncio
 import typing as t
 from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from threading import Lock
@@ -238,6 +239,95 @@ def sequential_apply_to_dag(
     return node_errors, skipped_nodes
 
 
+async def async_apply_to_dag(
+    dag: DAG[H],
+    fn: t.Callable[[H], t.Awaitable[None]],
+    tasks_num: int,
+    raise_on_error: bool = True,
+) -> t.Tuple[t.List[NodeExecutionFailedError[H]], t.List[H]]:
+    """Applies a coroutine function to the given DAG from a single event loop while preserving
+    the topological order between nodes.
+
+    Unlike `concurrent_apply_to_dag` no threads are involved, which makes it possible to keep a large
+    number of nodes in flight when most of the time is spent waiting on remote engines.
+
+    Args:
+        dag: The target DAG.
+        fn: The coroutine function that will be applied to each node.
+        tasks_num: The maximum number of nodes that can be processed at the same time.
+        raise_on_error: If set to True raises an exception on a first encountered error,
+            otherwises returns a tuple which contains a list of failed nodes and a list of
+            skipped nodes.
+
+    Raises:
+        NodeExecutionFailedError if `raise_on_error` is set to True and execution fails for any node.
+
+    Returns:
+        A pair which contains a list of node errors and a list of skipped nodes.
+    """
+    if tasks_num <= 0:
+        raise ConfigError(f"Invalid number of concurrent tasks {tasks_num}")
+
+    dependencies = dag.graph
+    semaphore = asyncio.Semaphore(tasks_num)
+    tasks: t.Dict[H, asyncio.Task] = {}
+
+    node_errors: t.List[NodeExecutionFailedError[H]] = []
+    skipped_nodes: t.List[H] = []
+
+    async def _process_node(node: H) -> bool:
+        succeeded = await asyncio.gather(*(tasks[dep] for dep in dependencies[node]))
+        if not all(succeeded):
+            skipped_nodes.append(node)
+            return False
+
+        async with semaphore:
+            try:
+                await fn(node)
+            except Exception as ex:
+                error = NodeExecutionFailedError(node)
+                error.__cause__ = ex
+                if raise_on_error:
+                    raise error
+                node_errors.append(error)
+                return False
+        return True
+
+    for node in dag.sorted:
+        tasks[node] = asyncio.ensure_future(_process_node(node))
+
+    try:
+        await asyncio.gather(*tasks.values())
+    except Exception:
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
+
+    return node_errors, skipped_nodes
+
+
+def run_coroutine(coroutine: t.Coroutine[t.Any, t.Any, R]) -> R:
+    """Runs a coroutine to completion in a new event loop and returns its result.
+
+    If an event loop is already running in the calling thread, like in a Jupyter notebook, the new event loop
+    runs in a separate thread.
+
+    Args:
+        coroutine: The coroutine to run.
+
+    Returns:
+        The result of the coroutine.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coroutine).result()
+
+
 def concurrent_apply_to_values(
     values: t.Sequence[A],
     fn: t.Callable[[A], R],
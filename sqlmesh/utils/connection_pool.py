@@ -1,8 +1,11 @@
 import abc
 import logging
+import time
 import typing as t
 from collections import defaultdict
-from threading import Lock, get_ident
+from threading import Condition, Lock, Thread, current_thread, get_ident
+
+from sqlmesh.utils.errors import SQLMeshError
 
 logger = logging.getLogger(__name__)
 
@@ -85,6 +88,12 @@ class ConnectionPool(abc.ABC):
                 with the calling thread.
         """
 
+    def release(self) -> None:
+        """Returns the connection associated with the calling thread back to the pool.
+
+        This is a no-op for pools that don't share connections between threads.
+        """
+
 
 class _TransactionManagementMixin(ConnectionPool):
     def _do_begin(self) -> None:
@@ -270,12 +279,304 @@ class SingletonConnectionPool(_TransactionManagementMixin):
             self.close()
 
 
+class _PooledConnection:
+    def __init__(self, connection: t.Any):
+        self.connection = connection
+        self.cursor: t.Optional[t.Any] = None
+        self.attributes: t.Dict[str, t.Any] = {}
+        self.owner: t.Optional[Thread] = None
+        self.last_used_at = time.monotonic()
+
+    def close(self) -> None:
+        _try_close(self.connection, "connection")
+
+
+class BoundedConnectionPool(_TransactionManagementMixin):
+    """A thread-safe pool which shares a bounded number of connections between threads.
+
+    A thread checks out a connection the first time it needs one and holds on to it until the connection
+    is checked back in. This happens when the thread's transaction completes, when `release` is called,
+    when the thread exits, or when `close_all` is called from another thread with `exclude_calling_thread`
+    set to True. A connection with an active transaction stays pinned to its thread and is never handed
+    to another thread. Attributes are associated with the connection and move with it between threads.
+
+    Args:
+        connection_factory: A callable which produces a new Database API-compliant connection on every call.
+        max_size: The maximum number of connections that can be open at the same time.
+        idle_timeout: The number of seconds after which an idle connection is closed. If not set, idle connections
+            are kept open until the pool is closed.
+        health_check: A function which is called in the calling thread whenever an idle connection is checked out
+            and is expected to raise an exception if the connection is no longer usable. Broken connections are
+            discarded and replaced with new ones.
+        checkout_timeout: The maximum number of seconds to wait for a connection to become available. If not set,
+            waits indefinitely.
+        cursor_kwargs: Key-value arguments that will be passed during cursor construction.
+        cursor_init: A function that is called to initialize a newly created cursor.
+    """
+
+    _DEAD_THREADS_CHECK_INTERVAL_SEC = 1.0
+
+    def __init__(
+        self,
+        connection_factory: t.Callable[[], t.Any],
+        max_size: int,
+        idle_timeout: t.Optional[float] = None,
+        health_check: t.Optional[t.Callable[[], None]] = None,
+        checkout_timeout: t.Optional[float] = None,
+        cursor_kwargs: t.Optional[t.Dict[str, t.Any]] = None,
+        cursor_init: t.Optional[t.Callable[[t.Any], None]] = None,
+    ):
+        if max_size <= 0:
+            raise SQLMeshError(
+                f"The maximum size of a connection pool must be greater than 0. '{max_size}' was provided"
+            )
+        self._connection_factory = connection_factory
+        self._max_size = max_size
+        self._idle_timeout = idle_timeout
+        self._health_check = health_check
+        self._checkout_timeout = checkout_timeout
+        self._cursor_kwargs = cursor_kwargs or {}
+        self._cursor_init = cursor_init
+
+        self._idle: t.List[_PooledConnection] = []
+        self._checked_out: t.Dict[t.Hashable, _PooledConnection] = {}
+        self._transactions: t.Set[t.Hashable] = set()
+        # Includes connections which are currently being opened.
+        self._size = 0
+        self._condition = Condition(Lock())
+
+    @property
+    def max_size(self) -> int:
+        """The maximum number of connections that can be open at the same time."""
+        return self._max_size
+
+    @property
+    def size(self) -> int:
+        """The number of open connections, including idle ones."""
+        with self._condition:
+            return self._size
+
+    @property
+    def idle_size(self) -> int:
+        """The number of connections which are open but not checked out by any thread."""
+        with self._condition:
+            return len(self._idle)
+
+    def get_cursor(self) -> t.Any:
+        pooled = self._get_pooled()
+        if pooled.cursor is None:
+            pooled.cursor = pooled.connection.cursor(**self._cursor_kwargs)
+            if self._cursor_init:
+                self._cursor_init(pooled.cursor)
+        return pooled.cursor
+
+    def get(self) -> t.Any:
+        return self._get_pooled().connection
+
+    def get_attribute(self, key: str) -> t.Optional[t.Any]:
+        return self._get_pooled().attributes.get(key)
+
+    def set_attribute(self, key: str, value: t.Any) -> None:
+        self._get_pooled().attributes[key] = value
+
+    def begin(self) -> None:
+        self._do_begin()
+        with self._condition:
+            self._transactions.add(get_ident())
+
+    def commit(self) -> None:
+        self._do_commit()
+        self._end_transaction()
+
+    def rollback(self) -> None:
+        self._do_rollback()
+        self._end_transaction()
+
+    @property
+    def is_transaction_active(self) -> bool:
+        with self._condition:
+            return get_ident() in self._transactions
+
+    def release(self) -> None:
+        thread_id = get_ident()
+        with self._condition:
+            if thread_id in self._transactions or thread_id not in self._checked_out:
+                return
+            self._checkin(self._checked_out.pop(thread_id))
+            expired = self._pop_expired()
+        _close_all_pooled(expired)
+
+    def close_cursor(self) -> None:
+        with self._condition:
+            pooled = self._checked_out.get(get_ident())
+        if pooled is not None and pooled.cursor is not None:
+            _try_close(pooled.cursor, "cursor")
+            pooled.cursor = None
+
+    def close(self) -> None:
+        thread_id = get_ident()
+        with self._condition:
+            self._transactions.discard(thread_id)
+            pooled = self._checked_out.pop(thread_id, None)
+            if pooled is not None:
+                self._free_slot()
+        if pooled is not None:
+            pooled.close()
+
+    def close_all(self, exclude_calling_thread: bool = False) -> None:
+        calling_thread_id = get_ident()
+        with self._condition:
+            if not exclude_calling_thread:
+                to_close = [*self._idle, *self._checked_out.values()]
+                self._idle.clear()
+                self._checked_out.clear()
+                self._transactions.clear()
+                self._size -= len(to_close)
+                self._condition.notify_all()
+            else:
+                for thread_id, pooled in self._checked_out.copy().items():
+                    if thread_id == calling_thread_id:
+                        continue
+                    if thread_id not in self._transactions:
+                        self._checkin(self._checked_out.pop(thread_id))
+                to_close = [*self._reclaim_from_dead_threads(), *self._pop_expired()]
+        _close_all_pooled(to_close)
+
+    def _get_pooled(self) -> _PooledConnection:
+        thread_id = get_ident()
+        with self._condition:
+            pooled = self._checked_out.get(thread_id)
+        if pooled is not None:
+            return pooled
+
+        while True:
+            pooled, reused = self._checkout(thread_id)
+            if not reused or self._health_check is None:
+                return pooled
+            try:
+                logger.debug("Pinging the database to check the connection")
+                self._health_check()
+                return pooled
+            except Exception:
+                logger.info("Connection to the database was lost. Reconnecting...")
+                self.close()
+
+    def _checkout(self, thread_id: t.Hashable) -> t.Tuple[_PooledConnection, bool]:
+        deadline = (
+            time.monotonic() + self._checkout_timeout
+            if self._checkout_timeout is not None
+            else None
+        )
+        to_close: t.List[_PooledConnection] = []
+        try:
+            with self._condition:
+                while True:
+                    to_close.extend(self._pop_expired())
+                    if self._idle:
+                        pooled = self._idle.pop()
+                        self._bind(thread_id, pooled)
+                        return pooled, True
+                    if self._size < self._max_size:
+                        self._size += 1
+                        break
+                    reclaimed = self._reclaim_from_dead_threads()
+                    if reclaimed:
+                        to_close.extend(reclaimed)
+                        continue
+
+                    wait_timeout = self._DEAD_THREADS_CHECK_INTERVAL_SEC
+                    if deadline is not None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise SQLMeshError(
+                                f"Timed out waiting for a connection from the pool of size {self._max_size}."
+                            )
+                        wait_timeout = min(wait_timeout, remaining)
+                    self._condition.wait(timeout=wait_timeout)
+        finally:
+            _close_all_pooled(to_close)
+
+        try:
+            pooled = _PooledConnection(self._connection_factory())
+        except Exception:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self._bind(thread_id, pooled)
+        return pooled, False
+
+    def _end_transaction(self) -> None:
+        with self._condition:
+            self._transactions.discard(get_ident())
+        self.release()
+
+    def _bind(self, thread_id: t.Hashable, pooled: _PooledConnection) -> None:
+        pooled.owner = current_thread()
+        self._checked_out[thread_id] = pooled
+
+    def _checkin(self, pooled: _PooledConnection) -> None:
+        pooled.owner = None
+        pooled.last_used_at = time.monotonic()
+        self._idle.append(pooled)
+        self._condition.notify()
+
+    def _free_slot(self) -> None:
+        self._size -= 1
+        self._condition.notify()
+
+    def _pop_expired(self) -> t.List[_PooledConnection]:
+        if self._idle_timeout is None or not self._idle:
+            return []
+        threshold = time.monotonic() - self._idle_timeout
+        expired = [p for p in self._idle if p.last_used_at <= threshold]
+        if expired:
+            self._idle = [p for p in self._idle if p.last_used_at > threshold]
+            for pooled in expired:
+                self._free_slot()
+        return expired
+
+    def _reclaim_from_dead_threads(self) -> t.List[_PooledConnection]:
+        """Returns connections held by threads that no longer exist back to the pool.
+
+        Connections with an active transaction can't be reused safely and are returned to be closed instead.
+        """
+        to_close = []
+        for thread_id, pooled in self._checked_out.copy().items():
+            if pooled.owner is not None and pooled.owner.is_alive():
+                continue
+            self._checked_out.pop(thread_id)
+            if thread_id in self._transactions:
+                self._transactions.discard(thread_id)
+                self._free_slot()
+                to_close.append(pooled)
+            else:
+                self._checkin(pooled)
+        return to_close
+
+
 def create_connection_pool(
     connection_factory: t.Callable[[], t.Any],
     multithreaded: bool,
     cursor_kwargs: t.Optional[t.Dict[str, t.Any]] = None,
     cursor_init: t.Optional[t.Callable[[t.Any], None]] = None,
+    max_size: t.Optional[int] = None,
+    idle_timeout: t.Optional[float] = None,
+    health_check: t.Optional[t.Callable[[], None]] = None,
+    checkout_timeout: t.Optional[float] = None,
 ) -> ConnectionPool:
+    if multithreaded and max_size is not None:
+        return BoundedConnectionPool(
+            connection_factory,
+            max_size,
+            idle_timeout=idle_timeout,
+            health_check=health_check,
+            checkout_timeout=checkout_timeout,
+            cursor_kwargs=cursor_kwargs,
+            cursor_init=cursor_init,
+        )
     return (
         ThreadLocalConnectionPool(
             connection_factory, cursor_kwargs=cursor_kwargs, cursor_init=cursor_init
@@ -287,6 +588,11 @@ def create_connection_pool(
     )
 
 
+def _close_all_pooled(pooled_connections: t.Iterable[_PooledConnection]) -> None:
+    for pooled in pooled_connections:
+        pooled.close()
+
+
 def _try_close(closeable: t.Any, kind: str) -> None:
     if closeable is None:
         return
@@ -6,8 +6,11 @@ import re
 import typing as t
 from collections import defaultdict
 from enum import Enum
+from functools import lru_cache
+from types import CodeType
 
 from jinja2 import Environment, Template, nodes
+from jinja2.utils import LRUCache
 from sqlglot import Dialect, Expression, Parser, TokenType
 
 from sqlmesh.core import constants as c
@@ -16,13 +19,67 @@ from sqlmesh.utils import AttributeDict
 from sqlmesh.utils.pydantic import PydanticModel, field_serializer, field_validator
 
 SQLMESH_JINJA_PACKAGE = "sqlmesh.utils.jinja"
+COMPILED_TEMPLATE_CACHE_SIZE = 1000
+
+
+class _Environment(Environment):
+    """A Jinja environment which reuses code compiled from the same template source.
+
+    The cache is shared with environments derived from this one through `overlay`.
+    """
+
+    def __init__(self, *args: t.Any, **kwargs: t.Any):
+        super().__init__(*args, **kwargs)
+        self._code_cache = LRUCache(COMPILED_TEMPLATE_CACHE_SIZE)
+
+    def compile(  # type: ignore
+        self,
+        source: t.Union[str, nodes.Template],
+        name: t.Optional[str] = None,
+        filename: t.Optional[str] = None,
+        raw: bool = False,
+        defer_init: bool = False,
+    ) -> t.Union[str, CodeType]:
+        if not isinstance(source, str) or name or filename or raw or defer_init:
+            return super().compile(source, name, filename, raw, defer_init)
+
+        code = self._code_cache.get(source)
+        if code is None:
+            code = super().compile(source)
+            self._code_cache[source] = code
+        return code
 
 
 def environment(**kwargs: t.Any) -> Environment:
     extensions = kwargs.pop("extensions", [])
     extensions.append("jinja2.ext.do")
     extensions.append("jinja2.ext.loopcontrols")
-    return Environment(extensions=extensions, **kwargs)
+    return _Environment(extensions=extensions, **kwargs)
+
+
+@lru_cache(maxsize=None)
+def _base_environment(create_builtins_module: t.Optional[str]) -> Environment:
+    """Returns an environment with builtin filters that is shared by all registries with the same builtins."""
+    env = environment()
+    if create_builtins_module is not None:
+        module = importlib.import_module(create_builtins_module)
+        if hasattr(module, "create_builtin_filters"):
+            env.filters.update(module.create_builtin_filters())
+    return env
+
+
+@lru_cache(maxsize=COMPILED_TEMPLATE_CACHE_SIZE)
+def _compile_macro(create_builtins_module: t.Optional[str], name: str, definition: str) -> Template:
+    env = _base_environment(create_builtins_module)
+    template: nodes.Template = env.parse(definition)
+    if _is_private_macro(name):
+        # A workaround to expose private jinja macros.
+        for node in template.find_all((nodes.Macro, nodes.Call)):
+            if isinstance(node, nodes.Macro):
+                node.name = _non_private_name(name)
+            elif isinstance(node, nodes.Call) and isinstance(node.node, nodes.Name):
+                node.node.name = _non_private_name(name)
+    return env.from_string(template)
 
 
 ENVIRONMENT = environment()
@@ -192,7 +249,6 @@ class JinjaMacroRegistry(PydanticModel):
     top_level_packages: t.List[str] = []
 
     _parser_cache: t.Dict[t.Tuple[t.Optional[str], str], Template] = {}
-    __environment: t.Optional[Environment] = None
 
     @field_validator("global_objs", mode="before")
     @classmethod
@@ -280,7 +336,8 @@ class JinjaMacroRegistry(PydanticModel):
         if self.root_package_name is not None:
             package_macros[self.root_package_name].update(root_macros)
 
-        env = environment()
+        base_env = self._environment
+        env = base_env.overlay()
 
         builtin_globals = self._create_builtin_globals(kwargs)
         for top_level_package_name in self.top_level_packages:
@@ -297,8 +354,10 @@ class JinjaMacroRegistry(PydanticModel):
         context.update(root_macros)
         context.update(package_macros)
 
-        env.globals.update(context)
-        env.filters.update(self._environment.filters)
+        # The overlay shares globals and filters with the base environment, so they are copied
+        # to keep per-render changes from leaking into other environments.
+        env.globals = {**base_env.globals, **context}
+        env.filters = {**base_env.filters}
         return env
 
     def trim(
@@ -420,21 +479,14 @@ class JinjaMacroRegistry(PydanticModel):
         cache_key = (package, name)
         if cache_key not in self._parser_cache:
             macro = self._get_macro(name, package)
-
-            definition: nodes.Template = self._environment.parse(macro.definition)
-            if _is_private_macro(name):
-                # A workaround to expose private jinja macros.
-                definition = self._to_non_private_macro_def(name, definition)
-
-            self._parser_cache[cache_key] = self._environment.from_string(definition)
+            self._parser_cache[cache_key] = _compile_macro(
+                self.create_builtins_module, name, macro.definition
+            )
         return self._parser_cache[cache_key]
 
     @property
     def _environment(self) -> Environment:
-        if self.__environment is None:
-            self.__environment = environment()
-            self.__environment.filters.update(self._create_builtin_filters())
-        return self.__environment
+        return _base_environment(self.create_builtins_module)
 
     def _trim_macros(
         self,
@@ -480,15 +532,6 @@ class JinjaMacroRegistry(PydanticModel):
     def _get_macro(self, name: str, package: t.Optional[str]) -> MacroInfo:
         return self.packages[package][name] if package is not None else self.root_macros[name]
 
-    def _to_non_private_macro_def(self, name: str, template: nodes.Template) -> nodes.Template:
-        for node in template.find_all((nodes.Macro, nodes.Call)):
-            if isinstance(node, nodes.Macro):
-                node.name = _non_private_name(name)
-            elif isinstance(node, nodes.Call) and isinstance(node.node, nodes.Name):
-                node.node.name = _non_private_name(name)
-
-        return template
-
     def _create_builtin_globals(self, global_vars: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
         """Creates Jinja builtin globals using a factory function defined in the provided module."""
         engine_adapter = global_vars.pop("engine_adapter", None)
@@ -499,14 +542,6 @@ class JinjaMacroRegistry(PydanticModel):
                 return module.create_builtin_globals(self, global_vars, engine_adapter)
         return global_vars
 
-    def _create_builtin_filters(self) -> t.Dict[str, t.Any]:
-        """Creates Jinja builtin filters using a factory function defined in the provided module."""
-        if self.create_builtins_module is not None:
-            module = importlib.import_module(self.create_builtins_module)
-            if hasattr(module, "create_builtin_filters"):
-                return module.create_builtin_filters()
-        return {}
-
     class _MacroWrapper:
         def __init__(
             self,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import ast
+import copy
 import dis
 import importlib
 import inspect
@@ -11,8 +12,10 @@ import sys
 import textwrap
 import types
 import typing as t
+from collections import OrderedDict
 from enum import Enum
 from pathlib import Path
+from threading import Lock
 
 from astor import to_source
 
@@ -380,6 +383,86 @@ def serialize_env(env: t.Dict[str, t.Any], path: Path) -> t.Dict[str, Executable
     return serialized
 
 
+PYTHON_ENV_CACHE_MAX_SIZE = 64 * 1024 * 1024
+"""The maximum total size in bytes of the source code whose compiled form is kept in the python env cache."""
+
+
+_CompiledEnv = t.List[t.Tuple[str, Executable, t.Any]]
+
+
+class _CompiledEnvCache:
+    """A process-wide LRU cache of compiled python environments.
+
+    The cache is bounded by the total size of the cached source code, so that the least recently used
+    environments are evicted once many large environments have been compiled.
+
+    Args:
+        max_size: The maximum total size in bytes of the cached source code.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: OrderedDict[t.Tuple, t.Tuple[int, _CompiledEnv]] = OrderedDict()
+        self._size = 0
+        self._lock = Lock()
+
+    def get_or_compile(self, python_env: t.Dict[str, Executable]) -> _CompiledEnv:
+        """Returns the compiled form of the given python env, compiling it on a cache miss.
+
+        Each entry of the result is a tuple of the name, the executable and either the code object
+        of a function or an import, or the evaluated literal of a value.
+
+        Args:
+            python_env: The dictionary containing the serialized python environment.
+
+        Returns:
+            The compiled python environment in execution order.
+        """
+        executables = sorted(python_env.items(), key=lambda item: 0 if item[1].is_import else 1)
+        key = tuple(
+            (name, executable.kind, executable.payload, executable.name, executable.alias)
+            for name, executable in executables
+        )
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        compiled = [
+            (
+                name,
+                executable,
+                ast.literal_eval(executable.payload)
+                if executable.is_value
+                else compile(executable.payload, "<string>", "exec"),
+            )
+            for name, executable in executables
+        ]
+        size = sum(len(executable.payload) for _, executable in executables)
+
+        with self._lock:
+            if key not in self._entries and size <= self.max_size:
+                self._entries[key] = (size, compiled)
+                self._size += size
+                while self._size > self.max_size:
+                    _, (evicted_size, _) = self._entries.popitem(last=False)
+                    self._size -= evicted_size
+        return compiled
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_compiled_env_cache = _CompiledEnvCache(PYTHON_ENV_CACHE_MAX_SIZE)
+
+
 def prepare_env(
     python_env: t.Dict[str, Executable],
     env: t.Optional[t.Dict[str, t.Any]] = None,
@@ -389,6 +472,9 @@ def prepare_env(
     The Python ENV is stored in a json serializable format.
     Functions and imports are stored as a special data class.
 
+    The code of a python env is only compiled once per process, but it's executed on every call,
+    so that functions are bound to the given env and mutable globals aren't shared between calls.
+
     Args:
         python_env: The dictionary containing the serialized python environment.
         env: The dictionary to execute code in.
@@ -398,13 +484,11 @@ def prepare_env(
     """
     env = {} if env is None else env
 
-    for name, executable in sorted(
-        python_env.items(), key=lambda item: 0 if item[1].is_import else 1
-    ):
+    for name, executable, compiled in _compiled_env_cache.get_or_compile(python_env):
         if executable.is_value:
-            env[name] = ast.literal_eval(executable.payload)
+            env[name] = copy.deepcopy(compiled)
         else:
-            exec(executable.payload, env)
+            exec(compiled, env)
             if executable.alias and executable.name:
                 env[executable.alias] = env[executable.name]
     return env
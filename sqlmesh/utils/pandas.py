@@ -32,8 +32,14 @@ PANDAS_TYPE_MAPPINGS = {
 
 
 def columns_to_types_from_df(df: pd.DataFrame) -> t.Dict[str, exp.DataType]:
+    return columns_to_types_from_dtypes(df.dtypes.items())
+
+
+def columns_to_types_from_dtypes(
+    dtypes: t.Iterable[t.Tuple[t.Hashable, t.Any]],
+) -> t.Dict[str, exp.DataType]:
     result = {}
-    for column_name, column_type in df.dtypes.items():
+    for column_name, column_type in dtypes:
         exp_type = PANDAS_TYPE_MAPPINGS.get(column_type)
         if not exp_type:
             raise ValueError(f"Unsupported pandas type '{column_type}'")
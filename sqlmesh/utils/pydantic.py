@@ -90,6 +90,35 @@ def get_dialect(values: t.Any) -> str:
     return model._dialect if dialect is None else dialect
 
 
+def construct_trusted(model_type: t.Type[Model], **values: t.Any) -> Model:
+    """Creates a model instance without validation.
+
+    This avoids running validators over large collections, but it's only safe to use with values of the
+    right types, like ones taken from another valid model instance. Defaults are not populated, so
+    values for all fields must be provided.
+
+    Args:
+        model_type: The type of the model to create.
+        values: The values of all model fields.
+
+    Returns:
+        The model instance.
+    """
+    instance = model_type.__new__(model_type)
+    object.__setattr__(instance, "__dict__", values)
+    if PYDANTIC_MAJOR_VERSION >= 2:
+        object.__setattr__(instance, "__pydantic_fields_set__", set(values))
+        object.__setattr__(instance, "__pydantic_extra__", None)
+        if model_type.__pydantic_post_init__:  # type: ignore
+            # Initializes private attributes the same way as validation does.
+            instance.model_post_init(None)  # type: ignore
+        else:
+            object.__setattr__(instance, "__pydantic_private__", None)
+    else:
+        object.__setattr__(instance, "__fields_set__", set(values))
+    return instance
+
+
 def _expression_encoder(e: exp.Expression) -> str:
     return e.meta.get("sql") or e.sql(dialect=e.meta.get("dialect"))
 
@@ -165,9 +194,18 @@ class PydanticModel(pydantic.BaseModel):
         return super().json(include=include, **kwargs)  # type: ignore
 
     def copy(self: "Model", **kwargs: t.Any) -> "Model":
-        return (
+        copied = (
             super().model_copy(**kwargs) if PYDANTIC_MAJOR_VERSION >= 2 else super().copy(**kwargs)  # type: ignore
         )
+        if kwargs.get("update"):
+            # Values of cached properties may depend on the updated fields.
+            for key in [
+                key
+                for key in copied.__dict__
+                if isinstance(getattr(type(copied), key, None), cached_property)
+            ]:
+                del copied.__dict__[key]
+        return copied
 
     @property
     def fields_set(self: "Model") -> t.Set[str]:
@@ -4,6 +4,7 @@ import datetime
 import logging
 import typing as t
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from shutil import copytree, rmtree
 from tempfile import TemporaryDirectory
@@ -20,7 +21,7 @@ from sqlglot.helper import ensure_list
 
 from sqlmesh.core.config import DuckDBConnectionConfig
 from sqlmesh.core.context import Context
-from sqlmesh.core.engine_adapter import SparkEngineAdapter
+from sqlmesh.core.engine_adapter import DuckDBEngineAdapter, SparkEngineAdapter
 from sqlmesh.core.engine_adapter.base import EngineAdapter
 from sqlmesh.core.macros import macro
 from sqlmesh.core.model import IncrementalByTimeRangeKind, SqlModel, model
@@ -110,6 +111,50 @@ class DuckDBMetadata:
         return list(engine_adapter.fetchdf(query)[col].to_dict().values())
 
 
+class AsyncDuckDBEngineAdapter(DuckDBEngineAdapter):
+    """A DuckDB engine adapter that emulates an engine which executes submitted scripts remotely.
+
+    Scripts are executed in their own transaction on duplicates of the adapter's connection by a thread pool
+    that stands in for the remote engine, so that asynchronous queries can be tested locally.
+    """
+
+    SUPPORTS_ASYNC_QUERIES = True
+    ASYNC_POLL_INTERVAL_SEC = 0.01
+
+    def __init__(self, *args: t.Any, **kwargs: t.Any):
+        super().__init__(*args, **kwargs)
+        self.engine = ThreadPoolExecutor(max_workers=8)
+        self.submitted_scripts: t.List[t.List[str]] = []
+
+    def close(self) -> t.Any:
+        self.engine.shutdown()
+        return super().close()
+
+    def _submit_query(self, sqls: t.List[str]) -> Future:
+        self.submitted_scripts.append(sqls)
+        return self.engine.submit(self._run_script, self._connection_pool.get().cursor(), sqls)
+
+    def _is_query_done(self, query: Future) -> bool:
+        if not query.done():
+            return False
+        query.result()
+        return True
+
+    @staticmethod
+    def _run_script(cursor: duckdb.DuckDBPyConnection, sqls: t.List[str]) -> None:
+        try:
+            cursor.execute("BEGIN TRANSACTION")
+            try:
+                for sql in sqls:
+                    cursor.execute(sql)
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
+            cursor.execute("COMMIT")
+        finally:
+            cursor.close()
+
+
 class SushiDataValidator:
     def __init__(self, engine_adapter: EngineAdapter):
         self.engine_adapter = engine_adapter
@@ -153,7 +153,7 @@ def test_on_cicd_command(collector: AnalyticsCollector, mocker: MockerFixture):
                 {
                     "seq_num": 1,
                     "event_type": "CICD_COMMAND",
-                    "event": '{"command_name": "test_cicd", "command_args": ["arg_1", "arg_2"], "parent_command_names": ["parent_a", "parent_b"], "cicd_bot_config": {"invalidate_environment_after_deploy": true, "enable_deploy_command": false, "auto_categorize_changes": {"external": "off", "python": "off", "sql": "off", "seed": "off"}, "skip_pr_backfill": true, "run_on_deploy_to_prod": true}}',
+                    "event": '{"command_name": "test_cicd", "command_args": ["arg_1", "arg_2"], "parent_command_names": ["parent_a", "parent_b"], "cicd_bot_config": {"invalidate_environment_after_deploy": true, "enable_deploy_command": false, "auto_categorize_changes": {"external": "off", "python": "off", "sql": "off", "seed": "off"}, "skip_pr_backfill": true, "run_on_deploy_to_prod": true, "enable_table_diff": false}}',
                     **common_fields,
                 }
             ),
@@ -370,3 +370,22 @@ def test_on_migration(collector: AnalyticsCollector, mocker: MockerFixture):
             ),
         ]
     )
+
+
+def test_on_snapshot_evaluation_retry(collector: AnalyticsCollector, mocker: MockerFixture):
+    collector.on_snapshot_evaluation_retry(
+        engine_type="Snowflake", attempt=2, error=SQLMeshError("test_error")
+    )
+
+    collector.flush()
+
+    collector._dispatcher.add_event.assert_called_once_with(  # type: ignore
+        {
+            "seq_num": 0,
+            "event_type": "SNAPSHOT_EVALUATION_RETRY",
+            "event": '{"engine_type": "snowflake", "attempt": 2, "error": "SQLMeshError"}',
+            "user_id": mocker.ANY,
+            "process_id": collector._process_id,
+            "client_ts": mocker.ANY,
+        }
+    )
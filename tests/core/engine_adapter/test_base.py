@@ -1,4 +1,5 @@
 # type: ignore
+import asyncio
 import typing as t
 from datetime import datetime
 from unittest.mock import call
@@ -12,7 +13,7 @@ from sqlglot.helper import ensure_list
 
 from sqlmesh.core.dialect import normalize_model_name
 from sqlmesh.core.engine_adapter import EngineAdapter, EngineAdapterWithIndexSupport
-from sqlmesh.core.engine_adapter.shared import InsertOverwriteStrategy
+from sqlmesh.core.engine_adapter.shared import ExecutionStats, InsertOverwriteStrategy
 from sqlmesh.core.schema_diff import SchemaDiffer, TableAlterOperation
 from sqlmesh.utils import columns_to_types_to_struct
 from sqlmesh.utils.date import to_ds
@@ -968,6 +969,39 @@ MERGE INTO "target" AS "__MERGE_TARGET__" USING (
     )
 
 
+def test_merge_change_detection(make_mocked_engine_adapter: t.Callable, assert_exp_eq):
+    adapter = make_mocked_engine_adapter(EngineAdapter)
+
+    adapter.merge(
+        target_table="target",
+        source_table=t.cast(exp.Select, parse_one('SELECT "ID", val FROM source')),
+        columns_to_types={
+            "ID": exp.DataType.build("int"),
+            "val": exp.DataType.build("int"),
+        },
+        unique_key=[exp.to_identifier("ID", quoted=True)],
+        change_detection=True,
+    )
+
+    assert_exp_eq(
+        adapter.cursor.execute.call_args[0][0],
+        """
+MERGE INTO "target" AS "__MERGE_TARGET__" USING (
+  SELECT
+    "ID",
+    "val"
+  FROM "source"
+) AS "__MERGE_SOURCE__"
+  ON "__MERGE_TARGET__"."ID" = "__MERGE_SOURCE__"."ID"
+  WHEN MATCHED AND MD5(CONCAT(COALESCE(CAST("__MERGE_TARGET__"."ID" AS TEXT), '__SQLMESH_NULL__'), '__SQLMESH_DELIM__', COALESCE(CAST("__MERGE_TARGET__"."val" AS TEXT), '__SQLMESH_NULL__')))
+    <> MD5(CONCAT(COALESCE(CAST("__MERGE_SOURCE__"."ID" AS TEXT), '__SQLMESH_NULL__'), '__SQLMESH_DELIM__', COALESCE(CAST("__MERGE_SOURCE__"."val" AS TEXT), '__SQLMESH_NULL__')))
+    THEN UPDATE SET "__MERGE_TARGET__"."ID" = "__MERGE_SOURCE__"."ID", "__MERGE_TARGET__"."val" = "__MERGE_SOURCE__"."val"
+  WHEN NOT MATCHED THEN INSERT ("ID", "val")
+    VALUES ("__MERGE_SOURCE__"."ID", "__MERGE_SOURCE__"."val")
+""",
+    )
+
+
 def test_scd_type_2_by_time(make_mocked_engine_adapter: t.Callable):
     adapter = make_mocked_engine_adapter(EngineAdapter)
 
@@ -1782,6 +1816,47 @@ FROM "inserted_rows"
     )
 
 
+def test_scd_type_2_incremental_updates(
+    make_mocked_engine_adapter: t.Callable, mocker: MockerFixture
+):
+    adapter = make_mocked_engine_adapter(EngineAdapter)
+    mocker.patch.object(adapter, "_get_temp_table", return_value=exp.to_table("temporary"))
+
+    adapter.scd_type_2_by_column(
+        target_table="target",
+        source_table=t.cast(exp.Select, parse_one("SELECT id, name FROM source")),
+        unique_key=[exp.column("id")],
+        valid_from_col=exp.column("valid_from", quoted=True),
+        valid_to_col=exp.column("valid_to", quoted=True),
+        check_columns=[exp.column("name")],
+        columns_to_types={
+            "id": exp.DataType.build("INT"),
+            "name": exp.DataType.build("VARCHAR"),
+            "valid_from": exp.DataType.build("TIMESTAMP"),
+            "valid_to": exp.DataType.build("TIMESTAMP"),
+        },
+        execution_time=datetime(2020, 1, 1, 0, 0, 0),
+        incremental_updates=True,
+    )
+
+    sql_calls = to_sql_calls(adapter)
+    assert sql_calls[0].startswith('CREATE TABLE "temporary" AS WITH')
+    # Only the current rows of the target table are compared against the source
+    assert (
+        '"latest" AS (SELECT "id", "name", "valid_from", "valid_to", TRUE AS "_sqlmesh_latest" '
+        'FROM "target" WHERE "valid_to" IS NULL)'
+    ) in sql_calls[0]
+    assert sql_calls[1:] == [
+        'MERGE INTO "target" AS "__MERGE_TARGET__" USING (SELECT "id", "name", "valid_from", "valid_to" '
+        'FROM "temporary" WHERE NOT "_sqlmesh_latest" IS NULL) AS "__MERGE_SOURCE__" '
+        'ON "__MERGE_TARGET__"."id" = "__MERGE_SOURCE__"."id" AND "__MERGE_TARGET__"."valid_to" IS NULL '
+        'WHEN MATCHED THEN UPDATE SET "__MERGE_TARGET__"."valid_to" = "__MERGE_SOURCE__"."valid_to"',
+        'INSERT INTO "target" ("id", "name", "valid_from", "valid_to") SELECT "id", "name", '
+        '"valid_from", "valid_to" FROM "temporary" WHERE "_sqlmesh_latest" IS NULL',
+        'DROP TABLE IF EXISTS "temporary"',
+    ]
+
+
 def test_scd_type_2_truncate(make_mocked_engine_adapter: t.Callable):
     adapter = make_mocked_engine_adapter(EngineAdapter)
 
@@ -2674,3 +2749,156 @@ def test_pre_ping(mocker: MockerFixture, make_mocked_engine_adapter: t.Callable)
     ]
 
     adapter._connection_pool.get().close.assert_called_once()
+
+
+def test_is_write_conflict(make_mocked_engine_adapter: t.Callable):
+    adapter = make_mocked_engine_adapter(EngineAdapter)
+    assert not adapter.is_write_conflict(RuntimeError("could not serialize access"))
+
+    adapter.WRITE_CONFLICT_ERROR_MESSAGES = ("could not serialize access",)
+    assert adapter.is_write_conflict(RuntimeError("ERROR: Could not serialize access to table"))
+    assert not adapter.is_write_conflict(RuntimeError("syntax error"))
+
+
+def test_track_execution_stats(make_mocked_engine_adapter: t.Callable):
+    adapter = make_mocked_engine_adapter(EngineAdapter)
+    adapter.cursor.rowcount = 3
+
+    adapter.execute("CREATE TABLE test_table (a INT)")
+    with adapter.track_execution_stats() as stats:
+        adapter.execute(["insert into test_table VALUES (1)", "DELETE FROM test_table"])
+        with adapter.track_execution_stats() as nested_stats:
+            adapter.cursor.rowcount = -1
+            adapter.execute("SELECT 1")
+    adapter.execute("DROP TABLE test_table")
+
+    assert [(s.statement_kind, s.rows_affected) for s in stats] == [
+        ("INSERT", 3),
+        ("DELETE", 3),
+    ]
+    assert [(s.statement_kind, s.rows_affected) for s in nested_stats] == [("SELECT", None)]
+    assert all(s.duration_ms >= 0 for s in stats)
+
+
+def test_is_retryable_error(make_mocked_engine_adapter: t.Callable):
+    class CustomError(Exception):
+        pass
+
+    adapter = make_mocked_engine_adapter(EngineAdapter)
+    adapter.WRITE_CONFLICT_ERROR_MESSAGES = ("could not serialize access",)
+    adapter.TRANSIENT_ERROR_MESSAGES = ("server closed the connection",)
+    assert adapter.is_retryable_error(RuntimeError("could not serialize access"))
+    assert adapter.is_retryable_error(RuntimeError("Server closed the connection unexpectedly"))
+    assert not adapter.is_retryable_error(CustomError("syntax error"))
+
+    adapter = EngineAdapter(lambda: None, retryable_errors=["CustomError"])
+    assert adapter.is_retryable_error(CustomError("syntax error"))
+    assert not adapter.is_retryable_error(RuntimeError("syntax error"))
+
+    adapter = EngineAdapter(lambda: None, retryable_errors=["builtins.LookupError"])
+    assert adapter.is_retryable_error(KeyError("key"))
+    assert not adapter.is_retryable_error(CustomError("syntax error"))
+
+
+def test_deferred_statements(make_mocked_engine_adapter: t.Callable):
+    adapter = make_mocked_engine_adapter(EngineAdapter)
+    # Any use of the connection executes pending statements, so the cursor is retrieved upfront.
+    cursor = adapter.cursor
+
+    with adapter.deferred_statements() as statements:
+        with adapter.transaction():
+            adapter.execute(parse_one("INSERT INTO a VALUES (1)"))
+            adapter.execute(parse_one("INSERT INTO a VALUES (2)"))
+        assert statements == ['INSERT INTO "a" VALUES (1)', 'INSERT INTO "a" VALUES (2)']
+        cursor.execute.assert_not_called()
+
+        with pytest.raises(SQLMeshError, match="already being deferred"):
+            with adapter.deferred_statements():
+                pass
+
+        # Fetching results executes pending statements first, so that the query observes their effects.
+        adapter.fetchone(parse_one("SELECT * FROM a"))
+        assert not statements
+
+        adapter.execute(parse_one("INSERT INTO a VALUES (3)"))
+
+    assert statements == ['INSERT INTO "a" VALUES (3)']
+    assert to_sql_calls(adapter) == [
+        'INSERT INTO "a" VALUES (1)',
+        'INSERT INTO "a" VALUES (2)',
+        "SELECT * FROM a",
+    ]
+    # The transaction is skipped while deferring, only the flushed statements run in one.
+    cursor.begin.assert_called_once()
+    cursor.commit.assert_called_once()
+
+
+def test_execute_async(mocker: MockerFixture, make_mocked_engine_adapter: t.Callable):
+    class FakeAsyncEngineAdapter(EngineAdapter):
+        SUPPORTS_ASYNC_QUERIES = True
+        ASYNC_POLL_INTERVAL_SEC = 0
+
+        def __init__(self, *args: t.Any, **kwargs: t.Any):
+            super().__init__(*args, **kwargs)
+            self.submitted: t.List[t.List[str]] = []
+            self.polls: t.Dict[int, int] = {}
+            self.ended: t.List[t.Tuple[int, bool]] = []
+
+        def _submit_query(self, sqls: t.List[str]) -> int:
+            self.submitted.append(sqls)
+            query_id = len(self.submitted)
+            self.polls[query_id] = 0
+            return query_id
+
+        def _is_query_done(self, query_id: int) -> bool:
+            self.polls[query_id] += 1
+            if self.submitted[query_id - 1] == ["SELECT 'fail'"]:
+                raise RuntimeError("query failed")
+            # Every query completes on the second poll.
+            return self.polls[query_id] > 1
+
+        def _end_query(self, query_id: int, succeeded: bool) -> None:
+            self.ended.append((query_id, succeeded))
+
+    adapter = make_mocked_engine_adapter(FakeAsyncEngineAdapter)
+
+    async def run() -> t.List[ExecutionStats]:
+        with adapter.track_execution_stats() as stats:
+            await asyncio.gather(
+                adapter.execute_async(
+                    [parse_one("DELETE FROM a"), parse_one("INSERT INTO a SELECT 1")]
+                ),
+                adapter.execute_async(parse_one("INSERT INTO b SELECT 1")),
+                adapter.execute_async([]),
+            )
+        return stats
+
+    stats = asyncio.run(run())
+
+    # Statements of the same call are submitted together as a single script.
+    assert sorted(adapter.submitted) == [
+        ['DELETE FROM "a"', 'INSERT INTO "a" SELECT 1'],
+        ['INSERT INTO "b" SELECT 1'],
+    ]
+    assert all(polls == 2 for polls in adapter.polls.values())
+    assert sorted(adapter.ended) == [(1, True), (2, True)]
+    assert sorted(s.statement_kind for s in stats) == ["INSERT", "SCRIPT"]
+    adapter.cursor.execute.assert_not_called()
+
+    with pytest.raises(RuntimeError, match="query failed"):
+        asyncio.run(adapter.execute_async("SELECT 'fail'"))
+    assert adapter.ended[-1] == (3, False)
+
+
+def test_execute_async_fallback(make_mocked_engine_adapter: t.Callable):
+    adapter = make_mocked_engine_adapter(EngineAdapter)
+
+    async def run() -> None:
+        await asyncio.gather(
+            adapter.execute_async(parse_one("SELECT 1")),
+            adapter.execute_async(parse_one("SELECT 2")),
+        )
+
+    asyncio.run(run())
+
+    assert sorted(to_sql_calls(adapter)) == ["SELECT 1", "SELECT 2"]
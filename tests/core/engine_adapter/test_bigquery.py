@@ -1,4 +1,5 @@
 # type: ignore
+import asyncio
 import sys
 import typing as t
 
@@ -550,6 +551,45 @@ def test_begin_end_session(mocker: MockerFixture):
     assert not execute_b_call[1]["job_config"].connection_properties
 
 
+def test_execute_async(mocker: MockerFixture):
+    connection_mock = mocker.NonCallableMock()
+    cursor_mock = mocker.Mock()
+    cursor_mock.connection = connection_mock
+    connection_mock.cursor.return_value = cursor_mock
+
+    job_mock = mocker.Mock()
+    job_mock.done.side_effect = [False, True]
+    job_mock.exception.return_value = None
+    job_mock.num_dml_affected_rows = 3
+    job_mock.total_bytes_processed = 1024
+    job_mock.job_id = "job_id"
+    connection_mock._client.query.return_value = job_mock
+
+    adapter = BigQueryEngineAdapter(lambda: connection_mock, job_retries=0)
+    adapter.ASYNC_POLL_INTERVAL_SEC = 0
+
+    with adapter.track_execution_stats() as stats:
+        asyncio.run(adapter.execute_async(["DELETE FROM a WHERE TRUE", "INSERT INTO a SELECT 1"]))
+
+    # Statements are submitted as a single script, whose job is polled instead of waited on.
+    assert (
+        connection_mock._client.query.call_args[1]["query"]
+        == "DELETE FROM a WHERE TRUE;\nINSERT INTO a SELECT 1"
+    )
+    assert job_mock.done.call_count == 2
+    job_mock.result.assert_not_called()
+    assert [(s.statement_kind, s.rows_affected, s.bytes_processed, s.query_id) for s in stats] == [
+        ("SCRIPT", 3, 1024, "job_id")
+    ]
+
+    job_mock.done.side_effect = None
+    job_mock.done.return_value = True
+    job_mock.exception.return_value = RuntimeError("job failed")
+
+    with pytest.raises(RuntimeError, match="job failed"):
+        asyncio.run(adapter.execute_async("SELECT 2;"))
+
+
 def _to_sql_calls(execute_mock: t.Any, identify: bool = True) -> t.List[str]:
     output = []
     for call in execute_mock.call_args_list:
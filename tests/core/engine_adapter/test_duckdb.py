@@ -68,6 +68,91 @@ def test_replace_query_pandas(adapter: EngineAdapter, duck_conn):
     pd.testing.assert_frame_equal(adapter.fetchdf("SELECT * FROM test_table"), df)
 
 
+def test_merge_change_detection(adapter: EngineAdapter, duck_conn):
+    columns_to_types = {
+        "id": exp.DataType.build("int"),
+        "val": exp.DataType.build("text"),
+    }
+    adapter.create_table("target", columns_to_types)
+    adapter.insert_append(
+        "target",
+        pd.DataFrame({"id": [1, 2, 3], "val": ["a", None, "c"]}),
+        columns_to_types=columns_to_types,
+    )
+    duck_conn.execute("CREATE TABLE tracked AS SELECT rowid AS row_id, id FROM target")
+
+    adapter.merge(
+        "target",
+        parse_one("SELECT * FROM (VALUES (1, 'a'), (2, NULL), (3, 'x'), (4, 'd')) AS t(id, val)"),  # type: ignore
+        columns_to_types=columns_to_types,
+        unique_key=[exp.column("id")],
+        change_detection=True,
+    )
+
+    assert duck_conn.execute("SELECT id, val FROM target ORDER BY id").fetchall() == [
+        (1, "a"),
+        (2, None),
+        (3, "x"),
+        (4, "d"),
+    ]
+    # Unchanged rows are left in place rather than being deleted and inserted again.
+    assert duck_conn.execute(
+        "SELECT t.id FROM target AS t JOIN tracked AS r ON t.rowid = r.row_id AND t.id = r.id ORDER BY 1"
+    ).fetchall() == [(1,), (2,)]
+
+
+@pytest.mark.parametrize("by_time", [True, False])
+def test_scd_type_2_incremental_updates(duck_conn, by_time: bool):
+    columns_to_types = {
+        "id": exp.DataType.build("int"),
+        "name": exp.DataType.build("text"),
+        "updated_at": exp.DataType.build("timestamp"),
+        "valid_from": exp.DataType.build("timestamp"),
+        "valid_to": exp.DataType.build("timestamp"),
+    }
+    if not by_time:
+        columns_to_types.pop("updated_at")
+    batches = [
+        [(1, "a", "2020-01-01"), (2, "b", "2020-01-01"), (3, "c", "2020-01-01")],
+        [(1, "a", "2020-01-01"), (2, "bb", "2020-01-02"), (4, "d", "2020-01-02")],
+        [(1, "a", "2020-01-01"), (3, "c2", "2020-01-03"), (4, None, "2020-01-03")],
+        [(3, "c2", "2020-01-03")],
+    ]
+
+    def _apply(target_table: str, incremental_updates: bool) -> t.List[t.Tuple]:
+        adapter = DuckDBEngineAdapter(lambda: duck_conn)
+        adapter.create_table(target_table, columns_to_types)
+        for i, rows in enumerate(batches):
+            values = ", ".join(
+                f"({id}, {exp.convert(name).sql()}, TIMESTAMP '{updated_at}')"
+                for id, name, updated_at in rows
+            )
+            source = parse_one(
+                f"SELECT {'*' if by_time else 'id, name'} "
+                f"FROM (VALUES {values}) AS t(id, name, updated_at)"
+            )
+            kwargs: t.Dict[str, t.Any] = dict(
+                target_table=target_table,
+                source_table=source,
+                unique_key=[exp.column("id")],
+                valid_from_col=exp.column("valid_from"),
+                valid_to_col=exp.column("valid_to"),
+                execution_time=f"2020-01-0{i + 1}",
+                invalidate_hard_deletes=True,
+                columns_to_types=columns_to_types,
+                truncate=i == 0,
+                incremental_updates=incremental_updates,
+            )
+            if by_time:
+                adapter.scd_type_2_by_time(updated_at_col=exp.column("updated_at"), **kwargs)
+            else:
+                adapter.scd_type_2_by_column(check_columns=exp.Star(), **kwargs)
+        return duck_conn.execute(f"SELECT * FROM {target_table} ORDER BY id, valid_from").fetchall()
+
+    # Appending new versions and closing current rows must yield the same history as a full rewrite
+    assert _apply("scd_incremental", True) == _apply("scd_full", False)
+
+
 def test_set_current_catalog(make_mocked_engine_adapter: t.Callable, duck_conn):
     adapter = make_mocked_engine_adapter(DuckDBEngineAdapter)
     adapter.set_current_catalog("test_catalog")
@@ -70,6 +70,22 @@ def test_logical_merge(make_mocked_engine_adapter: t.Callable, mocker: MockerFix
     )
 
 
+def test_logical_scd_type_2_close_rows(make_mocked_engine_adapter: t.Callable):
+    adapter = make_mocked_engine_adapter(LogicalMergeMixin, "duckdb")
+
+    adapter._scd_type_2_close_rows(
+        "target",
+        parse_one('SELECT id, valid_to FROM "temporary" WHERE NOT _sqlmesh_latest IS NULL'),
+        unique_key=[exp.column("id")],
+        valid_to_col=exp.column("valid_to"),
+    )
+
+    assert to_sql_calls(adapter) == [
+        """DELETE FROM "target" WHERE "valid_to" IS NULL AND CONCAT_WS('__SQLMESH_DELIM__', "id") IN (SELECT CONCAT_WS('__SQLMESH_DELIM__', "id") FROM "temporary" WHERE NOT "_sqlmesh_latest" IS NULL)""",
+        """INSERT INTO "target" ("id", "valid_to") SELECT "id", "valid_to" FROM "temporary" WHERE NOT "_sqlmesh_latest" IS NULL""",
+    ]
+
+
 def test_non_transaction_truncate_mixin(
     make_mocked_engine_adapter: t.Callable, mocker: MockerFixture, make_temp_table_name: t.Callable
 ):
@@ -1,3 +1,4 @@
+import asyncio
 import typing as t
 
 import pandas as pd
@@ -169,3 +170,52 @@ def test_df_to_source_queries_use_schema(
         {"a": exp.DataType.build("INT"), "b": exp.DataType.build("INT")},
     )
     assert 'USE SCHEMA "other_catalog"."other_db"' in to_sql_calls(adapter)
+
+
+def test_execution_stats(make_mocked_engine_adapter: t.Callable):
+    adapter = make_mocked_engine_adapter(SnowflakeEngineAdapter)
+    adapter.cursor.sfqid = "query_id"
+    adapter.cursor.rowcount = 10
+
+    with adapter.track_execution_stats() as stats:
+        adapter.execute(parse_one("INSERT INTO db.tbl SELECT 1"))
+
+    assert len(stats) == 1
+    assert stats[0].statement_kind == "INSERT"
+    assert stats[0].rows_affected == 10
+    assert stats[0].query_id == "query_id"
+
+
+def test_execute_async(make_mocked_engine_adapter: t.Callable):
+    adapter = make_mocked_engine_adapter(SnowflakeEngineAdapter)
+    adapter.ASYNC_POLL_INTERVAL_SEC = 0
+    connection = adapter._connection_factory()
+    cursor = connection.cursor()
+    cursor.sfqid = "query_id"
+    connection.is_still_running.side_effect = [True, False]
+
+    with adapter.track_execution_stats() as stats:
+        asyncio.run(
+            adapter.execute_async([parse_one("DELETE FROM a"), parse_one("INSERT INTO a SELECT 1")])
+        )
+
+    cursor.execute_async.assert_called_once_with(
+        'DELETE FROM "a";\nINSERT INTO "a" SELECT 1', num_statements=2
+    )
+    cursor.execute.assert_not_called()
+    connection.get_query_status_throw_if_error.assert_called_with("query_id")
+    assert connection.is_still_running.call_count == 2
+    assert [(s.statement_kind, s.query_id) for s in stats] == [("SCRIPT", "query_id")]
+    # The session is committed and kept for the next script.
+    connection.commit.assert_called_once()
+    connection.close.assert_not_called()
+    assert adapter._async_connections == [connection]
+
+    connection.get_query_status_throw_if_error.side_effect = RuntimeError("query failed")
+    with pytest.raises(RuntimeError, match="query failed"):
+        asyncio.run(adapter.execute_async(parse_one("INSERT INTO a SELECT 2")))
+
+    # Closing the session of a failed script rolls it back.
+    connection.commit.assert_called_once()
+    connection.close.assert_called_once()
+    assert not adapter._async_connections
@@ -477,6 +477,9 @@ def test_connection_config_serialization():
         "extensions": [],
         "pre_ping": False,
         "connector_config": {},
+        "connection_pool_checkout_timeout": 300.0,
+        "evaluation_retries": 1,
+        "retryable_errors": [],
         "database": "my_db",
     }
     assert serialized["default_test_connection"] == {
@@ -486,6 +489,9 @@ def test_connection_config_serialization():
         "extensions": [],
         "pre_ping": False,
         "connector_config": {},
+        "connection_pool_checkout_timeout": 300.0,
+        "evaluation_retries": 1,
+        "retryable_errors": [],
         "database": "my_test_db",
     }
 
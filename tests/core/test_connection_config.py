@@ -587,6 +587,49 @@ def test_postgres(make_config):
     assert config.is_recommended_for_state_sync is True
 
 
+def test_connection_pool(make_config):
+    config = make_config(
+        type="postgres",
+        host="host",
+        user="user",
+        password="password",
+        port=5432,
+        database="database",
+        concurrent_tasks=4,
+        connection_pool_size=5,
+        connection_pool_idle_timeout=30,
+    )
+    assert config.connection_pool_size == 5
+    assert config.connection_pool_idle_timeout == 30
+    assert config.connection_pool_checkout_timeout == 300
+
+    with pytest.raises(
+        ConfigError,
+        match=r"The connection pool size must be greater than the number of concurrent tasks",
+    ):
+        make_config(
+            type="postgres",
+            host="host",
+            user="user",
+            password="password",
+            port=5432,
+            database="database",
+            concurrent_tasks=4,
+            connection_pool_size=4,
+        )
+
+
+def test_evaluation_retries(make_config):
+    assert make_config(type="duckdb").evaluation_retries == 1
+
+    config = make_config(type="duckdb", evaluation_retries=5, retryable_errors=["IOException"])
+    assert config.evaluation_retries == 5
+    assert config.create_engine_adapter()._retryable_errors == {"IOException"}
+
+    with pytest.raises(ConfigError, match=r"The number of evaluation retries can't be negative"):
+        make_config(type="duckdb", evaluation_retries=-1)
+
+
 def test_gcp_postgres(make_config):
     config = make_config(
         type="gcp_postgres",
@@ -1,4 +1,5 @@
 import logging
+import os
 import pathlib
 import typing as t
 from datetime import date, timedelta
@@ -12,6 +13,7 @@ from sqlglot import parse_one
 from sqlglot.errors import SchemaError
 
 import sqlmesh.core.constants
+import sqlmesh.core.loader
 import sqlmesh.core.dialect as d
 from sqlmesh.core.config import (
     Config,
@@ -24,6 +26,7 @@ from sqlmesh.core.config import (
 from sqlmesh.core.context import Context
 from sqlmesh.core.dialect import parse, schema_
 from sqlmesh.core.environment import Environment
+from sqlmesh.core.loader import SqlMeshLoader
 from sqlmesh.core.model import load_sql_based_model
 from sqlmesh.core.model.kind import ModelKindName
 from sqlmesh.core.plan import BuiltInPlanEvaluator, PlanBuilder
@@ -657,6 +660,81 @@ def test_default_catalog_connections(copy_to_temp_path: t.Callable):
     assert context.default_catalog == "catalog"
 
 
+def test_refresh_incremental(copy_to_temp_path, mocker: MockerFixture):
+    path = copy_to_temp_path("examples/sushi")[0]
+
+    context = Context(paths=path, config="local_config")
+    customers = context.get_model("sushi.customers")
+    top_waiters = context.get_model("sushi.top_waiters")
+
+    def touch(file: pathlib.Path) -> None:
+        mtime = file.stat().st_mtime + 10
+        os.utime(file, (mtime, mtime))
+
+    customers_path = path / "models" / "customers.sql"
+    customers_path.write_text(
+        customers_path.read_text().replace("  d.zip\n", "  d.zip,\n  1 AS new_col\n")
+    )
+    touch(customers_path)
+    new_model_path = path / "models" / "new_model.sql"
+    new_model_path.write_text(
+        "MODEL (name sushi.new_model, kind FULL); SELECT * FROM sushi.customers"
+    )
+
+    load_spy = mocker.spy(SqlMeshLoader, "load")
+    load_model_spy = mocker.spy(SqlMeshLoader, "_load_sql_model")
+    update_schema_spy = mocker.spy(sqlmesh.core.loader, "update_model_schemas")
+
+    context.refresh()
+
+    load_spy.assert_not_called()
+    assert load_model_spy.call_count == 2
+    assert update_schema_spy.call_args.kwargs["names"] == {
+        customers.fqn,
+        context.get_model("sushi.new_model").fqn,
+        context.get_model("sushi.waiter_as_customer_by_day").fqn,
+    }
+
+    assert context.get_model("sushi.customers") is not customers
+    assert "new_col" in context.get_model("sushi.customers").columns_to_types
+    assert "new_col" in context.get_model("sushi.new_model").columns_to_types
+    assert context.get_model("sushi.top_waiters") is top_waiters
+    assert set(context.dag.upstream(context.get_model("sushi.new_model").fqn)) >= {customers.fqn}
+
+    new_model_path.unlink()
+    context.refresh()
+    assert context.get_model("sushi.new_model") is None
+    load_spy.assert_not_called()
+
+    touch(path / "macros" / "macros.py")
+    context.refresh()
+    load_spy.assert_called_once()
+    assert context.get_model("sushi.top_waiters") is not top_waiters
+
+
+def test_refresh_after_upsert_model(copy_to_temp_path, mocker: MockerFixture):
+    path = copy_to_temp_path("examples/sushi")[0]
+
+    context = Context(paths=path, config="local_config")
+    context.upsert_model("sushi.customers", owner="upserted")
+    context.upsert_model("sushi.top_waiters", owner="upserted")
+
+    waiters_path = path / "models" / "waiter_revenue_by_day.sql"
+    mtime = waiters_path.stat().st_mtime + 10
+    os.utime(waiters_path, (mtime, mtime))
+
+    load_spy = mocker.spy(SqlMeshLoader, "load")
+    context.refresh()
+
+    # Upserted models and the schemas derived from them are replaced by a full load.
+    load_spy.assert_called_once()
+    assert context.get_model("sushi.customers").owner != "upserted"
+    assert context.get_model("sushi.top_waiters").owner != "upserted"
+
+    customers = context.upsert_model("sushi.customers", owner="upserted")
+    assert context._loader._project.models[customers.fqn].owner != "upserted"
+
+
 def test_load_external_models(copy_to_temp_path):
     path = copy_to_temp_path("examples/sushi")
 
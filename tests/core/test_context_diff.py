@@ -0,0 +1,73 @@
+import typing as t
+
+import pytest
+from pytest_mock.plugin import MockerFixture
+
+from sqlmesh.core import constants as c
+from sqlmesh.core.context_diff import ContextDiff
+from sqlmesh.core.dialect import parse_one
+from sqlmesh.core.engine_adapter import create_engine_adapter
+from sqlmesh.core.environment import Environment
+from sqlmesh.core.model import SqlModel
+from sqlmesh.core.snapshot import SnapshotChangeCategory
+from sqlmesh.core.state_sync import EngineAdapterStateSync
+
+
+@pytest.fixture
+def state_sync(duck_conn, tmp_path):
+    state_sync = EngineAdapterStateSync(
+        create_engine_adapter(lambda: duck_conn, "duckdb"), schema=c.SQLMESH, context_path=tmp_path
+    )
+    state_sync.migrate(default_catalog=None)
+    return state_sync
+
+
+def test_create_fetches_only_changed_snapshots(
+    state_sync: EngineAdapterStateSync, make_snapshot: t.Callable, mocker: MockerFixture
+):
+    snapshot_a = make_snapshot(SqlModel(name="a", query=parse_one("select 1 as a")))
+    snapshot_b = make_snapshot(SqlModel(name="b", query=parse_one("select 1 as b")))
+    for snapshot in (snapshot_a, snapshot_b):
+        snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+    state_sync.push_snapshots([snapshot_a, snapshot_b])
+    state_sync.promote(
+        Environment(
+            name="prod",
+            snapshots=[snapshot_a.table_info, snapshot_b.table_info],
+            start_at="2022-01-01",
+            end_at="2022-01-01",
+            plan_id="test_plan_id",
+        )
+    )
+
+    new_snapshot_b = make_snapshot(SqlModel(name="b", query=parse_one("select 2 as b")))
+    new_snapshot_c = make_snapshot(SqlModel(name="c", query=parse_one("select 1 as c")))
+
+    get_snapshots_spy = mocker.spy(state_sync, "get_snapshots")
+    context_diff = ContextDiff.create(
+        "prod",
+        {s.name: s for s in (snapshot_a, new_snapshot_b, new_snapshot_c)},
+        create_from="prod",
+        state_reader=state_sync,
+    )
+
+    fetched_snapshot_ids = {
+        s_id for call in get_snapshots_spy.call_args_list for s_id in call.args[0]
+    }
+    assert fetched_snapshot_ids == {
+        snapshot_b.snapshot_id,
+        new_snapshot_b.snapshot_id,
+        new_snapshot_c.snapshot_id,
+    }
+
+    assert context_diff.added == {new_snapshot_c.snapshot_id}
+    assert not context_diff.removed_snapshots
+    assert set(context_diff.modified_snapshots) == {snapshot_b.name}
+    assert context_diff.snapshots[snapshot_a.snapshot_id] == snapshot_a
+    assert context_diff.directly_modified(snapshot_b.name)
+
+    text_diff_spy = mocker.spy(SqlModel, "text_diff")
+    assert "-  1 AS b" in context_diff.text_diff(snapshot_b.name)
+    assert context_diff.text_diff(snapshot_b.name) == context_diff.text_diff(snapshot_b.name)
+    assert text_diff_spy.call_count == 1
+    assert context_diff.text_diff(snapshot_a.name) == ""
@@ -1,3 +1,5 @@
+import sys
+
 import pytest
 from sqlglot import Dialect, ParseError, exp, parse_one
 from sqlglot.dialects.dialect import NormalizationStrategy
@@ -7,12 +9,15 @@ from sqlmesh.core.dialect import (
     JinjaStatement,
     Model,
     format_model_expressions,
+    intern_data_type,
+    intern_schema,
     normalize_model_name,
     parse,
     select_from_values_for_batch_range,
     text_diff,
 )
 from sqlmesh.core.model import SqlModel, load_sql_based_model
+from sqlmesh.utils import columns_to_types_to_struct
 
 
 def test_format_model_expressions():
@@ -592,3 +597,59 @@ def test_conditional_statement():
         q.sql("snowflake")
         == "@IF(TRUE, COPY INTO 's3://example/data.csv' FROM EXTRA.EXAMPLE.TABLE STORAGE_INTEGRATION = S3_INTEGRATION FILE_FORMAT = (TYPE = CSV COMPRESSION = NONE NULL_IF = ('') FIELD_OPTIONALLY_ENCLOSED_BY = '\"') HEADER = TRUE OVERWRITE = TRUE SINGLE = TRUE /* this is a comment */)"
     )
+
+
+def test_intern_data_type():
+    int_type = intern_data_type("int", dialect="duckdb")
+    assert int_type == exp.DataType.build("int")
+    assert int_type.meta["dialect"] == "duckdb"
+    assert intern_data_type("int", dialect="duckdb") is int_type
+    assert intern_data_type(exp.DataType.build("int"), dialect="duckdb") is int_type
+    assert intern_data_type(int_type, dialect="duckdb") is int_type
+    assert intern_data_type("int", dialect="bigquery") is not int_type
+    assert intern_data_type("text", dialect="duckdb") is not int_type
+
+    # Types that only differ in the case of their identifiers are distinct.
+    udts = [
+        intern_data_type(exp.DataType.build(name, dialect="postgres", udt=True), dialect="postgres")
+        for name in ('"MyType"', '"mytype"', "MyType", "mytype")
+    ]
+    assert len({id(udt) for udt in udts}) == 4
+    assert [udt.sql(dialect="postgres") for udt in udts] == [
+        '"MyType"',
+        '"mytype"',
+        "MyType",
+        "mytype",
+    ]
+    struct_types = [
+        intern_data_type(f"STRUCT<{name} INT>", dialect="bigquery") for name in ("Col", "col")
+    ]
+    assert struct_types[0] is not struct_types[1]
+
+    # Data types that retain the original SQL text are only shared if the text is the same.
+    parsed_type = parse("MODEL(name a, columns (a INTEGER)); SELECT 1")[0].find(exp.DataType)
+    assert intern_data_type(parsed_type, dialect="duckdb") is not int_type
+    assert intern_data_type(parsed_type.copy(), dialect="duckdb") is intern_data_type(
+        parsed_type, dialect="duckdb"
+    )
+
+    models = [
+        load_sql_based_model(parse(f"MODEL(name {name}, columns (a INT)); SELECT 1 AS a"))
+        for name in ("a", "b")
+    ]
+    models.append(SqlModel.parse_raw(models[0].json()))
+    shared_type = models[0].columns_to_types["a"]
+    assert all(model.columns_to_types["a"] is shared_type for model in models)
+
+    # The shared instance is copied whenever it's used to build an expression.
+    models[0].render_definition()
+    models[0].ctas_query()
+    columns_to_types_to_struct(models[0].columns_to_types)
+    assert shared_type.parent is None
+
+
+def test_intern_schema():
+    schema = intern_schema({"db": {"table": {"".join(["co", "l"]): "".join(["IN", "T"])}}})
+    ((column, column_type),) = schema["db"]["table"].items()
+    assert column is sys.intern("col")
+    assert column_type is sys.intern("INT")
@@ -474,6 +474,41 @@ def test_transform_no_template(mocker, macro_evaluator):
     spy.assert_not_called()
 
 
+def test_transform_with_plan(mocker, macro_evaluator: MacroEvaluator, assert_exp_eq):
+    assert not MacroEvaluator.compile(parse_one("SELECT a, b FROM x WHERE c > 1"))
+
+    spy = mocker.spy(exp, "replace_tree")
+    expression = parse_one("SELECT a FROM x")
+    transformed = macro_evaluator.transform(expression, plan=MacroEvaluator.compile(expression))
+    assert transformed is not expression
+    assert_exp_eq(transformed, "SELECT a FROM x")
+    spy.assert_not_called()
+
+    sql = """
+        SELECT @EACH([1, 2], x -> x + @y), b, @EACH(['c', 'd'], x -> x), e
+        FROM @tbl
+        WHERE @IF(TRUE, f = @y)
+    """
+    expression = parse_one(sql)
+    plan = MacroEvaluator.compile(expression)
+    assert plan.paths == (
+        (("expressions", 0),),
+        (("expressions", 2),),
+        (("from", None), ("this", None), ("this", None)),
+        (("where", None), ("this", None)),
+    )
+
+    for y, tbl in ((1, "t1"), (2, "t2")):
+        macro_evaluator.locals = {"y": y, "tbl": parse_one(tbl)}
+        assert_exp_eq(
+            macro_evaluator.transform(expression, plan=plan),
+            f"SELECT 1 + {y}, 2 + {y}, b, 'c', 'd', e FROM {tbl} WHERE f = {y}",
+        )
+    assert_exp_eq(expression, sql)
+
+    assert MacroEvaluator.compile(parse_one("@NOOP()")).paths == ((),)
+
+
 def test_macro_coercion(macro_evaluator: MacroEvaluator, assert_exp_eq):
     coerce = macro_evaluator._coerce
     assert coerce(exp.Literal.number(1), int) == 1
@@ -18,7 +18,7 @@ from sqlmesh.core.config import Config
 from sqlmesh.core.config.model import ModelDefaultsConfig
 from sqlmesh.core.context import Context, ExecutionContext
 from sqlmesh.core.dialect import parse
-from sqlmesh.core.macros import MacroEvaluator, macro
+from sqlmesh.core.macros import MacroEvaluator, RuntimeStage, macro
 from sqlmesh.core.model import (
     FullKind,
     IncrementalByTimeRangeKind,
@@ -1279,6 +1279,75 @@ def test_render_query(assert_exp_eq, sushi_context):
     )
 
 
+def test_render_query_runtime_template(mocker: MockerFixture):
+    expressions = d.parse(
+        """
+        MODEL (
+          name db.model,
+          kind INCREMENTAL_BY_TIME_RANGE (time_column ds),
+          dialect duckdb
+        );
+
+        SELECT a, ds, @start_millis AS start_millis
+        FROM db.source
+        WHERE ds BETWEEN @start_ds AND @end_ds AND ts < @end_dt AND @start_ds <= @end_ds
+        """
+    )
+    model = load_sql_based_model(expressions)
+    model.update_schema(
+        MappingSchema({'"db"."source"': {"a": "int", "ds": "text", "ts": "timestamp"}})
+    )
+
+    optimize_query_mock = mocker.spy(model._query_renderer, "_optimize_query")
+
+    for ds in ("2020-01-01", "2020-01-02", "2020-01-03"):
+        runtime_query = model.render_query(
+            start=ds,
+            end=ds,
+            runtime_stage=RuntimeStage.EVALUATING,
+            table_mapping={'"db"."source"': '"db"."source__1"'},
+        )
+        assert runtime_query.sql("duckdb") == model.render_query(
+            start=ds, end=ds, table_mapping={'"db"."source"': '"db"."source__1"'}
+        ).sql("duckdb")
+        assert f"BETWEEN '{ds}' AND '{ds}'" in runtime_query.sql("duckdb")
+        assert '"db"."source__1"' in runtime_query.sql("duckdb")
+
+    # The full render and the template for the first batch + the 3 non-runtime renders
+    assert optimize_query_mock.call_count == 5
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "SELECT @IF(@start_ds > '2020-01-01', a, b) AS c FROM db.source",
+        "SELECT @start_ds FROM db.source",
+        "SELECT a FROM db.source WHERE ds = '{{ start_ds }}'",
+    ],
+)
+def test_render_query_runtime_template_unsupported(query: str, mocker: MockerFixture):
+    model = load_sql_based_model(
+        d.parse(
+            f"""
+            MODEL (name db.model, kind INCREMENTAL_BY_TIME_RANGE (time_column ds), dialect duckdb);
+
+            {query}
+            """
+        )
+    )
+    model.update_schema(MappingSchema({'"db"."source"': {"a": "int", "b": "int", "ds": "text"}}))
+
+    optimize_query_mock = mocker.spy(model._query_renderer, "_optimize_query")
+
+    for ds in ("2020-01-01", "2020-01-02", "2020-01-03"):
+        assert model.render_query(start=ds, end=ds, runtime_stage=RuntimeStage.EVALUATING).sql(
+            "duckdb"
+        ) == model.render_query(start=ds, end=ds).sql("duckdb")
+
+    assert model._query_renderer._runtime_template is None
+    assert optimize_query_mock.call_count >= 6
+
+
 def test_time_column():
     expressions = d.parse(
         """
@@ -0,0 +1,66 @@
+from sqlmesh.core.engine_adapter.shared import ExecutionStats
+from sqlmesh.core.run_history import RunHistory, SnapshotExecutionStats
+from sqlmesh.core.snapshot import SnapshotId
+
+
+def test_run_history(tmp_path):
+    run_history = RunHistory(tmp_path / "cache" / "run_history.duckdb")
+    assert run_history.get_stats() == []
+
+    model_a_stats = SnapshotExecutionStats(
+        snapshot_id=SnapshotId(name='"db"."model_a"', identifier="1"),
+        start_ts=0,
+        end_ts=86400000,
+        batch_index=0,
+        duration_ms=120,
+        queries=[
+            ExecutionStats(statement_kind="CREATE", duration_ms=10),
+            ExecutionStats(
+                statement_kind="INSERT",
+                duration_ms=100,
+                rows_affected=10,
+                bytes_processed=1024,
+                query_id="abc",
+            ),
+            ExecutionStats(statement_kind="INSERT", duration_ms=5, rows_affected=2),
+        ],
+    )
+    model_b_stats = SnapshotExecutionStats(
+        snapshot_id=SnapshotId(name='"db"."model_b"', identifier="2"),
+        start_ts=0,
+        end_ts=86400000,
+        batch_index=0,
+        duration_ms=15,
+    )
+    assert model_a_stats.rows_affected == 12
+    assert model_a_stats.bytes_processed == 1024
+    assert model_b_stats.rows_affected is None
+
+    run_history.record("run_1", [model_a_stats, model_b_stats])
+    run_history.record("run_2", [model_a_stats])
+    run_history.record("run_3", [])
+
+    assert len(run_history.get_stats()) == 3
+    assert run_history.get_stats(run_id="run_1") == [model_a_stats, model_b_stats]
+    assert run_history.get_stats(names=['"db"."model_b"']) == [model_b_stats]
+    assert run_history.get_stats(run_id="run_3") == []
+
+
+def test_run_history_retention(tmp_path, mocker):
+    run_history = RunHistory(tmp_path / "run_history.duckdb", max_runs=2)
+    stats = SnapshotExecutionStats(
+        snapshot_id=SnapshotId(name='"db"."model_a"', identifier="1"),
+        start_ts=0,
+        end_ts=86400000,
+        batch_index=0,
+        duration_ms=120,
+    )
+
+    for i in range(4):
+        mocker.patch("sqlmesh.core.run_history.now_timestamp", return_value=i)
+        run_history.record(f"run_{i}", [stats, stats.copy(update={"batch_index": 1})])
+
+    assert run_history.get_stats(run_id="run_0") == []
+    assert run_history.get_stats(run_id="run_1") == []
+    assert len(run_history.get_stats(run_id="run_2")) == 2
+    assert len(run_history.get_stats(run_id="run_3")) == 2
@@ -2,21 +2,24 @@ import typing as t
 
 import pytest
 from pytest_mock.plugin import MockerFixture
-from sqlglot import parse_one
+from sqlglot import exp, parse_one
 
 from sqlmesh.core.context import Context
 from sqlmesh.core.environment import EnvironmentNamingInfo
 from sqlmesh.core.model.definition import SqlModel
 from sqlmesh.core.model.kind import (
+    FullKind,
     IncrementalByTimeRangeKind,
     IncrementalByUniqueKeyKind,
     TimeColumn,
 )
 from sqlmesh.core.node import IntervalUnit
+from sqlmesh.core.run_history import RunHistory
 from sqlmesh.core.scheduler import Scheduler, compute_interval_params
-from sqlmesh.core.snapshot import Snapshot, SnapshotEvaluator
-from sqlmesh.utils.date import to_datetime
+from sqlmesh.core.snapshot import Snapshot, SnapshotChangeCategory, SnapshotEvaluator
+from sqlmesh.utils.date import to_datetime, to_timestamp
 from sqlmesh.utils.errors import CircuitBreakerError
+from tests.conftest import AsyncDuckDBEngineAdapter
 
 
 @pytest.fixture
@@ -98,6 +101,188 @@ def test_run(sushi_context_fixed_date: Context, scheduler: Scheduler):
     ) == (0, "Hotate", 5.99)
 
 
+@pytest.mark.slow
+def test_run_async_queries(sushi_context_fixed_date: Context, mocker: MockerFixture):
+    connection = sushi_context_fixed_date.engine_adapter._connection_pool.get()
+    adapter = AsyncDuckDBEngineAdapter(lambda: connection)
+    snapshot_evaluator = SnapshotEvaluator(adapter)
+    evaluate_spy = mocker.spy(snapshot_evaluator, "evaluate")
+    console_mock = mocker.Mock()
+    scheduler = Scheduler(
+        sushi_context_fixed_date.snapshots.values(),
+        snapshot_evaluator,
+        sushi_context_fixed_date.state_sync,
+        default_catalog=sushi_context_fixed_date.default_catalog,
+        max_workers=4,
+        console=console_mock,
+    )
+    snapshot = sushi_context_fixed_date.get_snapshot("sushi.items", raise_if_missing=True)
+
+    try:
+        assert scheduler.run(
+            EnvironmentNamingInfo(), "2022-01-01", "2022-01-03", "2022-01-30", profile=True
+        )
+    finally:
+        adapter.engine.shutdown()
+
+    # Only the model with session properties is evaluated synchronously, statements of other model
+    # batches are submitted as scripts instead. Standalone audits don't produce any statements.
+    assert snapshot.model.session_properties
+    assert [call.args[0] for call in evaluate_spy.call_args_list] == [snapshot]
+    deferred_batches = [
+        call.args[0]
+        for call in console_mock.update_snapshot_evaluation_progress.call_args_list
+        if call.args[0].is_model and call.args[0] != snapshot
+    ]
+    assert len(adapter.submitted_scripts) == len(deferred_batches)
+    assert adapter.fetchone(
+        f"""
+        SELECT id, name, price FROM sqlmesh__sushi.sushi__items__{snapshot.version} ORDER BY event_date LIMIT 1
+    """
+    ) == (0, "Hotate", 5.99)
+
+    (profiled_stats,) = console_mock.show_run_profile.call_args[0]
+    orders = sushi_context_fixed_date.get_snapshot("sushi.orders", raise_if_missing=True)
+    orders_stats = next(s for s in profiled_stats if s.snapshot_id == orders.snapshot_id)
+    assert [q.statement_kind for q in orders_stats.queries].count("SCRIPT") == 1
+
+
+def test_run_records_execution_stats(
+    sushi_context_fixed_date: Context, mocker: MockerFixture, tmp_path
+):
+    run_history = RunHistory(tmp_path / "run_history.duckdb")
+    console_mock = mocker.Mock()
+    scheduler = Scheduler(
+        sushi_context_fixed_date.snapshots.values(),
+        sushi_context_fixed_date.snapshot_evaluator,
+        sushi_context_fixed_date.state_sync,
+        default_catalog=None,
+        console=console_mock,
+        run_history=run_history,
+    )
+    snapshot = sushi_context_fixed_date.get_snapshot("sushi.items", raise_if_missing=True)
+
+    assert scheduler.run(
+        EnvironmentNamingInfo(), "2022-01-01", "2022-01-03", "2022-01-30", profile=True
+    )
+
+    stats = run_history.get_stats(names=[snapshot.name])
+    assert [(s.start_ts, s.end_ts) for s in stats] == [
+        (to_timestamp("2022-01-01"), to_timestamp("2022-01-04"))
+    ]
+    assert stats[0].snapshot_id == snapshot.snapshot_id
+    assert stats[0].queries
+    assert {q.statement_kind for q in stats[0].queries} >= {"INSERT"}
+
+    console_mock.show_run_profile.assert_called_once()
+    (profiled_stats,) = console_mock.show_run_profile.call_args[0]
+    assert {s.snapshot_id for s in profiled_stats} == {
+        s.snapshot_id for s in run_history.get_stats()
+    }
+
+
+def test_run_records_execution_stats_only_when_profiling(
+    sushi_context_fixed_date: Context, mocker: MockerFixture, tmp_path
+):
+    run_history = RunHistory(tmp_path / "run_history.duckdb")
+    record_spy = mocker.spy(run_history, "record")
+    scheduler = Scheduler(
+        sushi_context_fixed_date.snapshots.values(),
+        sushi_context_fixed_date.snapshot_evaluator,
+        sushi_context_fixed_date.state_sync,
+        default_catalog=None,
+        console=mocker.Mock(),
+        run_history=run_history,
+    )
+
+    assert scheduler.run(EnvironmentNamingInfo(), "2022-01-01", "2022-01-03", "2022-01-30")
+
+    record_spy.assert_not_called()
+    assert not run_history.path.exists()
+    assert sushi_context_fixed_date.run_history is sushi_context_fixed_date.run_history
+
+
+def test_run_releases_connections(sushi_context_fixed_date: Context, mocker: MockerFixture):
+    scheduler = sushi_context_fixed_date.scheduler()
+    release_spy = mocker.spy(scheduler.snapshot_evaluator.adapter, "release")
+    evaluate_spy = mocker.spy(scheduler, "evaluate")
+
+    assert scheduler.run(EnvironmentNamingInfo(), "2022-01-01", "2022-01-03", "2022-01-30")
+
+    assert evaluate_spy.call_count > 0
+    assert release_spy.call_count == evaluate_spy.call_count
+
+
+def test_run_defers_non_blocking_audits(mocker: MockerFixture, make_snapshot):
+    snapshot: Snapshot = make_snapshot(
+        SqlModel(
+            name="name",
+            kind=FullKind(),
+            cron="@daily",
+            start="2023-01-01",
+            query=parse_one("SELECT id FROM VALUES (1), (2) AS t(id)"),
+            audits=[
+                ("not_null", {"columns": exp.to_column("id")}),
+                ("unique_values_non_blocking", {"columns": exp.to_column("id")}),
+            ],
+        ),
+    )
+    snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+
+    adapter_mock = mocker.MagicMock()
+    adapter_mock.connection_pool_size = None
+    adapter_mock.SUPPORTS_ASYNC_QUERIES = False
+    snapshot_evaluator = SnapshotEvaluator(adapter=adapter_mock, ddl_concurrent_tasks=1)
+    mocker.patch.object(snapshot_evaluator, "evaluate", return_value=None)
+
+    def _audit(*args: t.Any, blocking: t.Optional[bool] = None, **kwargs: t.Any) -> t.List:
+        if blocking is False:
+            raise RuntimeError("Non-blocking audit failed")
+        return []
+
+    audit_mock = mocker.patch.object(snapshot_evaluator, "audit", side_effect=_audit)
+    mock_state_sync = mocker.MagicMock()
+    scheduler = Scheduler(
+        snapshots=[snapshot],
+        snapshot_evaluator=snapshot_evaluator,
+        state_sync=mock_state_sync,
+        max_workers=2,
+        default_catalog=None,
+        console=mocker.Mock(),
+    )
+
+    assert not scheduler.run(
+        EnvironmentNamingInfo(), "2023-01-01", "2023-01-01", "2023-01-02", ignore_cron=True
+    )
+
+    assert [call.kwargs["blocking"] for call in audit_mock.call_args_list] == [True, False]
+    # The interval is added as soon as the blocking audits pass
+    mock_state_sync.add_interval.assert_called_once()
+    # Deferred audits return their connection to the pool as well
+    assert adapter_mock.release.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "connection_pool_size, expected_audit_workers", [(None, 4), (5, 1), (6, 2), (20, 4)]
+)
+def test_max_audit_workers(
+    mocker: MockerFixture,
+    connection_pool_size: t.Optional[int],
+    expected_audit_workers: int,
+):
+    adapter_mock = mocker.MagicMock()
+    adapter_mock.connection_pool_size = connection_pool_size
+    scheduler = Scheduler(
+        snapshots=[],
+        snapshot_evaluator=SnapshotEvaluator(adapter=adapter_mock),
+        state_sync=mocker.MagicMock(),
+        max_workers=4,
+        default_catalog=None,
+        console=mocker.Mock(),
+    )
+    assert scheduler._max_audit_workers == expected_audit_workers
+
+
 def test_incremental_by_unique_key_kind_dag(mocker: MockerFixture, make_snapshot):
     """
     Test that when given a week of data that it batches dates together.
@@ -2,7 +2,8 @@ import pandas as pd
 import pytest
 from sqlglot import exp
 
-from sqlmesh.core.model.seed import CsvSettings, Seed
+from sqlmesh.core.model.seed import CsvSeedReader, CsvSettings, Seed, create_seed
+from sqlmesh.utils.errors import SQLMeshError
 
 
 def test_read():
@@ -81,3 +82,94 @@ def test_column_hashes():
         **seed.reader().column_hashes,
         "ds": "3396890652",
     }
+
+
+def test_read_chunks_from_file(tmp_path):
+    content = "key,value,amount\n" + "".join(
+        f"{i},{'v' if i != 7 else 8},{i if i != 8 else ''}\n" for i in range(10)
+    )
+    seed_path = tmp_path / "seed.csv"
+    seed_path.write_text(content)
+
+    seed = create_seed(seed_path)
+    assert seed.content_ is None
+    assert seed.content == content
+    assert seed.with_content() == Seed(content=content)
+
+    in_memory_reader = Seed(content=content).reader()
+    chunked_reader = CsvSeedReader("", "", CsvSettings(), path=seed_path, chunk_size=3)
+
+    # Types and hashes are the same as if the whole file was read at once
+    assert chunked_reader.columns_to_types == {
+        "key": exp.DataType.build("bigint"),
+        "value": exp.DataType.build("text"),
+        "amount": exp.DataType.build("double"),
+    }
+    assert chunked_reader.columns_to_types == in_memory_reader.columns_to_types
+    assert chunked_reader.column_hashes == in_memory_reader.column_hashes
+
+    dfs = list(chunked_reader.read(batch_size=4))
+    assert [len(df) for df in dfs] == [4, 4, 2]
+    assert all(df["amount"].dtype == "float64" for df in dfs)
+    pd.testing.assert_frame_equal(pd.concat(dfs), next(in_memory_reader.read()), check_dtype=False)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "a\n0\n1\n2\n3\n4\nx\n",
+        "a\nx\ny\nz\n1\n2\n3\n",
+        "a,b\nTrue,1\nFalse,2\nTrue,3\n,4\nFalse,5\nx,6\n",
+        "a,b\n1,1\n2,2\n3,3\n4,4.5\n5,5\nx,6\n",
+    ],
+)
+def test_read_chunks_mixed_types(tmp_path, content):
+    seed_path = tmp_path / "seed.csv"
+    seed_path.write_text(content)
+
+    whole_reader = CsvSeedReader("", "", CsvSettings(), path=seed_path, chunk_size=100)
+    chunked_reader = CsvSeedReader("", "", CsvSettings(), path=seed_path, chunk_size=3)
+
+    assert chunked_reader.columns_to_types == whole_reader.columns_to_types
+    assert chunked_reader.column_hashes == whole_reader.column_hashes
+    pd.testing.assert_frame_equal(
+        pd.concat(chunked_reader.read(batch_size=2)), next(whole_reader.read())
+    )
+
+
+def test_seed_file_changed(tmp_path):
+    seed_path = tmp_path / "seed.csv"
+    seed_path.write_text("a\n1\n")
+
+    seed = create_seed(seed_path)
+    assert seed.content == "a\n1\n"
+
+    seed_path.write_text("a\n2\n")
+    with pytest.raises(SQLMeshError, match="has changed since it was loaded"):
+        seed.content
+    with pytest.raises(SQLMeshError, match="has changed since it was loaded"):
+        seed.reader().columns_to_types
+    with pytest.raises(SQLMeshError, match="has changed since it was loaded"):
+        list(
+            CsvSeedReader(
+                "", "", CsvSettings(), path=seed_path, chunk_size=1, content_hash=seed.content_hash
+            ).read()
+        )
+    assert create_seed(seed_path).content == "a\n2\n"
+
+
+def test_read_file_passes(tmp_path, mocker):
+    seed_path = tmp_path / "seed.csv"
+    seed_path.write_text("a,b\n" + "".join(f"{i},x{i}\n" for i in range(10)))
+    seed = create_seed(seed_path)
+    in_memory_reader = Seed(content=seed.content).reader()
+
+    reader = CsvSeedReader(
+        "", "", CsvSettings(), path=seed_path, chunk_size=3, content_hash=seed.content_hash
+    )
+    parse_spy = mocker.spy(reader, "_parse")
+
+    # Column hashes are computed in the same pass that infers the types
+    assert reader.columns_to_types == in_memory_reader.columns_to_types
+    assert reader.column_hashes == in_memory_reader.column_hashes
+    assert parse_spy.call_count == 1
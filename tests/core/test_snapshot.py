@@ -1,4 +1,5 @@
 import json
+import sys
 import typing as t
 from copy import deepcopy
 from datetime import datetime, timedelta
@@ -37,16 +38,19 @@ from sqlmesh.core.snapshot import (
     Snapshot,
     SnapshotChangeCategory,
     SnapshotFingerprint,
+    SnapshotId,
+    SnapshotNameVersion,
     categorize_change,
     earliest_start_date,
     fingerprint_from_node,
     has_paused_forward_only,
     missing_intervals,
 )
-from sqlmesh.core.snapshot.definition import display_name
+from sqlmesh.core.snapshot.definition import Node, display_name
 from sqlmesh.utils import AttributeDict
 from sqlmesh.utils.date import to_date, to_datetime, to_timestamp
 from sqlmesh.utils.errors import SQLMeshError
+from sqlmesh.utils.hashing import hash_data
 from sqlmesh.utils.jinja import JinjaMacroRegistry, MacroInfo
 
 
@@ -679,6 +683,24 @@ def test_fingerprint(model: Model, parent_model: Model):
     assert new_fingerprint.metadata_hash == fingerprint.metadata_hash
 
 
+def test_fingerprint_deep_dag():
+    models = [SqlModel(name="m0", query=parse_one("SELECT 1 AS a"))]
+    for i in range(1, sys.getrecursionlimit() + 100):
+        models.append(SqlModel(name=f"m{i}", query=parse_one(f"SELECT a FROM m{i - 1}")))
+    nodes: t.Dict[str, Node] = {model.fqn: model for model in models}
+
+    node_hashes = {name: ("data", "metadata") for name in nodes}
+    cache: t.Dict[str, SnapshotFingerprint] = {}
+    fingerprint = fingerprint_from_node(
+        models[-1], nodes=nodes, cache=cache, node_hashes=node_hashes
+    )
+
+    assert len(cache) == len(nodes)
+    assert fingerprint.data_hash == "data"
+    assert fingerprint.metadata_hash == "metadata"
+    assert fingerprint.parent_data_hash == hash_data([cache[models[-2].fqn].to_version()])
+
+
 def test_fingerprint_seed_model():
     expressions = parse(
         """
@@ -806,6 +828,31 @@ def test_fingerprint_virtual_properties(model: Model, parent_model: Model):
     assert updated_fingerprint.data_hash == fingerprint.data_hash
 
 
+def test_trusted_snapshot_ids():
+    snapshot_id = SnapshotId.trusted("a", "1")
+    assert snapshot_id == SnapshotId(name="a", identifier="1")
+    assert hash(snapshot_id) == hash(SnapshotId(name="a", identifier="1"))
+    assert snapshot_id != SnapshotId(name="a", identifier="2")
+    assert snapshot_id.dict() == {"name": "a", "identifier": "1"}
+    assert SnapshotId.parse_raw(snapshot_id.json()) == snapshot_id
+    assert snapshot_id.copy(update={"identifier": "2"}) == SnapshotId(name="a", identifier="2")
+    assert hash(snapshot_id.copy(update={"identifier": "2"})) == hash(
+        SnapshotId(name="a", identifier="2")
+    )
+
+    name_version = SnapshotNameVersion.trusted("a", "1")
+    assert name_version == SnapshotNameVersion(name="a", version="1")
+    assert hash(name_version) == hash(SnapshotNameVersion(name="a", version="1"))
+    assert name_version != SnapshotNameVersion(name="a", version="2")
+    assert name_version.dict() == {"name": "a", "version": "1"}
+
+    fingerprint = SnapshotFingerprint(data_hash="1", metadata_hash="2")
+    assert fingerprint.to_identifier() == hash_data(["1", "2", "0", "0"])
+    assert fingerprint.copy(update={"data_hash": "3"}).to_identifier() == hash_data(
+        ["3", "2", "0", "0"]
+    )
+
+
 def test_stamp(model: Model):
     original_fingerprint = fingerprint_from_node(model, nodes={})
 
@@ -1571,6 +1618,40 @@ def test_deployability_index(make_snapshot):
     assert all(not none_deployable_index.is_representative(s) for s in snapshots.values())
 
 
+def test_deployability_index_deep_dag(make_snapshot):
+    snapshot = make_snapshot(SqlModel(name="a", query=parse_one("SELECT 1")))
+    snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+    forward_only_snapshot = make_snapshot(SqlModel(name="b", query=parse_one("SELECT 1")))
+    forward_only_snapshot.categorize_as(SnapshotChangeCategory.FORWARD_ONLY)
+
+    depth = sys.getrecursionlimit() * 2
+    chain: t.List[Snapshot] = []
+    for i in range(depth):
+        base = forward_only_snapshot if i == depth // 2 else snapshot
+        chain.append(
+            base.copy(
+                update={
+                    "name": f"model_{i}",
+                    "parents": (chain[-1].snapshot_id,) if chain else (),
+                }
+            )
+        )
+
+    deployability_index = DeployabilityIndex.create(chain)
+
+    assert deployability_index.is_deployable(chain[0])
+    assert deployability_index.is_deployable(chain[depth // 2 - 1])
+    assert not deployability_index.is_deployable(chain[depth // 2])
+    assert not deployability_index.is_deployable(chain[-1])
+    assert not deployability_index.is_representative(chain[-1])
+
+    assert DeployabilityIndex.parse_raw(deployability_index.json()) == deployability_index
+    assert deployability_index.with_deployable(chain[0]) is deployability_index
+    assert deployability_index.with_non_deployable(chain[-1]) is deployability_index
+    assert not deployability_index.with_non_deployable(chain[0]).is_deployable(chain[0])
+    assert deployability_index.with_deployable(chain[-1]).is_deployable(chain[-1])
+
+
 def test_deployability_index_unpaused_forward_only(make_snapshot):
     snapshot_a = make_snapshot(SqlModel(name="a", query=parse_one("SELECT 1")))
     snapshot_a.categorize_as(SnapshotChangeCategory.FORWARD_ONLY)
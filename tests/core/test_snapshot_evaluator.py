@@ -7,6 +7,7 @@ from pytest_mock.plugin import MockerFixture
 from sqlglot import expressions as exp
 from sqlglot import parse, parse_one, select
 
+from sqlmesh.core import analytics
 from sqlmesh.core.audit import ModelAudit, StandaloneAudit
 from sqlmesh.core.dialect import schema_, to_schema
 from sqlmesh.core.engine_adapter import EngineAdapter, create_engine_adapter
@@ -38,10 +39,11 @@ from sqlmesh.core.snapshot import (
     SnapshotEvaluator,
     SnapshotTableCleanupTask,
 )
-from sqlmesh.utils.concurrency import NodeExecutionFailedError
+from sqlmesh.utils.concurrency import NodeExecutionFailedError, run_coroutine
 from sqlmesh.utils.date import to_timestamp
 from sqlmesh.utils.errors import ConfigError
 from sqlmesh.utils.metaprogramming import Executable
+from tests.conftest import AsyncDuckDBEngineAdapter
 
 
 @pytest.fixture
@@ -181,6 +183,98 @@ def test_evaluate(mocker: MockerFixture, adapter_mock, make_snapshot):
     )
 
 
+def test_evaluate_retries_transient_errors(mocker: MockerFixture, adapter_mock, make_snapshot):
+    mocker.patch.object(SnapshotEvaluator, "RETRY_BACKOFF_SEC", 0)
+    analytics_mock = mocker.patch.object(analytics.collector, "on_snapshot_evaluation_retry")
+    evaluator = SnapshotEvaluator(adapter_mock, retries=2)
+    # Make sure that errors are not suppressed by the mocked context managers.
+    adapter_mock.transaction.return_value.__exit__.return_value = False
+    adapter_mock.session.return_value.__exit__.return_value = False
+    adapter_mock.dialect = "duckdb"
+
+    transient_error = RuntimeError("could not serialize access due to concurrent update")
+    adapter_mock.insert_overwrite_by_time_partition.side_effect = [transient_error, None]
+    adapter_mock.is_retryable_error.side_effect = lambda e: e is transient_error
+
+    model = SqlModel(
+        name="test_schema.test_model",
+        kind=IncrementalByTimeRangeKind(time_column="a"),
+        query=parse_one("SELECT a::int FROM tbl WHERE ds BETWEEN @start_ds and @end_ds"),
+    )
+    snapshot = make_snapshot(model)
+    snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+
+    on_retry_mock = mocker.Mock()
+    evaluate_kwargs = dict(
+        start="2020-01-01", end="2020-01-02", execution_time="2020-01-02", snapshots={}
+    )
+
+    evaluator.evaluate(snapshot, on_retry=on_retry_mock, **evaluate_kwargs)
+    assert adapter_mock.insert_overwrite_by_time_partition.call_count == 2
+    on_retry_mock.assert_called_once_with(1, transient_error)
+    analytics_mock.assert_called_once_with(engine_type="duckdb", attempt=1, error=transient_error)
+
+    # Errors that are not transient are not retried.
+    adapter_mock.insert_overwrite_by_time_partition.reset_mock()
+    adapter_mock.insert_overwrite_by_time_partition.side_effect = RuntimeError("syntax error")
+    with pytest.raises(RuntimeError, match="syntax error"):
+        evaluator.evaluate(snapshot, **evaluate_kwargs)
+    assert adapter_mock.insert_overwrite_by_time_partition.call_count == 1
+
+    # The number of retries is bounded.
+    adapter_mock.insert_overwrite_by_time_partition.reset_mock()
+    adapter_mock.insert_overwrite_by_time_partition.side_effect = transient_error
+    with pytest.raises(RuntimeError, match="could not serialize access"):
+        evaluator.evaluate(snapshot, **evaluate_kwargs)
+    assert adapter_mock.insert_overwrite_by_time_partition.call_count == 3
+
+    # Evaluations that aren't idempotent are never retried.
+    model = SqlModel(
+        name="test_schema.test_unmanaged_model",
+        kind=IncrementalUnmanagedKind(),
+        query=parse_one("SELECT a::int FROM tbl"),
+    )
+    snapshot = make_snapshot(model)
+    snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+    snapshot.add_interval("2019-12-31", "2020-01-01")
+
+    adapter_mock.insert_append.side_effect = transient_error
+    with pytest.raises(RuntimeError, match="could not serialize access"):
+        evaluator.evaluate(snapshot, **evaluate_kwargs)
+    assert adapter_mock.insert_append.call_count == 1
+
+
+def test_evaluate_retries_with_new_connection(mocker: MockerFixture, make_snapshot):
+    mocker.patch.object(SnapshotEvaluator, "RETRY_BACKOFF_SEC", 0)
+
+    dead_connection = mocker.MagicMock()
+    dead_connection.cursor.return_value.execute.side_effect = ConnectionError("connection closed")
+    live_connection = mocker.MagicMock()
+    connection_factory = mocker.Mock(side_effect=[dead_connection, live_connection])
+
+    adapter = EngineAdapter(
+        connection_factory, multithreaded=True, retryable_errors=["ConnectionError"]
+    )
+    evaluator = SnapshotEvaluator(adapter.with_log_level(logging.INFO), retries=1)
+
+    model = SqlModel(
+        name="test_schema.test_model",
+        kind=IncrementalByTimeRangeKind(time_column="a"),
+        query=parse_one("SELECT a::int FROM tbl WHERE ds BETWEEN @start_ds and @end_ds"),
+    )
+    snapshot = make_snapshot(model)
+    snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+
+    evaluator.evaluate(
+        snapshot, start="2020-01-01", end="2020-01-02", execution_time="2020-01-02", snapshots={}
+    )
+
+    # The broken connection is discarded and the retry runs on a new one
+    assert connection_factory.call_count == 2
+    dead_connection.close.assert_called_once()
+    live_connection.cursor.return_value.execute.assert_called()
+
+
 def test_runtime_stages(capsys, mocker, adapter_mock, make_snapshot):
     evaluator = SnapshotEvaluator(adapter_mock)
 
@@ -263,6 +357,8 @@ def test_promote(mocker: MockerFixture, adapter_mock, make_snapshot):
         column_descriptions=None,
         view_properties={},
     )
+    # The connection is returned to the pool once the snapshot has been promoted
+    adapter_mock.release.assert_called_once_with()
 
 
 def test_demote(mocker: MockerFixture, adapter_mock, make_snapshot):
@@ -928,6 +1024,46 @@ def test_evaluate_creation_duckdb(
     assert duck_conn.execute(f"SELECT * FROM sqlmesh__db.db__model__{version}").fetchall() == [(1,)]
 
 
+def test_evaluate_async_duckdb(
+    snapshot: Snapshot,
+    duck_conn,
+    date_kwargs: t.Dict[str, str],
+    mocker: MockerFixture,
+):
+    mocker.patch.object(SnapshotEvaluator, "RETRY_BACKOFF_SEC", 0)
+    adapter = AsyncDuckDBEngineAdapter(lambda: duck_conn)
+    evaluator = SnapshotEvaluator(adapter, retries=1)
+    evaluator.create([snapshot], {})
+
+    transient_error = RuntimeError("could not serialize access due to concurrent update")
+    mocker.patch.object(adapter, "is_retryable_error", side_effect=lambda e: e is transient_error)
+    is_query_done = adapter._is_query_done
+
+    def _fail_first_script(query: t.Any) -> bool:
+        if len(adapter.submitted_scripts) == 1:
+            query.result()
+            raise transient_error
+        return is_query_done(query)
+
+    mocker.patch.object(adapter, "_is_query_done", side_effect=_fail_first_script)
+    on_retry_mock = mocker.Mock()
+
+    try:
+        run_coroutine(
+            evaluator.evaluate_async(snapshot, snapshots={}, on_retry=on_retry_mock, **date_kwargs)
+        )
+    finally:
+        adapter.engine.shutdown()
+
+    # The failed script is submitted again after the model is rendered anew.
+    assert len(adapter.submitted_scripts) == 2
+    assert adapter.submitted_scripts[0] == adapter.submitted_scripts[1]
+    on_retry_mock.assert_called_once_with(1, transient_error)
+    assert duck_conn.execute(
+        f"SELECT * FROM sqlmesh__db.db__model__{snapshot.version}"
+    ).fetchall() == [(1,)]
+
+
 def test_migrate_duckdb(snapshot: Snapshot, duck_conn, make_snapshot):
     evaluator = SnapshotEvaluator(create_engine_adapter(lambda: duck_conn, "duckdb"))
     evaluator.create([snapshot], {})
@@ -1402,6 +1538,7 @@ def test_insert_into_scd_type_2_by_time(
         column_descriptions={},
         updated_at_as_valid_from=False,
         truncate=truncate,
+        incremental_updates=False,
     )
 
 
@@ -1569,6 +1706,7 @@ def test_insert_into_scd_type_2_by_column(
         table_description=None,
         column_descriptions={},
         truncate=truncate,
+        incremental_updates=False,
     )
 
 
@@ -1628,6 +1766,50 @@ def test_create_incremental_by_unique_key_updated_at_exp(adapter_mock, make_snap
                 ],
             ),
         ),
+        change_detection=False,
+    )
+
+
+def test_evaluate_incremental_by_unique_key_change_detection(adapter_mock, make_snapshot):
+    evaluator = SnapshotEvaluator(adapter_mock)
+    model = load_sql_based_model(
+        parse(  # type: ignore
+            """
+            MODEL (
+                name test_schema.test_model,
+                kind INCREMENTAL_BY_UNIQUE_KEY (
+                    unique_key [id],
+                    change_detection true
+                )
+            );
+
+            SELECT id::int, name::string FROM tbl;
+            """
+        )
+    )
+
+    snapshot = make_snapshot(model)
+    snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+    snapshot.intervals = [(to_timestamp("2020-01-01"), to_timestamp("2020-01-02"))]
+
+    evaluator.evaluate(
+        snapshot,
+        start="2020-01-01",
+        end="2020-01-02",
+        execution_time="2020-01-02",
+        snapshots={},
+    )
+
+    adapter_mock.merge.assert_called_once_with(
+        snapshot.table_name(),
+        model.render_query(),
+        columns_to_types={
+            "id": exp.DataType.build("INT"),
+            "name": exp.DataType.build("STRING"),
+        },
+        unique_key=[exp.to_column("id", quoted=True)],
+        when_matched=None,
+        change_detection=True,
     )
 
 
@@ -1792,6 +1974,49 @@ def test_audit_wap(adapter_mock, make_snapshot):
     adapter_mock.wap_publish.assert_called_once_with(snapshot.table_name(), wap_id)
 
 
+def test_audit_batches_filter_audits(duck_conn, make_snapshot, mocker: MockerFixture):
+    adapter = create_engine_adapter(lambda: duck_conn, "duckdb")
+    evaluator = SnapshotEvaluator(adapter)
+
+    custom_audit = ModelAudit(
+        name="custom_audit",
+        query="SELECT * FROM @this_model WHERE a > @threshold",
+    )
+    model = SqlModel(
+        name="test_schema.test_table",
+        kind=FullKind(),
+        query=parse_one("SELECT a::int, b::int FROM tbl"),
+        audits=[
+            ("not_null", {"columns": exp.to_column("a")}),
+            ("accepted_values", {"column": exp.to_column("b"), "is_in": parse_one("(1, 2)")}),
+            ("unique_values", {"columns": exp.to_column("a")}),
+            ("custom_audit", {"threshold": exp.Literal.number(1)}),
+        ],
+    )
+    snapshot = make_snapshot(model, audits={custom_audit.name: custom_audit})
+    snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+
+    adapter.create_schema(schema_(snapshot.physical_schema))
+    adapter.execute(
+        f"CREATE TABLE {snapshot.table_name()} AS "
+        "SELECT * FROM (VALUES (1, 1), (2, 3), (NULL, 3), (2, 2)) AS t(a, b)"
+    )
+
+    fetchone_spy = mocker.spy(adapter, "fetchone")
+    results = evaluator.audit(snapshot, snapshots={}, raise_exception=False)
+
+    assert [(result.audit.name, result.count) for result in results] == [
+        ("not_null", 1),
+        ("accepted_values", 2),
+        ("unique_values", 1),
+        ("custom_audit", 2),
+    ]
+    assert all(result.query for result in results)
+
+    # The not_null, accepted_values and custom audits are evaluated with a single query
+    assert fetchone_spy.call_count == 2
+
+
 def test_create_post_statements_use_deployable_table(
     mocker: MockerFixture, adapter_mock, make_snapshot
 ):
@@ -30,6 +30,7 @@ from sqlmesh.core.snapshot import (
     SnapshotChangeCategory,
     SnapshotId,
     SnapshotIntervals,
+    SnapshotNameVersion,
     SnapshotTableCleanupTask,
     missing_intervals,
 )
@@ -46,6 +47,7 @@ from sqlmesh.core.state_sync.base import (
 )
 from sqlmesh.utils.date import now_timestamp, to_datetime, to_timestamp
 from sqlmesh.utils.errors import SQLMeshError
+from sqlmesh.utils.hashing import md5
 
 pytestmark = pytest.mark.slow
 
@@ -1095,10 +1097,11 @@ def test_delete_expired_snapshots_seed(
     state_sync.push_snapshots([snapshot])
     assert set(state_sync.get_snapshots(None)) == {snapshot.snapshot_id}
     assert state_sync.engine_adapter.fetchall(
-        "SELECT name, version, content FROM sqlmesh._seeds"
+        "SELECT name, version, content_hash FROM sqlmesh._seeds"
     ) == [
-        (snapshot.name, snapshot.version, snapshot.model.seed.content),
+        (snapshot.name, snapshot.version, md5([snapshot.model.seed.content])),
     ]
+    assert state_sync.engine_adapter.fetchall("SELECT * FROM sqlmesh._seed_contents")
 
     assert state_sync.delete_expired_snapshots() == [
         SnapshotTableCleanupTask(snapshot=snapshot.table_info, dev_table_only=False),
@@ -1106,6 +1109,7 @@ def test_delete_expired_snapshots_seed(
 
     assert not state_sync.get_snapshots(None)
     assert not state_sync.engine_adapter.fetchall("SELECT * FROM sqlmesh._seeds")
+    assert not state_sync.engine_adapter.fetchall("SELECT * FROM sqlmesh._seed_contents")
 
 
 def test_delete_expired_snapshots_batching(
@@ -1614,6 +1618,7 @@ def test_first_migration_failure(duck_conn, mocker: MockerFixture, tmp_path) ->
     assert not state_sync.engine_adapter.table_exists(state_sync.environments_table)
     assert not state_sync.engine_adapter.table_exists(state_sync.versions_table)
     assert not state_sync.engine_adapter.table_exists(state_sync.seeds_table)
+    assert not state_sync.engine_adapter.table_exists(state_sync.seed_contents_table)
     assert not state_sync.engine_adapter.table_exists(state_sync.intervals_table)
 
 
@@ -1781,6 +1786,164 @@ def test_seed_hydration(
     assert stored_snapshot.model.seed.content == "header\n1\n2"
 
 
+def test_seed_contents_deduplicated(
+    state_sync: EngineAdapterStateSync,
+    make_snapshot: t.Callable,
+    mocker: MockerFixture,
+):
+    mocker.patch.object(state_sync, "SEED_CONTENT_CHUNK_SIZE", 8)
+
+    content = "header\n" + "\n".join(str(i) for i in range(100))
+    snapshots = []
+    for name in ("a", "b"):
+        snapshot = make_snapshot(
+            SeedModel(
+                name=name,
+                kind=SeedKind(path="./path/to/seed"),
+                seed=Seed(content=content),
+                column_hashes={"header": "hash"},
+                depends_on=set(),
+            )
+        )
+        snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+        snapshots.append(snapshot)
+    snapshot_a, snapshot_b = snapshots
+
+    state_sync.push_snapshots([snapshot_a])
+    state_sync.push_snapshots([snapshot_b])
+
+    chunks = state_sync.engine_adapter.fetchall(
+        "SELECT DISTINCT content_hash, chunk_index FROM sqlmesh._seed_contents"
+    )
+    assert len(chunks) > 1
+    assert {content_hash for content_hash, _ in chunks} == {md5([content])}
+    assert len(state_sync.engine_adapter.fetchall("SELECT * FROM sqlmesh._seed_contents")) == len(
+        chunks
+    )
+
+    stored_snapshots = state_sync.get_snapshots(snapshots, hydrate_seeds=True)
+    assert all(s.model.seed.content == content for s in stored_snapshots.values())
+
+    state_sync._delete_seeds([snapshot_a])
+    assert len(state_sync.engine_adapter.fetchall("SELECT * FROM sqlmesh._seed_contents")) == len(
+        chunks
+    )
+    stored_snapshot = state_sync.get_snapshots([snapshot_b], hydrate_seeds=True)[
+        snapshot_b.snapshot_id
+    ]
+    assert stored_snapshot.model.seed.content == content
+
+    state_sync._delete_seeds([snapshot_b])
+    assert not state_sync.engine_adapter.fetchall("SELECT * FROM sqlmesh._seed_contents")
+
+
+def test_seed_contents_pushed_concurrently(
+    state_sync: EngineAdapterStateSync,
+    make_snapshot: t.Callable,
+    mocker: MockerFixture,
+):
+    mocker.patch.object(state_sync, "SEED_CONTENT_CHUNK_SIZE", 8)
+
+    content = "header\n" + "\n".join(str(i) for i in range(100))
+    snapshots = []
+    for name in ("a", "b"):
+        snapshot = make_snapshot(
+            SeedModel(
+                name=name,
+                kind=SeedKind(path="./path/to/seed"),
+                seed=Seed(content=content),
+                column_hashes={"header": "hash"},
+                depends_on=set(),
+            )
+        )
+        snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+        snapshots.append(snapshot)
+    snapshot_a, snapshot_b = snapshots
+
+    state_sync.push_snapshots([snapshot_a])
+    # Simulate another push of the same content that didn't see the chunks stored by the first one.
+    with patch.object(state_sync, "_fetchall", return_value=[]):
+        state_sync._push_seed_contents({md5([content]): content})
+
+    chunks = state_sync.engine_adapter.fetchall(
+        "SELECT DISTINCT content_hash, chunk_index FROM sqlmesh._seed_contents"
+    )
+    assert len(
+        state_sync.engine_adapter.fetchall("SELECT * FROM sqlmesh._seed_contents")
+    ) == 2 * len(chunks)
+
+    stored_snapshot = state_sync.get_snapshots([snapshot_a], hydrate_seeds=True)[
+        snapshot_a.snapshot_id
+    ]
+    assert stored_snapshot.model.seed.content == content
+
+    state_sync._delete_seeds([snapshot_a])
+    assert not state_sync.engine_adapter.fetchall("SELECT * FROM sqlmesh._seed_contents")
+
+
+def test_migrate_seed_contents(state_sync: EngineAdapterStateSync, mocker: MockerFixture):
+    from sqlmesh.migrations import v0050_store_seed_contents_by_hash
+
+    mocker.patch.object(v0050_store_seed_contents_by_hash, "BATCH_SIZE", 2)
+    mocker.patch.object(v0050_store_seed_contents_by_hash, "CHUNK_SIZE", 8)
+
+    engine_adapter = state_sync.engine_adapter
+    engine_adapter.drop_table("sqlmesh._seeds")
+    engine_adapter.drop_table("sqlmesh._seed_contents")
+    legacy_seeds = pd.DataFrame(
+        [
+            {"name": '"a"', "version": "1", "content": "header\n1\n2"},
+            {"name": '"a"', "version": "2", "content": "header\n1\n2\n3"},
+            {"name": '"b"', "version": "1", "content": "header\n1\n2"},
+            {"name": '"c"', "version": "1", "content": None},
+        ]
+    )
+    engine_adapter.create_state_table(
+        "sqlmesh._seeds",
+        {
+            "name": exp.DataType.build("text"),
+            "version": exp.DataType.build("text"),
+            "content": exp.DataType.build("text"),
+        },
+        primary_key=("name", "version"),
+    )
+    engine_adapter.insert_append(
+        "sqlmesh._seeds",
+        legacy_seeds,
+        columns_to_types={
+            "name": exp.DataType.build("text"),
+            "version": exp.DataType.build("text"),
+            "content": exp.DataType.build("text"),
+        },
+    )
+
+    v0050_store_seed_contents_by_hash.migrate(state_sync)
+
+    assert sorted(engine_adapter.fetchall("SELECT * FROM sqlmesh._seeds")) == [
+        ('"a"', "1", md5(["header\n1\n2"])),
+        ('"a"', "2", md5(["header\n1\n2\n3"])),
+        ('"b"', "1", md5(["header\n1\n2"])),
+        ('"c"', "1", md5([""])),
+    ]
+    chunks = engine_adapter.fetchall("SELECT content_hash, chunk_index FROM sqlmesh._seed_contents")
+    assert len(chunks) == len(set(chunks))
+    assert {content_hash for content_hash, _ in chunks} == {
+        md5(["header\n1\n2"]),
+        md5(["header\n1\n2\n3"]),
+        md5([""]),
+    }
+
+    name_versions = [('"a"', "1"), ('"a"', "2"), ('"b"', "1"), ('"c"', "1")]
+    assert state_sync._get_seed_contents(
+        [SnapshotNameVersion(name=name, version=version) for name, version in name_versions]
+    ) == {
+        ('"a"', "1"): "header\n1\n2",
+        ('"a"', "2"): "header\n1\n2\n3",
+        ('"b"', "1"): "header\n1\n2",
+        ('"c"', "1"): "",
+    }
+
+
 def test_nodes_exist(state_sync: EngineAdapterStateSync, make_snapshot: t.Callable):
     snapshot = make_snapshot(
         SqlModel(
@@ -2224,7 +2387,6 @@ def test_snapshot_batching(state_sync, mocker, make_snapshot):
                 "a",
                 "1",
                 "1",
-                None,
             ],
             [
                 make_snapshot(
@@ -2233,7 +2395,6 @@ def test_snapshot_batching(state_sync, mocker, make_snapshot):
                 "a",
                 "2",
                 "2",
-                None,
             ],
         ],
         [
@@ -2244,7 +2405,6 @@ def test_snapshot_batching(state_sync, mocker, make_snapshot):
                 "a",
                 "3",
                 "3",
-                None,
             ],
         ],
     ]
@@ -1,9 +1,14 @@
+from unittest.mock import patch
+
 import pytest
 import pandas as pd
 from sqlglot import exp
 
 from sqlmesh.core.config import AutoCategorizationMode, CategorizerConfig
+from sqlmesh.core.engine_adapter import create_engine_adapter
 from sqlmesh.core.model import SqlModel
+from sqlmesh.core.table_diff import TableDiff, _hash
+from sqlmesh.utils.errors import SQLMeshError
 
 
 @pytest.mark.slow
@@ -134,3 +139,121 @@ def test_data_diff_decimals(sushi_context_fixed_date):
     )
     assert diff.row_diff().full_match_count == 2
     assert diff.row_diff().partial_match_count == 1
+
+
+def test_data_diff_segmented_and_sampled(duck_conn):
+    adapter = create_engine_adapter(lambda: duck_conn, "duckdb")
+    adapter.execute(
+        "CREATE TABLE table_diff_source AS SELECT range AS key, range * 1.5 AS value, 'x' AS name FROM range(30000)"
+    )
+    adapter.execute(
+        """
+        CREATE TABLE table_diff_target AS
+        SELECT key, CASE WHEN key IN (10, 20000) THEN 0 ELSE value END AS value, name
+        FROM table_diff_source
+        WHERE key <> 5
+        UNION ALL
+        SELECT 30000, 1, 'y'
+        """
+    )
+
+    def _diff(**kwargs):
+        return TableDiff(
+            adapter=adapter,
+            source="table_diff_source",
+            target="table_diff_target",
+            on=["key"],
+            **kwargs,
+        )
+
+    with patch.object(adapter, "fetchdf", wraps=adapter.fetchdf) as fetchdf_mock:
+        segmented = _diff(segmented=True).row_diff()
+    # One bisection pass, then the summary, column stats and sample queries
+    assert fetchdf_mock.call_count == 4
+
+    with patch.object(adapter, "fetchdf", wraps=adapter.fetchdf) as fetchdf_mock, patch(
+        "sqlmesh.core.table_diff.SEGMENT_ROW_THRESHOLD", 100
+    ):
+        assert _diff(segmented=True).row_diff().stats == segmented.stats
+    assert fetchdf_mock.call_count == 5
+
+    full = _diff().row_diff()
+    assert segmented.stats == full.stats
+    assert segmented.source_count == 30000
+    assert segmented.target_count == 30000
+    assert segmented.join_count == 29999
+    assert segmented.full_match_count == 29997
+    assert segmented.s_only_count == 1
+    assert segmented.t_only_count == 1
+    pd.testing.assert_frame_equal(segmented.column_stats, full.column_stats)
+    pd.testing.assert_frame_equal(segmented.sample, full.sample)
+
+    key_hash = _hash([exp.column("key")])
+    columns = [exp.column("value"), exp.column("name")]
+    segment_filter, matched_rows = _diff(segmented=True)._mismatched_segments(key_hash, columns, [])
+    assert isinstance(segment_filter, exp.In)
+    assert len(segment_filter.expressions) == 4
+    assert 0 < matched_rows < 29997
+
+    # A pass with too many mismatching segments is discarded along with its matched rows
+    with patch("sqlmesh.core.table_diff.MAX_MISMATCHED_SEGMENTS", 3):
+        assert _diff(segmented=True)._mismatched_segments(key_hash, columns, []) == (
+            exp.true(),
+            0,
+        )
+        assert _diff(segmented=True).row_diff().stats == full.stats
+
+    where = "s.key < 15 OR t.key < 15"
+    segmented = _diff(segmented=True, where=where).row_diff()
+    assert segmented.stats == _diff(where=where).row_diff().stats
+
+    sampled = _diff(sample_rate=0.1).row_diff()
+    assert 0 < sampled.source_count < 6000
+    # Keys are sampled from both tables alike
+    assert sampled.join_count in (sampled.source_count, sampled.source_count - 1)
+    assert sampled.stats == _diff(sample_rate=0.1).row_diff().stats
+    assert _diff(sample_rate=0.1, segmented=True).row_diff().stats == sampled.stats
+
+    with pytest.raises(SQLMeshError, match="Sample rate must be between 0 and 1"):
+        _diff(sample_rate=0)
+
+
+@pytest.mark.slow
+def test_table_diff_models(sushi_context_fixed_date):
+    context = sushi_context_fixed_date
+    plan_kwargs = dict(
+        no_prompts=True, auto_apply=True, skip_tests=True, start="2023-01-31", end="2023-01-31"
+    )
+    context.plan("source_dev", include_unmodified=True, **plan_kwargs)
+
+    for name in ("sushi.customer_revenue_by_day", "sushi.waiter_revenue_by_day"):
+        model = context.get_model(name)
+        model.query.select("1 AS z", copy=False)
+        context.upsert_model(model)
+    context.auto_categorize_changes = CategorizerConfig(sql=AutoCategorizationMode.FULL)
+    context.plan("target_dev", create_from="source_dev", **plan_kwargs)
+
+    with patch.object(context.console, "show_row_diff") as show_row_diff:
+        diffs = context.table_diff_models(source="source_dev", target="target_dev")
+
+    assert set(diffs) == {"sushi.customer_revenue_by_day", "sushi.waiter_revenue_by_day"}
+    assert show_row_diff.call_count == 2
+    for diff in diffs.values():
+        assert diff.schema_diff().added == [("z", exp.DataType.build("int"))]
+        assert diff.row_diff().full_match_pct == 100
+
+    with patch.object(context, "_model_grain", return_value=None):
+        assert not context.table_diff_models(source="source_dev", target="target_dev")
+
+    diffs = context.table_diff_models(
+        source="source_dev",
+        target="target_dev",
+        models=["sushi.customer_revenue_by_day"],
+        segmented=True,
+        show=False,
+    )
+    assert list(diffs) == ["sushi.customer_revenue_by_day"]
+    assert diffs["sushi.customer_revenue_by_day"].row_diff().full_match_pct == 100
+
+    with pytest.raises(SQLMeshError, match="Could not find environment 'missing'"):
+        context.table_diff_models(source="missing", target="target_dev")
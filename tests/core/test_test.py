@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import datetime
 import typing as t
+from io import StringIO
 from pathlib import Path
 from unittest.mock import call
 
@@ -23,6 +24,7 @@ from sqlmesh.core.dialect import parse
 from sqlmesh.core.engine_adapter import EngineAdapter
 from sqlmesh.core.macros import MacroEvaluator, macro
 from sqlmesh.core.model import Model, SqlModel, load_sql_based_model, model
+from sqlmesh.core.test import ModelTestMetadata, run_tests
 from sqlmesh.core.test.definition import ModelTest, PythonModelTest, SqlModelTest
 from sqlmesh.utils.errors import ConfigError, TestError
 from sqlmesh.utils.yaml import dump as dump_yaml
@@ -1216,6 +1218,67 @@ def test_successes(sushi_context: Context) -> None:
     assert "test_customer_revenue_by_day" in successful_tests
 
 
+def test_num_workers(sushi_context: Context) -> None:
+    def _run(num_workers: int) -> t.Tuple[TestResult, t.List[str]]:
+        stream = StringIO()
+        result = sushi_context.test(verbose=True, stream=stream, num_workers=num_workers)
+        return result, [
+            line for line in stream.getvalue().splitlines() if not line.startswith("Ran")
+        ]
+
+    serial_result, serial_output = _run(1)
+    concurrent_result, concurrent_output = _run(4)
+
+    assert concurrent_output == serial_output
+    assert concurrent_result.testsRun == serial_result.testsRun == 3
+    assert [test.test_name for test in concurrent_result.successes] == [  # type: ignore
+        test.test_name  # type: ignore
+        for test in serial_result.successes
+    ]
+
+
+def test_shared_fixtures(sushi_context: Context, mocker: MockerFixture) -> None:
+    sushi_context.upsert_model(
+        _create_model("SELECT id FROM sushi.waiter_names", default_catalog="memory")
+    )
+
+    def _test_metadata(test_name: str, waiter_id: int) -> ModelTestMetadata:
+        body = {
+            "model": "sushi.foo",
+            "inputs": {"sushi.waiter_names": [{"id": waiter_id, "name": "x"}]},
+            "outputs": {"query": [{"id": waiter_id}]},
+        }
+        return ModelTestMetadata(path=Path("test_foo.yaml"), test_name=test_name, body=body)
+
+    create_view_spy = mocker.spy(EngineAdapter, "create_view")
+    drop_view_spy = mocker.spy(EngineAdapter, "drop_view")
+    drop_schema_spy = mocker.spy(EngineAdapter, "drop_schema")
+
+    result = run_tests(
+        [_test_metadata("test_a", 1), _test_metadata("test_b", 1), _test_metadata("test_c", 2)],
+        sushi_context._models,
+        sushi_context.config,
+        dialect=sushi_context.default_dialect,
+        default_catalog=sushi_context.default_catalog,
+    )
+    _check_successful_or_raise(result)
+    assert result.testsRun == 3
+
+    test_a, test_b, test_c = t.cast(t.List[ModelTest], result.successes)
+    fixture_tables = {
+        test._test_fixture_table('"memory"."sushi"."waiter_names"').sql()
+        for test in (test_a, test_b, test_c)
+    }
+    assert len(fixture_tables) == 2
+
+    assert [call.args[1].sql() for call in create_view_spy.call_args_list] == [
+        test_a._test_fixture_table('"memory"."sushi"."waiter_names"').sql(),
+        test_c._test_fixture_table('"memory"."sushi"."waiter_names"').sql(),
+    ]
+    assert drop_view_spy.call_count == 2
+    assert drop_schema_spy.call_count == 1
+
+
 def test_create_external_model_fixture(sushi_context: Context, mocker: MockerFixture) -> None:
     mocker.patch("sqlmesh.core.test.definition.random_id", return_value="jzngz56a")
     test = _create_test(
@@ -1294,8 +1357,10 @@ def test_gateway(copy_to_temp_path: t.Callable, mocker: MockerFixture) -> None:
     result = context.test(tests=[f"{test_path}::test_customer_revenue_by_day"])
     _check_successful_or_raise(result)
 
+    test = t.cast(ModelTest, result.successes[0])
+    fixture_key = test._fixture_keys['"db"."sushi"."orders"']
     expected_view_sql = (
-        'CREATE OR REPLACE VIEW "test"."sqlmesh_test_jzngz56a"."db__sushi__orders" '
+        f'CREATE OR REPLACE VIEW "test"."sqlmesh_test_jzngz56a"."db__sushi__orders__{fixture_key}" '
         '("id", "customer_id", "waiter_id", "start_ts", "end_ts", "event_date") AS '
         "SELECT "
         'CAST("id" AS INT) AS "id", '
@@ -1309,8 +1374,7 @@ def test_gateway(copy_to_temp_path: t.Callable, mocker: MockerFixture) -> None:
         "(2, 1, 2, 1641007740, 1641009540, CAST('2022-01-01' AS DATE))) "
         'AS "t"("id", "customer_id", "waiter_id", "start_ts", "end_ts", "event_date")'
     )
-    test_adapter = t.cast(ModelTest, result.successes[0]).engine_adapter
-    assert call(test_adapter, expected_view_sql) in spy_execute.mock_calls
+    assert call(test.engine_adapter, expected_view_sql) in spy_execute.mock_calls
 
     _check_successful_or_raise(context.test())
 
@@ -587,3 +587,22 @@ def test_uncategorized(
         pr_environment_check_run[0]["output"]["summary"]
         == """<table><thead><tr><th colspan="3">PR Environment Summary</th></tr><tr><th>Model</th><th>Change Type</th><th>Dates Loaded</th></tr></thead><tbody><tr><td>a</td><td>Breaking</td><td>N/A</td></tr><tr><td>b</td><td>Uncategorized</td><td>N/A</td></tr></tbody></table>"""
     )
+
+
+def test_get_table_diff_summary(github_client, make_controller, mocker: MockerFixture):
+    controller = make_controller(
+        "tests/fixtures/github/pull_request_synchronized.json", github_client
+    )
+    table_diff_models = mocker.patch(
+        "sqlmesh.core.context.Context.table_diff_models", return_value={}
+    )
+
+    assert controller.get_table_diff_summary() == "No tables to diff."
+
+    plan = controller.prod_plan_with_gaps
+    assert table_diff_models.call_args == call(
+        source=c.PROD,
+        target=controller.pr_environment_name,
+        models=[plan.context_diff.snapshots[s_id].name for s_id in sorted(plan.directly_modified)],
+        show_sample=False,
+    )
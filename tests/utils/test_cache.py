@@ -4,7 +4,7 @@ from pytest_mock.plugin import MockerFixture
 from sqlglot import parse_one
 
 from sqlmesh.core.model import SqlModel
-from sqlmesh.core.model.cache import OptimizedQueryCache
+from sqlmesh.core.model.cache import ModelHashCache, OptimizedQueryCache
 from sqlmesh.utils.cache import FileCache
 from sqlmesh.utils.pydantic import PydanticModel
 
@@ -38,6 +38,14 @@ def test_file_cache(tmp_path: Path, mocker: MockerFixture):
 
     assert "___test_model_" in cache._cache_entry_path('"test_model"').name
 
+    cache.put("test_name", value=test_entry_a)
+    cache.put("different_name", "test_entry_b", value=test_entry_b)
+    cache.delete("test_name")
+    assert cache.get("test_name") is None
+    assert cache.get("test_name", "test_entry_a") is None
+    assert cache.get("test_name", "test_entry_b") is None
+    assert cache.get("different_name", "test_entry_b") == test_entry_b
+
 
 def test_optimized_query_cache(tmp_path: Path, mocker: MockerFixture):
     model = SqlModel(
@@ -50,3 +58,32 @@ def test_optimized_query_cache(tmp_path: Path, mocker: MockerFixture):
 
     assert not cache.with_optimized_query(model)
     assert cache.with_optimized_query(model)
+
+
+def test_model_hash_cache(tmp_path: Path, mocker: MockerFixture):
+    model = SqlModel(
+        name="test_model",
+        query=parse_one("SELECT a FROM tbl"),
+        mapping_schema={"tbl": {"a": "int"}},
+    )
+    expected_hashes = (model.data_hash, model.metadata_hash({}))
+
+    cache = ModelHashCache(tmp_path)
+
+    # Models that weren't loaded through the model cache are always hashed.
+    assert cache.get_or_compute(model, {}) == expected_hashes
+    assert not list(tmp_path.glob("model_hash/*"))
+
+    model._definition_cache_key = "test_model__entry_a"
+    assert cache.get_or_compute(model, {}) == expected_hashes
+    assert len(list(tmp_path.glob("model_hash/*"))) == 1
+
+    metadata_hash_mock = mocker.patch.object(SqlModel, "metadata_hash", return_value="new_hash")
+    assert cache.get_or_compute(model, {}) == expected_hashes
+    metadata_hash_mock.assert_not_called()
+
+    model.mapping_schema["tbl"]["b"] = "int"
+    cache.get_or_compute(model, {})
+    metadata_hash_mock.assert_called_once()
+    # The entry of the previous version of the model is replaced.
+    assert len(list(tmp_path.glob("model_hash/*"))) == 1
@@ -1,12 +1,17 @@
+import asyncio
+
 import pytest
 from pytest_mock.plugin import MockerFixture
 
 from sqlmesh.core.snapshot import SnapshotId
 from sqlmesh.utils.concurrency import (
     NodeExecutionFailedError,
+    async_apply_to_dag,
     concurrent_apply_to_snapshots,
     concurrent_apply_to_values,
+    run_coroutine,
 )
+from sqlmesh.utils.dag import DAG
 
 
 @pytest.mark.parametrize("tasks_num", [1, 2])
@@ -147,3 +152,56 @@ def test_concurrent_apply(tasks_num: int):
     values = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
     results = concurrent_apply_to_values(values, lambda x: x * 2, tasks_num)
     assert results == [x * 2 for x in values]
+
+
+def test_async_apply_to_dag():
+    dag = DAG[str]({"a": set(), "b": set(), "c": {"a", "b"}, "d": {"c"}})
+
+    in_flight = 0
+    max_in_flight = 0
+    processed = []
+
+    async def process(node: str) -> None:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        processed.append(node)
+        in_flight -= 1
+
+    errors, skipped = run_coroutine(async_apply_to_dag(dag, process, 2))
+
+    assert not errors
+    assert not skipped
+    assert set(processed[:2]) == {"a", "b"}
+    assert processed[2:] == ["c", "d"]
+    assert max_in_flight == 2
+
+
+def test_async_apply_to_dag_return_failed_skipped():
+    dag = DAG[str]({"a": set(), "b": {"a"}, "c": {"b"}, "d": set(), "e": {"d"}})
+
+    async def process(node: str) -> None:
+        if node == "a":
+            raise RuntimeError("fail")
+
+    errors, skipped = run_coroutine(async_apply_to_dag(dag, process, 2, raise_on_error=False))
+
+    assert len(errors) == 1
+    assert errors[0].node == "a"
+    assert skipped == ["b", "c"]
+
+    with pytest.raises(NodeExecutionFailedError):
+        run_coroutine(async_apply_to_dag(dag, process, 2))
+
+
+def test_run_coroutine_in_running_loop():
+    async def double(value: int) -> int:
+        await asyncio.sleep(0)
+        return value * 2
+
+    async def outer() -> int:
+        # Nested event loops are not allowed, so the coroutine runs in a separate thread.
+        return run_coroutine(double(2))
+
+    assert asyncio.run(outer()) == 4
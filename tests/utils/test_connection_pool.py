@@ -1,12 +1,17 @@
+import time
 from concurrent.futures import ThreadPoolExecutor
-from threading import get_ident
+from threading import Thread, get_ident
 
+import pytest
 from pytest_mock.plugin import MockerFixture
 
 from sqlmesh.utils.connection_pool import (
+    BoundedConnectionPool,
     SingletonConnectionPool,
     ThreadLocalConnectionPool,
+    create_connection_pool,
 )
+from sqlmesh.utils.errors import SQLMeshError
 
 
 def test_singleton_connection_pool_get(mocker: MockerFixture):
@@ -207,3 +212,174 @@ def test_thread_local_connection_pool_transaction(mocker: MockerFixture):
     assert cursor_mock_thread_one.rollback.call_count == 1
 
     assert cursor_mock_thread_two.begin.call_count == 1
+
+
+def test_bounded_connection_pool_reuse_across_threads(mocker: MockerFixture):
+    connection_factory_mock = mocker.Mock(side_effect=lambda: mocker.Mock())
+    pool = BoundedConnectionPool(connection_factory_mock, max_size=2)
+
+    def thread():
+        pool.begin()
+        connection = pool.get()
+        pool.commit()
+        return connection
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        first_connection = executor.submit(thread).result()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        second_connection = executor.submit(thread).result()
+
+    assert first_connection is second_connection
+    assert connection_factory_mock.call_count == 1
+    assert pool.size == 1
+    assert pool.idle_size == 1
+
+    pool.close_all()
+    assert pool.size == 0
+    first_connection.close.assert_called_once()
+
+
+def test_bounded_connection_pool_transaction_affinity(mocker: MockerFixture):
+    connection_factory_mock = mocker.Mock(side_effect=lambda: mocker.Mock())
+    pool = BoundedConnectionPool(connection_factory_mock, max_size=2)
+
+    pool.begin()
+    connection = pool.get()
+    assert pool.is_transaction_active
+
+    # Connections with active transactions are neither released nor recycled.
+    pool.release()
+    pool.close_all(exclude_calling_thread=True)
+    assert pool.get() is connection
+
+    def thread():
+        assert not pool.is_transaction_active
+        return pool.get()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(thread).result() is not connection
+
+    pool.rollback()
+    assert not pool.is_transaction_active
+    assert pool.idle_size == 1
+
+    pool.close_all(exclude_calling_thread=True)
+    assert pool.idle_size == 2
+    connection.cursor.return_value.rollback.assert_called_once()
+
+
+def test_bounded_connection_pool_max_size(mocker: MockerFixture):
+    connection_factory_mock = mocker.Mock(side_effect=lambda: mocker.Mock())
+    pool = BoundedConnectionPool(connection_factory_mock, max_size=1, checkout_timeout=0.1)
+
+    connection = pool.get()
+
+    def thread():
+        return pool.get()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        with pytest.raises(SQLMeshError, match="Timed out waiting for a connection"):
+            executor.submit(thread).result()
+
+    pool.release()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(thread).result() is connection
+
+    assert connection_factory_mock.call_count == 1
+
+
+def test_bounded_connection_pool_reclaims_from_dead_threads(mocker: MockerFixture):
+    connection_factory_mock = mocker.Mock(side_effect=lambda: mocker.Mock())
+    pool = BoundedConnectionPool(connection_factory_mock, max_size=1)
+
+    connections = []
+    thread = Thread(target=lambda: connections.append(pool.get()))
+    thread.start()
+    thread.join()
+
+    assert pool.idle_size == 0
+    assert pool.get() is connections[0]
+    assert connection_factory_mock.call_count == 1
+
+
+def test_bounded_connection_pool_idle_timeout(mocker: MockerFixture):
+    connection_factory_mock = mocker.Mock(side_effect=lambda: mocker.Mock())
+    pool = BoundedConnectionPool(connection_factory_mock, max_size=2, idle_timeout=0.01)
+
+    connection = pool.get()
+    pool.release()
+    time.sleep(0.02)
+
+    assert pool.get() is not connection
+    connection.close.assert_called_once()
+    assert pool.size == 1
+
+
+def test_bounded_connection_pool_health_check(mocker: MockerFixture):
+    connection_factory_mock = mocker.Mock(side_effect=lambda: mocker.Mock())
+    health_check_mock = mocker.Mock(side_effect=[Exception("connection lost"), None])
+    pool = BoundedConnectionPool(
+        connection_factory_mock, max_size=2, health_check=health_check_mock
+    )
+
+    connection = pool.get()
+    health_check_mock.assert_not_called()
+    pool.release()
+
+    new_connection = pool.get()
+    assert new_connection is not connection
+    connection.close.assert_called_once()
+    health_check_mock.assert_called_once()
+
+    pool.release()
+    assert pool.get() is new_connection
+    assert health_check_mock.call_count == 2
+    assert pool.size == 1
+
+
+def test_bounded_connection_pool_attributes_follow_connection(mocker: MockerFixture):
+    cursor_init_mock = mocker.Mock()
+    pool = BoundedConnectionPool(
+        mocker.Mock(side_effect=lambda: mocker.Mock()), max_size=2, cursor_init=cursor_init_mock
+    )
+
+    cursor = pool.get_cursor()
+    pool.set_attribute("catalog", "foo")
+    pool.release()
+
+    def thread():
+        return pool.get_cursor(), pool.get_attribute("catalog")
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(thread).result() == (cursor, "foo")
+
+    cursor_init_mock.assert_called_once_with(cursor)
+
+
+def test_create_connection_pool(mocker: MockerFixture):
+    connection_factory_mock = mocker.Mock()
+
+    assert isinstance(
+        create_connection_pool(connection_factory_mock, multithreaded=True, max_size=4),
+        BoundedConnectionPool,
+    )
+    assert isinstance(
+        create_connection_pool(connection_factory_mock, multithreaded=True),
+        ThreadLocalConnectionPool,
+    )
+    assert isinstance(
+        create_connection_pool(connection_factory_mock, multithreaded=False, max_size=4),
+        SingletonConnectionPool,
+    )
+
+
+def test_create_bounded_connection_pool_checkout_timeout(mocker: MockerFixture):
+    pool = create_connection_pool(
+        mocker.Mock(), multithreaded=True, max_size=1, checkout_timeout=0.1
+    )
+    pool.get()
+
+    with ThreadPoolExecutor() as executor:
+        with pytest.raises(SQLMeshError, match="Timed out waiting for a connection"):
+            executor.submit(pool.get).result()
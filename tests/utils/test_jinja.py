@@ -110,6 +110,31 @@ def test_macro_registry_render_different_vars():
     assert rendered == "test_b"
 
 
+def test_macro_registry_build_environment_reuses_compiled_templates():
+    macros = "{% macro macro_a() %}{{ external }}{% endmacro %}"
+
+    extractor = MacroExtractor()
+    registry_a = JinjaMacroRegistry()
+    registry_a.add_macros(extractor.extract(macros))
+    registry_b = JinjaMacroRegistry()
+    registry_b.add_macros(extractor.extract(macros))
+
+    env_a = registry_a.build_environment(external="a")
+    env_b = registry_b.build_environment(external="b")
+
+    assert env_a.from_string("{{ macro_a() }}").render() == "a"
+    assert env_b.from_string("{{ macro_a() }}").render() == "b"
+
+    # Compiled macros and templates are shared, but globals aren't.
+    assert registry_a._parse_macro("macro_a", None) is registry_b._parse_macro("macro_a", None)
+    assert env_a.compile("{{ macro_a() }}") is env_b.compile("{{ macro_a() }}")
+    assert env_a.globals["external"] == "a"
+    assert "external" not in registry_a._environment.globals
+
+    env_a.globals["external"] = "c"
+    assert env_b.from_string("{{ macro_a() }}").render() == "b"
+
+
 def test_macro_registry_trim():
     package_a = """
 {% macro macro_a_a() %}macro_a_a{% endmacro %}
@@ -245,3 +245,55 @@ class DataClass:
     return X + a""",
         ),
     }
+
+
+def test_prepare_env_isolates_mutable_globals() -> None:
+    python_env = {
+        "CALLS": Executable(payload="[]", kind=ExecutableKind.VALUE),
+        "track": Executable(
+            name="track",
+            payload="""def track(x):
+    CALLS.append(x)
+    return len(CALLS)""",
+        ),
+    }
+
+    env_a = prepare_env(python_env)
+    env_b = prepare_env(python_env)
+
+    assert env_a["track"](1) == 1
+    assert env_a["track"](2) == 2
+    assert env_b["track"](3) == 1
+    assert env_a["CALLS"] == [1, 2]
+    assert env_b["CALLS"] == [3]
+    assert env_a["track"].__code__ is env_b["track"].__code__
+    assert env_a["track"].__globals__ is env_a
+    assert prepare_env(python_env)["CALLS"] == []
+
+
+def test_compiled_env_cache() -> None:
+    from sqlmesh.utils.metaprogramming import _CompiledEnvCache
+
+    cache = _CompiledEnvCache(max_size=60)
+
+    def python_env(value: int) -> t.Dict[str, Executable]:
+        return {
+            "func": Executable(name="func", payload=f"def func():\n    return {value}"),
+        }
+
+    compiled = cache.get_or_compile(python_env(1))
+    assert cache.get_or_compile(python_env(1)) is compiled
+    assert len(cache) == 1
+
+    cache.get_or_compile(python_env(2))
+    assert len(cache) == 2
+
+    # Touching the first env makes the second one the least recently used entry.
+    cache.get_or_compile(python_env(1))
+    cache.get_or_compile(python_env(3))
+    assert len(cache) == 2
+    assert cache.get_or_compile(python_env(1)) is compiled
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.get_or_compile(python_env(1)) is not compiled